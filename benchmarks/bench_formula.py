@@ -0,0 +1,58 @@
+"""Benchmark formula evaluation
+
+It evaluates a 3-clause formula for every row using simpleeval
+(parsing the formula for every row as the steps used to) and using
+a compiled formula (see helpers.compile_formula).
+
+    python benchmarks/bench_formula.py --rows 10000000
+"""
+
+import argparse
+import time
+
+import simpleeval  # type: ignore
+
+from frictionless import helpers, platform
+
+FORMULA = "population > 50 and name != 'spain' and id < 100"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=10000000)
+    args = parser.parse_args()
+
+    # Simpleeval
+    start = time.perf_counter()
+    expected = 0
+    for row in create_rows(args.rows):
+        if simpleeval.EvalWithCompoundTypes(names=row).eval(FORMULA):
+            expected += 1
+    simpleeval_time = time.perf_counter() - start
+
+    # Compiled
+    start = time.perf_counter()
+    formula = helpers.compile_formula(FORMULA)
+    actual = 0
+    for row in create_rows(args.rows):
+        if formula(row):
+            actual += 1
+    compiled_time = time.perf_counter() - start
+
+    assert actual == expected
+    print(f"formula: {FORMULA} ({args.rows} rows, {actual} matched)")
+    print(f"simpleeval: {simpleeval_time:.2f}s")
+    print(f"compiled: {compiled_time:.2f}s")
+    print(f"speedup: {simpleeval_time / compiled_time:.1f}x")
+
+
+# Rows are petl records as they are passed to the formulas by the steps
+def create_rows(count: int):
+    header = ("id", "name", "population")
+    for index in range(count):
+        name = "spain" if index % 3 else "france"
+        yield platform.petl.Record((index % 200, name, index % 97), header)
+
+
+if __name__ == "__main__":
+    main()
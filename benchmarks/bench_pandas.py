@@ -0,0 +1,57 @@
+"""Benchmark the pandas format on wide dataframes
+
+It reports rows per second for reading a dataframe into frictionless cells
+and for a round trip (reading a dataframe and writing it back to a new one).
+
+    python benchmarks/bench_pandas.py --rows 2000 --columns 500
+"""
+
+import argparse
+import time
+
+from frictionless import Resource, platform
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=500)
+    args = parser.parse_args()
+
+    # Frame
+    # Integer, number and string columns (every tenth cell is missing)
+    pd = platform.pandas
+    np = platform.numpy
+    data = {}
+    for index in range(args.columns):
+        values = np.arange(args.rows)
+        if index % 3 == 0:
+            data[f"integer{index}"] = values
+        elif index % 3 == 1:
+            data[f"number{index}"] = np.where(values % 10, values / 7, np.nan)
+        else:
+            data[f"string{index}"] = [
+                f"v{value}" if value % 10 else None for value in values
+            ]
+    df = pd.DataFrame(data)
+
+    # Read
+    start = time.perf_counter()
+    resource = Resource(df)
+    cells = resource.read_cells()
+    read_time = time.perf_counter() - start
+    assert len(cells) == args.rows + 1
+
+    # Round trip
+    start = time.perf_counter()
+    target = Resource(df).to_pandas()
+    roundtrip_time = time.perf_counter() - start
+    assert target.shape == df.shape
+
+    print(f"frame: {args.rows} rows x {args.columns} columns")
+    print(f"read: {read_time:.2f}s ({args.rows / read_time:.0f} rows/s)")
+    print(f"round trip: {roundtrip_time:.2f}s ({args.rows / roundtrip_time:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark memory used by rows read into memory
+
+It reports bytes per row allocated by `resource.read_rows()` for the default
+and compact rows both right after reading and after accessing all the cells
+(rows process their cells lazily) as it's traced by `tracemalloc`.
+
+    python benchmarks/bench_rows.py --rows 100000 --columns 10
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+
+from frictionless import Resource
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--columns", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as basepath:
+        # Table
+        # Integer, number and string columns (every tenth cell is missing)
+        with open(os.path.join(basepath, "table.csv"), "w") as file:
+            file.write(",".join(f"field{index}" for index in range(args.columns)))
+            file.write("\n")
+            for number in range(args.rows):
+                cells = []
+                for index in range(args.columns):
+                    if number % 10 == index % 10:
+                        cells.append("")
+                    elif index % 3 == 0:
+                        cells.append(str(number))
+                    elif index % 3 == 1:
+                        cells.append(str(number / 7))
+                    else:
+                        cells.append(f"value{number}")
+                file.write(",".join(cells))
+                file.write("\n")
+
+        print(f"table: {args.rows} rows x {args.columns} columns")
+        for compact in [False, True]:
+            with Resource("table.csv", basepath=basepath) as resource:
+                # Read
+                tracemalloc.start()
+                start = time.perf_counter()
+                rows = resource.read_rows(compact=compact)
+                read_time = time.perf_counter() - start
+                read_size = tracemalloc.get_traced_memory()[0]
+                assert len(rows) == args.rows
+
+                # Access
+                for row in rows:
+                    row.to_list()
+                access_size = tracemalloc.get_traced_memory()[0]
+                tracemalloc.stop()
+
+            name = "compact" if compact else "default"
+            print(
+                f"{name}: {read_time:.2f}s, "
+                f"read {read_size / args.rows:.0f} bytes/row, "
+                f"accessed {access_size / args.rows:.0f} bytes/row"
+            )
+            del rows
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark a 10-step transform pipeline
+
+It compares the default mode, where every step re-reads the output of the
+previous one as an inline resource (petl chain), with the streaming mode,
+where the source is parsed once and row steps are fused into a single pass.
+
+    python benchmarks/bench_transform.py --rows 100000 [--formula]
+"""
+
+import argparse
+import csv
+import os
+import tempfile
+import time
+
+from frictionless import Pipeline, Resource, steps
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--formula", action="store_true", help="use formula steps")
+    args = parser.parse_args()
+
+    # Source
+    with tempfile.TemporaryDirectory() as dir:
+        path = os.path.join(dir, "table.csv")
+        with open(path, "w", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(["id", "name", "country", "population", "note"])
+            for index in range(args.rows):
+                name = f"city{index}"
+                writer.writerow([index, name, index % 50, index % 1000, "note"])
+
+        # Pipeline
+        pipeline = Pipeline(steps=create_steps(formula=args.formula))
+
+        # Benchmark
+        results = {}
+        for streaming in [False, True]:
+            start = time.perf_counter()
+            target = Resource(path="table.csv", basepath=dir).transform(
+                pipeline, streaming=streaming
+            )
+            rows = target.read_cells()
+            elapsed = time.perf_counter() - start
+            results[streaming] = [list(cells) for cells in rows]
+            mode = "streaming" if streaming else "petl chain"
+            print(f"{mode}: {elapsed:.2f}s ({len(rows) - 1} rows)")
+        assert results[False] == results[True]
+
+
+def create_steps(*, formula: bool):
+    if formula:
+        add_steps = [
+            steps.field_add(
+                name="double", descriptor={"type": "integer"}, formula="population * 2"
+            ),
+            steps.field_add(
+                name="large", descriptor={"type": "boolean"}, formula="population > 500"
+            ),
+        ]
+        filter_step = steps.row_filter(formula="country < 40")
+        last_step = steps.row_filter(formula="double > 100")
+    else:
+        add_steps = [
+            steps.field_add(
+                name="double",
+                descriptor={"type": "integer"},
+                function=lambda row: row["population"] * 2,
+            ),
+            steps.field_add(
+                name="large",
+                descriptor={"type": "boolean"},
+                function=lambda row: row["population"] > 500,
+            ),
+        ]
+        filter_step = steps.row_filter(function=lambda row: row["country"] < 40)
+        last_step = steps.row_filter(function=lambda row: row["double"] > 100)
+    return [
+        steps.table_normalize(),
+        steps.cell_set(field_name="note", value="checked"),
+        *add_steps,
+        steps.cell_convert(field_name="name", function=str.upper),
+        filter_step,
+        steps.field_move(name="large", position=1),
+        steps.cell_format(field_name="name", template="City {0}"),
+        steps.field_remove(names=["note"]),
+        last_step,
+    ]
+
+
+if __name__ == "__main__":
+    main()
@@ -36,6 +36,7 @@ from .system import Parser as Parser
 from .system import Plugin as Plugin
 from .system import System as System
 from .system import system as system
+from .table import Batch as Batch
 from .table import Header as Header
 from .table import Lookup as Lookup
 from .table import Row as Row
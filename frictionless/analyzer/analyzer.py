@@ -134,10 +134,10 @@ class Analyzer:
                 resource.stats.bytes / resource.stats.rows
             )  # type: ignore
         analysis_report["timeTaken"] = timer.time
-        return {
-            **analysis_report,
-            **attrs.asdict(resource.stats, filter=lambda _, v: v is not None),
-        }
+        # The opening time is covered by "timeTaken"
+        stats = attrs.asdict(resource.stats, filter=lambda _, v: v is not None)
+        stats.pop("seconds", None)
+        return {**analysis_report, **stats}
 
 
 # Internal
@@ -38,6 +38,6 @@ class duplicate_row(Check):
         hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
         match = self.__memory.get(hash)
         if match:
-            note = 'the same as row at position "%s"' % match
+            note = errors.DuplicateRowError.match_note % match
             yield errors.DuplicateRowError.from_row(row, note=note)
         self.__memory[hash] = row.row_number
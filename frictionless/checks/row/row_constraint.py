@@ -3,9 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import attrs
-import simpleeval  # type: ignore
 
-from ... import errors
+from ... import errors, helpers
 from ...checklist import Check
 
 if TYPE_CHECKING:
@@ -31,9 +30,8 @@ class row_constraint(Check):
         try:
             # This call should be considered as a safe expression evaluation
             # https://github.com/danthedeckie/simpleeval
-            # NOTE: review EvalWithCompoundTypes/sync with steps
-            evalclass = simpleeval.EvalWithCompoundTypes  # type: ignore
-            assert evalclass(names=row).eval(self.formula)  # type: ignore
+            # The formula is compiled once and cached (see helpers.Formula)
+            assert helpers.compile_formula(self.formula)(row)
         except Exception:
             yield errors.RowConstraintError.from_row(
                 row,
@@ -1,4 +1,8 @@
 import os
+import re
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 import sqlalchemy as sa
@@ -89,6 +93,41 @@ def mysql_url_data(mysql_url):
     yield postgresql_url
 
 
+@pytest.fixture
+def http_server():
+    class Handler(SimpleHTTPRequestHandler):
+        def log_message(self, *args):  # type: ignore
+            pass
+
+        def end_headers(self):
+            self.send_header("Accept-Ranges", "bytes")
+            super().end_headers()
+
+        def do_GET(self):
+            # Serve "Range: bytes=start-[end]" requests
+            match = re.fullmatch(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+            path = self.translate_path(self.path)
+            if not match or not os.path.isfile(path):
+                return super().do_GET()
+            with open(path, "rb") as file:
+                data = file.read()
+            start = int(match.group(1))
+            end = int(match.group(2)) + 1 if match.group(2) else len(data)
+            self.send_response(206)
+            self.send_header("Content-Length", str(len(data[start:end])))
+            self.send_header("Content-Range", f"bytes {start}-{end - 1}/{len(data)}")
+            self.end_headers()
+            self.wfile.write(data[start:end])
+
+    handler = partial(Handler, directory="data")
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield "http://127.0.0.1:%s/%%s" % server.server_address[1]
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def google_credentials_path():
     path = os.environ.get("GOOGLE_CREDENTIALS_PATH")
@@ -149,6 +149,7 @@ def console_describe(
         view.add_column("bytes")
         view.add_column("fields")
         view.add_column("rows")
+        view.add_column("seconds")
     for resource in resources:
         style = "sky_blue1" if resource.tabular else ""
         row = [resource.name, resource.type, resource.path]
@@ -157,6 +158,8 @@ def console_describe(
             row.append(str(resource.bytes))
             row.append(str(resource.fields or ""))
             row.append(str(resource.rows or ""))
+            seconds = resource.stats.seconds
+            row.append(str(seconds) if seconds is not None else "")
         view.add_row(*row, style=style)
     console.print(view)
     console.rule("[bold]Tables")
@@ -63,6 +63,25 @@ def test_schema_from_sample_confidence_full():
     }
 
 
+def test_schema_from_sample_early_stop():
+    labels = ["id", "age", "name"]
+    sample = [
+        ["1", "39", "Paul"],
+        ["2", "23", "Jimmy"],
+        ["3", "36", "Jane"],
+        ["4", "N/A", "Judy"],
+    ]
+    detector = Detector(field_early_stop=3)
+    schema = detector.detect_schema(sample, labels=labels)
+    assert schema.to_descriptor() == {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "age", "type": "integer"},
+            {"name": "name", "type": "string"},
+        ],
+    }
+
+
 def test_schema_from_sparse_sample():
     labels = ["id", "age", "name"]
     sample = [
@@ -142,6 +161,13 @@ def test_detector_set_field_confidence():
     assert detector.field_confidence == 0.9
 
 
+def test_detector_set_field_early_stop():
+    detector = Detector(field_early_stop=1000)
+    assert detector.field_early_stop == 1000
+    detector.field_early_stop = None
+    assert detector.field_early_stop is None
+
+
 def test_detector_set_field_float_numbers():
     detector = Detector(field_float_numbers=True)
     assert detector.field_float_numbers is True
@@ -3,7 +3,7 @@ from __future__ import annotations
 import codecs
 import os
 from copy import copy, deepcopy
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
 
 import attrs
 
@@ -73,6 +73,13 @@ class Detector:
     It defaults to 0.9
     """
 
+    field_early_stop: Optional[int] = None
+    """
+    Stop inferring a field type after reading this number of non-missing cells
+    if the first remaining field candidate has no failures. By default, the
+    whole sample is used. It makes big sample sizes affordable.
+    """
+
     field_float_numbers: bool = settings.DEFAULT_FLOAT_NUMBERS
     """
     Flag to indicate desired number type.
@@ -350,7 +357,7 @@ class Detector:
                 return schema
 
             # Prepare runners
-            runners: List[List[Any]] = []
+            # Cell readers are created once as creating them is costly
             runner_fields: List[Field] = []  # we use shared fields
             for candidate in field_candidates:
                 descriptor = candidate.copy()
@@ -364,38 +371,57 @@ class Detector:
                     if self.field_false_values != settings.DEFAULT_FALSE_VALUES:
                         field.false_values = self.field_false_values  # type: ignore
                 runner_fields.append(field)
-            for index, name in enumerate(names):
-                runners.append([])
-                for field in runner_fields:
-                    runners[index].append({"field": field, "score": 0})
+            runner_readers = [field.create_cell_reader() for field in runner_fields]
 
             # Infer fields
-            fields = [None] * len(names)
-            max_score = [len(fragment)] * len(names)
+            # We process the fragment column by column to stop as soon as possible
+            fields: List[Optional[Field]] = [None] * len(names)
             threshold = len(fragment) * (self.field_confidence - 1)
-            for cells in fragment:
-                for index, name in enumerate(names):
-                    if fields[index] is not None:
-                        continue
+            for index, name in enumerate(names):
+                scores = [0] * len(runner_fields)
+                results: List[Dict[str, bool]] = [{} for _ in runner_fields]
+                max_score = len(fragment)
+                count = 0
+                for cells in fragment:
                     source = cells[index] if len(cells) > index else None
                     is_field_missing_value = source in self.field_missing_values
                     if is_field_missing_value:
-                        max_score[index] -= 1
-                    for runner in runners[index]:
-                        if runner["score"] < threshold:
+                        max_score -= 1
+                    else:
+                        count += 1
+                    for number, runner_field in enumerate(runner_fields):
+                        if scores[number] < threshold:
                             continue
                         if not is_field_missing_value:
-                            _, notes = runner["field"].read_cell(source)
-                            runner["score"] += 1 if not notes else -1
-                        if max_score[index] > 0 and runner["score"] >= (
-                            max_score[index] * self.field_confidence
+                            valid = read_cell_validity(
+                                runner_readers[number], source, results=results[number]
+                            )
+                            scores[number] += 1 if valid else -1
+                        if max_score > 0 and scores[number] >= (
+                            max_score * self.field_confidence
                         ):
-                            field = runner["field"].to_copy()
-                            field.name = name
-                            field.schema = schema
-                            fields[index] = field
+                            fields[index] = runner_field
+                            break
+                    if fields[index] is not None:
+                        break
+
+                    # Early stop
+                    if self.field_early_stop and count >= self.field_early_stop:
+                        for number, runner_field in enumerate(runner_fields):
+                            if scores[number] >= threshold:
+                                if scores[number] == count:
+                                    fields[index] = runner_field
+                                break
+                        if fields[index] is not None:
                             break
 
+                # Create field
+                if fields[index] is not None:
+                    field = fields[index].to_copy()  # type: ignore
+                    field.name = name
+                    field.schema = schema
+                    fields[index] = field
+
             # Fill/set fields
             # For not inferred fields we use the "any" type field as a default
             for index, name in enumerate(names):
@@ -497,3 +523,20 @@ class Detector:
         else:
             lower_primary_key = [pk.lower() for pk in schema.primary_key]
             return field.required or field.name.lower() in lower_primary_key
+
+
+# Internal
+
+
+def read_cell_validity(
+    reader: Callable[[Any], Any], source: Any, *, results: Dict[str, bool]
+) -> bool:
+    # Text cells are memoized as samples usually have repeated values
+    if isinstance(source, str):
+        valid = results.get(source)
+        if valid is None:
+            _, notes = reader(source)
+            valid = results[source] = not notes
+        return valid
+    _, notes = reader(source)
+    return not notes
@@ -113,6 +113,7 @@ class UniqueError(CellError):
     title = "Unique Error"
     description = "This field is a unique field but it contains a value that has been used in another row."
     template = 'Row at position "{rowNumber}" has unique constraint violation in field "{fieldName}" at position "{fieldNumber}": {note}'
+    match_note = "the same as in the row at position %s"
 
 
 class TruncatedValueError(CellError):
@@ -69,6 +69,7 @@ class PrimaryKeyError(RowError):
     title = "PrimaryKey Error"
     description = "Values in the primary key fields should be unique for every row"
     template = 'Row at position "{rowNumber}" violates the primary key: {note}'
+    match_note = "the same as in the row at position %s"
 
 
 @attrs.define(kw_only=True)
@@ -138,6 +139,7 @@ class DuplicateRowError(RowError):
     title = "Duplicate Row"
     description = "The row is duplicated."
     template = "Row at position {rowNumber} is duplicated: {note}"
+    match_note = 'the same as row at position "%s"'
 
 
 class RowConstraintError(RowError):
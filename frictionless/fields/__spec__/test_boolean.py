@@ -85,6 +85,16 @@ def test_boolean_from_schema_descriptor_with_valid_example_fix_issue_1610(
     assert cell == target
 
 
+def test_boolean_read_column():
+    field = Field.from_descriptor(
+        {"name": "name", "type": "boolean", "trueValues": ["yes"], "falseValues": ["no"]}
+    )
+    values, notes = field.read_column(["yes", "no", "true", True, ""])
+    assert values == [True, False, None, True, None]
+    assert notes[:2] == [None, None]
+    assert notes[2] == {"type": 'type is "boolean/default"'}
+
+
 def test_boolean_from_schema_descriptor_with_invalid_example_fix_issue_1610():
     schema_descriptor = {
         "$schema": "https://frictionlessdata.io/schemas/table-schema.json",
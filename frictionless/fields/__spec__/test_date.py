@@ -47,3 +47,14 @@ def test_date_read_cell(format, source, target, recwarn):
     assert cell == target
     if not format.startswith("fmt:"):
         assert recwarn.list == []
+
+
+# Column
+
+
+def test_date_read_column():
+    field = Field.from_descriptor({"name": "name", "type": "date"})
+    column = ["2019-01-01", "0000-01-01", "2019-02-30", "10th Jan 1969", ""]
+    values, notes = field.read_column(column)
+    assert values == [date(2019, 1, 1), None, None, None, None]
+    assert notes == [field.read_cell(cell)[1] for cell in column]
@@ -61,3 +61,19 @@ def test_datetime_read_cell(format, source, target, recwarn):
     assert cell == target
     if not format.startswith("fmt:"):
         assert recwarn.list == []
+
+
+# Column
+
+
+def test_datetime_read_column():
+    field = Field.from_descriptor({"name": "name", "type": "datetime"})
+    column = ["2014-01-01T06:00:00", "2014-01-01T06:00:00Z", "2014-01-01", ""]
+    values, notes = field.read_column(column)
+    assert values == [
+        datetime(2014, 1, 1, 6),
+        datetime(2014, 1, 1, 6, tzinfo=tz.tzutc()),
+        None,
+        None,
+    ]
+    assert notes == [field.read_cell(cell)[1] for cell in column]
@@ -43,3 +43,22 @@ def test_integer_read_cell(format, source, target, options):
     field = Field.from_descriptor(descriptor)
     cell, notes = field.read_cell(source)
     assert cell == target
+
+
+# Column
+
+
+def test_integer_read_column():
+    field = Field.from_descriptor({"name": "name", "type": "integer"})
+    column = ["1", " -2 ", "+3", "000835", "--4", "3.14", "", "a", 5, None]
+    values, notes = field.read_column(column)
+    assert values == [1, -2, 3, 835, None, None, None, None, 5, None]
+    assert notes == [field.read_cell(cell)[1] for cell in column]
+
+
+def test_integer_read_column_fast_path():
+    field = Field.from_descriptor({"name": "name", "type": "integer"})
+    column_value_reader = field.create_column_value_reader()
+    values, mask = column_value_reader(["1", "-2", "1_000", "12345678901234567890"])
+    assert values == [1, -2, None, None]
+    assert mask == [False, False, True, True]
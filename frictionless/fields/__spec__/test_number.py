@@ -110,6 +110,33 @@ def test_number_read_cell(format, source, target, options):
     assert cell == target
 
 
+# Column
+
+
+@pytest.mark.parametrize(
+    "options, target",
+    [
+        ({}, [Decimal(1), Decimal("-2.5"), Decimal("0.5"), Decimal("1E+5"), None]),
+        ({"floatNumber": True}, [1.0, -2.5, 0.5, 100000.0, None]),
+    ],
+)
+def test_number_read_column(options, target):
+    descriptor = {"name": "name", "type": "number"}
+    descriptor.update(options)
+    field = Field.from_descriptor(descriptor)
+    column = ["1", " -2.5 ", ".5", "1e5", "1.2.3"]
+    values, notes = field.read_column(column)
+    assert values == target
+    assert notes == [field.read_cell(cell)[1] for cell in column]
+
+
+def test_number_read_column_group_char():
+    field = fields.NumberField(name="name", decimal_char=",", group_char=".")
+    values, notes = field.read_column(["8.699,8", "1,5", "1.5"])
+    assert values == [Decimal("8699.8"), Decimal("1.5"), Decimal("15")]
+    assert notes == [None, None, None]
+
+
 # Bugs
 
 
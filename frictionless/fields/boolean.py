@@ -5,6 +5,7 @@ from typing import Any, Dict, List
 import attrs
 
 from .. import settings
+from ..platform import platform
 from ..schema import Field
 
 
@@ -48,6 +49,20 @@ class BooleanField(Field):
 
         return value_reader
 
+    def create_column_value_reader(self):
+        np = platform.numpy
+
+        # Create reader
+        def column_value_reader(column: List[str]):
+            cells = np.array(column, dtype=str)
+            is_true = np.isin(cells, self.true_values)
+            is_false = np.isin(cells, self.false_values)
+            values = (is_true & ~is_false).tolist()
+            mask = ~(is_true | is_false)
+            return values, mask.tolist()
+
+        return column_value_reader
+
     # Write
 
     def create_value_writer(self):
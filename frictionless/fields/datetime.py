@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, List
 
 import attrs
 
@@ -46,6 +46,39 @@ class DatetimeField(Field):
 
         return value_reader
 
+    def create_column_value_reader(self):
+        np = platform.numpy
+
+        # Only the default format is supported
+        if self.format != "default":
+            return None
+
+        # Create reader
+        # Fast path: naive "YYYY-MM-DDTHH:MM:SS" strings are parsed as "datetime64"
+        def column_value_reader(column: List[str]):
+            cells = np.array(column, dtype=str)
+            mask = np.char.str_len(cells) != 19
+            chars = cells.astype("U19").view("U1").reshape(-1, 19)
+            mask |= (chars[:, 4] != "-") | (chars[:, 7] != "-") | (chars[:, 10] != "T")
+            mask |= (chars[:, 13] != ":") | (chars[:, 16] != ":")
+            digits = chars[:, [0, 1, 2, 3, 5, 6, 8, 9, 11, 12, 14, 15, 17, 18]]
+            mask |= ~np.isin(digits, list("0123456789")).all(axis=1)
+            values: List[Any] = [None] * len(column)
+            valid = np.flatnonzero(~mask)
+            try:
+                result = cells[valid].astype("datetime64[s]").tolist()
+            except ValueError:
+                # Invalid calendar dates are handled by the cell reader
+                return values, [True] * len(column)
+            for index, value in zip(valid, result):
+                if isinstance(value, datetime):
+                    values[index] = value
+                else:
+                    mask[index] = True
+            return values, mask.tolist()
+
+        return column_value_reader
+
     # Write
 
     def create_value_writer(self):
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import Any
+from typing import Any, List
 
 import attrs
 
 from .. import settings
+from ..platform import platform
 from ..schema import Field
 
 
@@ -63,6 +64,29 @@ class IntegerField(Field):
 
         return value_reader
 
+    def create_column_value_reader(self):
+        np = platform.numpy
+
+        # Only bare numbers are supported
+        if not self.bare_number:
+            return None
+
+        # Create reader
+        # Fast path: an optional sign followed by up to 18 ASCII digits (int64)
+        def column_value_reader(column: List[str]):
+            cells = np.char.strip(np.array(column, dtype=str))
+            digits = np.char.lstrip(cells, "+-")
+            length = np.char.str_len(digits)
+            mask = (np.char.str_len(cells) - length > 1) | (length < 1) | (length > 18)
+            mask |= np.char.strip(digits, "0123456789") != ""
+            values: List[Any] = [None] * len(column)
+            valid = np.flatnonzero(~mask)
+            for index, value in zip(valid, cells[valid].astype(np.int64).tolist()):
+                values[index] = value
+            return values, mask.tolist()
+
+        return column_value_reader
+
     # Write
 
     def create_value_writer(self):
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import re
 from decimal import Decimal
-from typing import Any
+from typing import Any, List
 
 import attrs
 
 from .. import settings
+from ..platform import platform
 from ..schema import Field
 
 
@@ -102,6 +103,42 @@ class NumberField(Field):
 
         return value_reader
 
+    def create_column_value_reader(self):
+        np = platform.numpy
+
+        # Only bare numbers are supported
+        if not self.bare_number:
+            return None
+
+        # Create reader
+        # Fast path: an optional sign followed by ASCII digits with an optional
+        # decimal point; float numbers are parsed by NumPy and decimals are
+        # created directly from the cleaned strings skipping the cell reader
+        def column_value_reader(column: List[str]):
+            cells = np.char.strip(np.array(column, dtype=str))
+            mask = np.zeros(len(column), dtype=bool)
+            if self.group_char:
+                cells = np.char.replace(cells, self.group_char, "")
+            if self.decimal_char != ".":
+                mask |= np.char.find(cells, ".") != -1
+                cells = np.char.replace(cells, self.decimal_char, ".")
+            unsigned = np.char.lstrip(cells, "+-")
+            digits = np.char.replace(unsigned, ".", "", count=1)
+            length = np.char.str_len(digits)
+            mask |= np.char.str_len(cells) - np.char.str_len(unsigned) > 1
+            mask |= (length < 1) | (np.char.strip(digits, "0123456789") != "")
+            values: List[Any] = [None] * len(column)
+            valid = np.flatnonzero(~mask)
+            if self.float_number:
+                result = cells[valid].astype(np.float64).tolist()
+            else:
+                result = list(map(Decimal, cells[valid].tolist()))
+            for index, value in zip(valid, result):
+                values[index] = value
+            return values, mask.tolist()
+
+        return column_value_reader
+
     # Write
 
     # TODO: optimize
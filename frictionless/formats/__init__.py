@@ -1,3 +1,4 @@
+from .arrow import *
 from .csv import *
 from .erd import *
 from .excel import *
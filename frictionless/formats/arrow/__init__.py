@@ -0,0 +1,4 @@
+from .control import ArrowControl as ArrowControl
+from .mapper import ArrowMapper as ArrowMapper
+from .parser import ArrowParser as ArrowParser
+from .plugin import ArrowPlugin as ArrowPlugin
@@ -0,0 +1,106 @@
+import datetime
+
+import pyarrow as pa
+import pyarrow.feather as feather
+import pytest
+
+from frictionless import formats, validate
+from frictionless.resources import TableResource
+
+# Read
+
+
+def test_arrow_parser(tmpdir):
+    path = str(tmpdir.join("table.arrow"))
+    table = pa.table(
+        {
+            "id": pa.array([1, 2], type=pa.int32()),
+            "name": pa.array(["english", "中国人"]).dictionary_encode(),
+            "datetime": pa.array(
+                [datetime.datetime(2020, 1, 1, 15), None],
+                type=pa.timestamp("ms", tz="UTC"),
+            ),
+        },
+        schema=pa.schema(
+            [
+                pa.field("id", pa.int32(), nullable=False),
+                pa.field("name", pa.dictionary(pa.int32(), pa.string())),
+                pa.field("datetime", pa.timestamp("ms", tz="UTC")),
+            ]
+        ),
+    )
+    feather.write_feather(table, path)
+    with TableResource(path=path) as resource:
+        assert resource.format == "arrow"
+        assert resource.schema.to_descriptor() == {
+            "fields": [
+                {"name": "id", "type": "integer", "constraints": {"required": True}},
+                {"name": "name", "type": "string"},
+                {"name": "datetime", "type": "datetime"},
+            ]
+        }
+        assert resource.read_rows() == [
+            {
+                "id": 1,
+                "name": "english",
+                "datetime": datetime.datetime(
+                    2020, 1, 1, 15, tzinfo=datetime.timezone.utc
+                ),
+            },
+            {"id": 2, "name": "中国人", "datetime": None},
+        ]
+
+
+def test_arrow_parser_columns(tmpdir):
+    path = str(tmpdir.join("table.feather"))
+    feather.write_feather(pa.table({"id": [1, 2], "name": ["a", "b"]}), path)
+    control = formats.ArrowControl(columns=["name"])
+    with TableResource(path=path, control=control) as resource:
+        assert resource.header == ["name"]
+        assert resource.read_rows() == [{"name": "a"}, {"name": "b"}]
+
+
+# Write
+
+
+@pytest.mark.parametrize("format", ["arrow", "feather", "arrows"])
+def test_arrow_parser_write(tmpdir, format):
+    source = TableResource(path="data/table.csv")
+    target = TableResource(path=str(tmpdir.join(f"table.{format}")))
+    source.write(target)
+    with target:
+        assert target.format == format
+        assert target.header == ["id", "name"]
+        assert target.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+def test_arrow_parser_write_batch_size_and_compression(tmpdir):
+    path = str(tmpdir.join("table.arrow"))
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(10)]
+    control = formats.ArrowControl(batch_size=3, compression="zstd")
+    TableResource(data=data).write(path, control=control)
+    with pa.memory_map(path) as source:
+        assert pa.ipc.open_file(source).num_record_batches == 4
+    with TableResource(path=path) as resource:
+        assert [row.to_list() for row in resource.read_rows()] == data[1:]
+
+
+def test_arrow_parser_write_timezone(tmpdir):
+    source = TableResource(path="data/timezone.csv")
+    target = TableResource(path=str(tmpdir.join("table.arrow")))
+    source.write(target)
+    with target:
+        assert target.read_rows()[0].to_dict() == {
+            "datetime": datetime.datetime(2020, 1, 1, 15, tzinfo=datetime.timezone.utc),
+            "time": datetime.time(15),
+        }
+
+
+def test_arrow_parser_validate(tmpdir):
+    path = str(tmpdir.join("table.arrow"))
+    TableResource(path="data/invalid.csv").write(path)
+    report = validate(path)
+    assert not report.valid
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import List, Optional
+
+import attrs
+
+from ...dialect import Control
+from . import settings
+
+
+@attrs.define(kw_only=True, repr=False)
+class ArrowControl(Control):
+    """Arrow control representation.
+
+    Control class to set params for Arrow IPC (Feather) read/write class.
+
+    """
+
+    type = "arrow"
+
+    columns: Optional[List[str]] = None
+    """
+    A list of columns to load. Other columns are not read from the file.
+    Default value is None.
+    """
+
+    compression: Optional[str] = None
+    """
+    Compression of the written record batches: "lz4" or "zstd".
+    Default value is None.
+    """
+
+    batch_size: int = settings.BATCH_SIZE
+    """
+    It specifies the maximum number of rows in a written record batch.
+    Rows are written batch by batch so it also limits the memory usage.
+    The default value is 65536.
+    """
+
+    # Metadata
+
+    metadata_profile_patch = {
+        "properties": {
+            "columns": {"type": "array", "items": {"type": "string"}},
+            "compression": {"type": "string", "enum": ["lz4", "zstd"]},
+            "batchSize": {"type": "integer"},
+        },
+    }
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from ...platform import platform
+from ...schema import Field, Schema
+from ...system import Mapper
+
+if TYPE_CHECKING:
+    from pyarrow import Array, DataType
+    from pyarrow import Field as ArrowField
+    from pyarrow import Schema as ArrowSchema
+
+
+class ArrowMapper(Mapper):
+    """Metadata mapper Frictionless from/to Arrow
+
+    It's shared by the formats using Arrow types (e.g. Arrow IPC and Parquet).
+
+    """
+
+    # Read
+
+    def read_schema(  # type: ignore
+        self, arrow_schema: ArrowSchema, *, names: Optional[List[str]] = None
+    ) -> Schema:
+        """Convert Arrow schema to frictionless schema"""
+        schema = Schema()
+        for name in names or arrow_schema.names:
+            schema.add_field(self.read_field(arrow_schema.field(name)))
+        return schema
+
+    def read_field(self, arrow_field: ArrowField) -> Field:
+        """Convert Arrow field to frictionless field"""
+        type = self.read_type(arrow_field.type)
+        field = Field.from_descriptor({"name": arrow_field.name, "type": type})
+        if not arrow_field.nullable:
+            field.required = True
+        return field
+
+    def read_type(self, arrow_type: DataType) -> str:
+        """Convert Arrow type to frictionless type"""
+        pa = platform.pyarrow
+
+        # Mapping
+        if pa.types.is_dictionary(arrow_type):
+            arrow_type = arrow_type.value_type
+        if pa.types.is_boolean(arrow_type):
+            return "boolean"
+        elif pa.types.is_integer(arrow_type):
+            return "integer"
+        elif pa.types.is_floating(arrow_type) or pa.types.is_decimal(arrow_type):
+            return "number"
+        elif pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+            return "string"
+        elif pa.types.is_date(arrow_type):
+            return "date"
+        elif pa.types.is_timestamp(arrow_type):
+            return "datetime"
+        elif pa.types.is_time(arrow_type):
+            return "time"
+        elif pa.types.is_duration(arrow_type):
+            return "duration"
+        elif pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+            return "array"
+        elif pa.types.is_struct(arrow_type):
+            return "object"
+
+        # Default
+        return "any"
+
+    # Write
+
+    def write_schema(  # type: ignore
+        self, schema: Schema, *, columns: Optional[List[List[Any]]] = None
+    ) -> ArrowSchema:
+        """Convert frictionless schema to Arrow schema
+
+        Parameters:
+            schema (Schema): frictionless schema
+            columns (any[][]): sample columns used to detect timezone aware datetimes
+        """
+        pa = platform.pyarrow
+        arrow_fields: List[Any] = []
+        for index, field in enumerate(schema.fields):
+            arrow_type = self.write_type(field.type)
+            # Timezone aware datetimes are stored in UTC
+            if field.type == "datetime" and columns:
+                if any(cell is not None and cell.tzinfo for cell in columns[index]):
+                    arrow_type = pa.timestamp("us", tz="UTC")
+            arrow_fields.append(pa.field(field.name, arrow_type))
+        return pa.schema(arrow_fields)
+
+    def write_type(self, type: str) -> DataType:
+        """Convert frictionless type to Arrow type"""
+        pa = platform.pyarrow
+
+        # Mapping
+        mapping = {
+            "boolean": pa.bool_(),
+            "date": pa.date32(),
+            "datetime": pa.timestamp("us"),
+            "integer": pa.int64(),
+            "number": pa.float64(),
+            "string": pa.string(),
+            "time": pa.time64("us"),
+            "year": pa.int64(),
+        }
+
+        # Return type
+        # Types without a native representation are stored as strings
+        return mapping.get(type, pa.string())
+
+    def write_array(self, field: Field, cells: List[Any], arrow_type: DataType) -> Array:
+        """Convert frictionless cells to Arrow array"""
+        pa = platform.pyarrow
+
+        # Number
+        if field.type == "number":
+            cells = [float(cell) if cell is not None else None for cell in cells]
+
+        # Time
+        # Timezone aware times are stored in UTC
+        elif field.type == "time":
+            cells = [
+                normalize_time(cell) if cell is not None and cell.tzinfo else cell
+                for cell in cells
+            ]
+
+        # Others
+        elif pa.types.is_string(arrow_type) and field.type != "string":
+            value_writer = field.create_value_writer()
+            cells = [value_writer(cell) if cell is not None else None for cell in cells]
+
+        return pa.array(cells, type=arrow_type)
+
+
+# Internal
+
+
+def normalize_time(cell: datetime.time) -> datetime.time:
+    value = datetime.datetime.combine(TIME_DATE, cell.replace(tzinfo=None))
+    return (value - cell.utcoffset()).time()  # type: ignore
+
+
+TIME_DATE = datetime.date(2000, 1, 1)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List, Optional
+
+from ...platform import platform
+from ...system import Parser, system
+from . import settings
+from .control import ArrowControl
+from .mapper import ArrowMapper
+
+if TYPE_CHECKING:
+    from ...resources import TableResource
+
+
+class ArrowParser(Parser):
+    """Arrow IPC (Feather) parser implementation."""
+
+    supported_types = [
+        "boolean",
+        "date",
+        "datetime",
+        "integer",
+        "number",
+        "string",
+        "time",
+        "year",
+    ]
+
+    # Read
+
+    def read_cell_stream_create(self):
+        ipc = platform.pyarrow_ipc
+        control = ArrowControl.from_dialect(self.resource.dialect)
+        mapper = ArrowMapper()
+
+        # Local files are memory-mapped so record batches are not copied
+        with self.__read_source() as source:
+            if source.read(len(settings.FILE_MAGIC)) == settings.FILE_MAGIC:
+                source.seek(0)
+                reader = ipc.open_file(source)
+                batches = map(reader.get_batch, range(reader.num_record_batches))
+            else:
+                source.seek(0)
+                reader = ipc.open_stream(source)
+                batches = iter(reader)
+
+            # Schema is exactly known from the file so it's not inferred
+            names = control.columns or reader.schema.names
+            if not self.resource.schema:
+                self.resource.schema = mapper.read_schema(reader.schema, names=names)
+
+            # Cells are converted column by column
+            yield names
+            indexes = [reader.schema.get_field_index(name) for name in names]
+            for batch in batches:
+                columns = [batch.column(index).to_pylist() for index in indexes]
+                for cells in zip(*columns):
+                    yield list(cells)
+
+    def __read_source(self):
+        pa = platform.pyarrow
+        if not self.resource.remote:
+            return pa.memory_map(self.resource.normpath)
+        with system.create_loader(self.resource) as loader:
+            buffer = pa.py_buffer(loader.byte_stream.read())
+        return pa.BufferReader(buffer)
+
+    # Write
+
+    def write_row_stream(self, source: TableResource):
+        ipc = platform.pyarrow_ipc
+        pa = platform.pyarrow
+        control = ArrowControl.from_dialect(self.resource.dialect)
+        mapper = ArrowMapper()
+        options = ipc.IpcWriteOptions(compression=control.compression)
+        create = ipc.new_file
+        if self.resource.format in settings.STREAM_FORMATS:
+            create = ipc.new_stream
+
+        # Rows are written batch by batch so memory usage doesn't depend on the data size
+        writer: Optional[Any] = None
+        with source, pa.OSFile(self.resource.normpath, "wb") as sink:
+            try:
+                for batch in source.batch_stream(size=control.batch_size):
+                    columns: List[List[Any]] = []
+                    for field in source.schema.fields:
+                        columns.append(batch.columns[field.name])
+                    if writer is None:
+                        schema = mapper.write_schema(source.schema, columns=columns)
+                        writer = create(sink, schema, options=options)
+                    arrays = [
+                        mapper.write_array(field, column, arrow_field.type)
+                        for field, column, arrow_field in zip(
+                            source.schema.fields, columns, schema
+                        )
+                    ]
+                    writer.write_batch(pa.record_batch(arrays, schema=schema))
+                if writer is None:
+                    schema = mapper.write_schema(source.schema)
+                    writer = create(sink, schema, options=options)
+            finally:
+                if writer is not None:
+                    writer.close()
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+from ...system import Plugin
+from . import settings
+from .control import ArrowControl
+from .parser import ArrowParser
+
+if TYPE_CHECKING:
+    from ...resource import Resource
+
+
+class ArrowPlugin(Plugin):
+    """Plugin for Arrow IPC (Feather)"""
+
+    # Hooks
+
+    def create_parser(self, resource: Resource):
+        if resource.format in settings.FILE_FORMATS + settings.STREAM_FORMATS:
+            return ArrowParser(resource)
+
+    def detect_resource(self, resource: Resource):
+        if resource.format in settings.FILE_FORMATS:
+            resource.datatype = resource.datatype or "table"
+            resource.mediatype = resource.mediatype or "application/vnd.apache.arrow.file"
+        elif resource.format in settings.STREAM_FORMATS:
+            resource.datatype = resource.datatype or "table"
+            resource.mediatype = (
+                resource.mediatype or "application/vnd.apache.arrow.stream"
+            )
+
+    def select_control_class(self, type: Optional[str] = None):
+        if type == "arrow":
+            return ArrowControl
@@ -0,0 +1,8 @@
+from __future__ import annotations
+
+# General
+
+BATCH_SIZE = 65536
+FILE_MAGIC = b"ARROW1"
+FILE_FORMATS = ["arrow", "feather"]
+STREAM_FORMATS = ["arrows"]
@@ -0,0 +1,54 @@
+import glob
+
+import pytest
+
+from frictionless import formats
+from frictionless.resources import TableResource
+
+PATHS = sorted(glob.glob("data/*.csv") + glob.glob("data/*.tsv"))
+
+
+# Conformance
+
+
+@pytest.mark.parametrize("path", PATHS)
+def test_csv_engine_pyarrow_conformance(path):
+    results = []
+    for engine in ["python", "pyarrow"]:
+        control = formats.CsvControl(engine=engine)
+        report = TableResource(path=path, control=control).validate()
+        rows = None
+        if report.valid:
+            with TableResource(path=path, control=control) as resource:
+                rows = [row.to_dict() for row in resource.row_stream]
+        results.append((report.flatten(["rowNumber", "fieldNumber", "type"]), rows))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize(
+    "source, options",
+    [
+        (b'id,name\n1,"multi\nline"\n2,"ragged\nrow",extra\n3\n\n4,five\n', {}),
+        (b"id\n1\n\n2\n", {}),
+        (b'id;name\n1;escaped\\;char\n2;"escaped\\"quote"\n', {"escape_char": "\\"}),
+        (b'id,name\n1,a"b\n2,"a"b\n3,"a""b"\r\n4,crlf\r5,cr', {}),
+    ],
+)
+def test_csv_engine_pyarrow_cells(source, options):
+    results = []
+    for engine in ["python", "pyarrow"]:
+        control = formats.CsvControl(engine=engine, **options)
+        with TableResource(data=source, format="csv", control=control) as resource:
+            results.append([row.to_list() for row in resource.row_stream])
+    assert results[0] == results[1]
+
+
+def test_csv_engine_pyarrow_skip_initial_space():
+    source = b'id, name\n1, "english"\n2, "german"\n'
+    control = formats.CsvControl(engine="pyarrow", skip_initial_space=True)
+    with TableResource(data=source, format="csv", control=control) as resource:
+        assert resource.header == ["id", "name"]
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "german"},
+        ]
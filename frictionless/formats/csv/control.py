@@ -64,6 +64,14 @@ class CsvControl(Control):
     For example space in header(in csv file): "Name", "Team"
     """
 
+    engine: str = settings.DEFAULT_ENGINE
+    """
+    Specify the engine used to parse the csv file: "python" (standard library)
+    or "pyarrow" (requires `frictionless[arrow]`). The "pyarrow" engine produces the same
+    cells as the "python" one and falls back to it if some of the dialect
+    options are not supported (e.g. skip_initial_space).
+    """
+
     # Convert
 
     def to_python(self):
@@ -89,5 +97,6 @@ class CsvControl(Control):
             "escapeChar": {"type": "string"},
             "nullSequence": {"type": "string"},
             "skipInitialSpace": {"type": "boolean"},
+            "engine": {"type": "string", "enum": settings.ENGINES},
         },
     }
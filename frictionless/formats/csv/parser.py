@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import csv
+import hashlib
+import io
 import tempfile
 from itertools import chain
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List
 
+from ...platform import platform
 from ...system import Parser, system
+from ...system.cache import InferenceCache
 from . import settings
 from .control import CsvControl
 
@@ -30,25 +34,84 @@ class CsvParser(Parser):
         if self.resource.format == "tsv":
             control.set_not_defined("delimiter", "\t")
         delimiter = control.get_defined("delimiter", default=",\t;|")
-        try:
-            config = csv.Sniffer().sniff("".join(sample), delimiter)  # type: ignore
-        except csv.Error:
-            config = csv.excel()
-        # We can't rely on this guess as it's can be confused with embedded JSON
-        # https://github.com/frictionlessdata/frictionless-py/issues/493
-        if config.quotechar == "'":
-            config.quotechar = '"'
-        control.set_not_defined("delimiter", config.delimiter, distinct=True)
-        control.set_not_defined("line_terminator", config.lineterminator, distinct=True)
-        control.set_not_defined("escape_char", config.escapechar, distinct=True)
-        control.set_not_defined("quote_char", config.quotechar, distinct=True)
+        config = sniff_config(sample, delimiter=delimiter)  # type: ignore
+        control.set_not_defined("delimiter", config["delimiter"], distinct=True)
+        control.set_not_defined(
+            "line_terminator", config["lineterminator"], distinct=True
+        )
+        control.set_not_defined("escape_char", config["escapechar"], distinct=True)
+        control.set_not_defined("quote_char", config["quotechar"], distinct=True)
         control.set_not_defined(
-            "skip_initial_space", config.skipinitialspace, distinct=True
+            "skip_initial_space", config["skipinitialspace"], distinct=True
         )
+        if control.engine == "pyarrow" and not control.skip_initial_space:
+            yield from self.__read_cell_stream_pyarrow(sample, control)
+            return
         source = chain(sample, self.loader.text_stream)
         data = csv.reader(source, dialect=control.to_python())  # type: ignore
         yield from data
 
+    def __read_cell_stream_pyarrow(self, sample: types.ISample, control: CsvControl):
+        pa_csv = platform.pyarrow_csv
+        pa = platform.pyarrow
+        dialect = control.to_python()
+
+        # Arrow takes the number of columns from the first row
+        # so all the columns can be read as strings without type inference
+        first = next(csv.reader(sample, dialect=dialect), [])  # type: ignore
+        if not first:
+            source = chain(sample, self.loader.text_stream)
+            yield from csv.reader(source, dialect=dialect)  # type: ignore
+            return
+        names = [f"f{index}" for index in range(len(first))]
+
+        # Rows having a different number of cells are not supported by Arrow
+        # so they are parsed by the standard library and merged back in order
+        invalid: Dict[int, List[str]] = {}
+
+        def handle_invalid_row(row: Any):
+            text = io.StringIO(row.text, newline="")
+            invalid[row.number] = next(csv.reader(text, dialect=dialect), [])
+            return "skip"
+
+        read_options = pa_csv.ReadOptions(
+            column_names=names,
+            block_size=settings.PYARROW_BLOCK_SIZE,
+            use_threads=False,
+        )
+        parse_options = pa_csv.ParseOptions(
+            delimiter=dialect.delimiter,
+            quote_char=dialect.quotechar if dialect.quoting != csv.QUOTE_NONE else False,
+            double_quote=dialect.doublequote,
+            escape_char=dialect.escapechar or False,
+            newlines_in_values=True,
+            ignore_empty_lines=False,
+            invalid_row_handler=handle_invalid_row,
+        )
+        convert_options = pa_csv.ConvertOptions(
+            column_types={name: pa.string() for name in names},
+            strings_can_be_null=False,
+            quoted_strings_can_be_null=False,
+        )
+        stream = TextStreamReader(chain(["".join(sample)], iter_text(self.loader)))
+        reader = pa_csv.open_csv(
+            stream,
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+        number = 0
+        for batch in reader:
+            columns = [column.to_pylist() for column in batch.columns]
+            for cells in zip(*columns):
+                number += 1
+                while number in invalid:
+                    yield invalid.pop(number)
+                    number += 1
+                yield list(cells)
+        for number in sorted(invalid):
+            yield invalid[number]
+
     # Write
 
     def write_row_stream(self, source: TableResource):
@@ -75,6 +138,13 @@ class CsvParser(Parser):
 # Internal
 
 SAMPLE_SIZE = 100
+CONFIG_NAMES = [
+    "delimiter",
+    "lineterminator",
+    "escapechar",
+    "quotechar",
+    "skipinitialspace",
+]
 
 
 def extract_samle(text_stream: types.ITextStream) -> types.ISample:
@@ -89,6 +159,68 @@ def extract_samle(text_stream: types.ITextStream) -> types.ISample:
     return sample
 
 
+def iter_text(loader: Any) -> Iterator[str]:
+    while True:
+        text = loader.text_stream.read(settings.PYARROW_BLOCK_SIZE)
+        if not text:
+            break
+        yield text
+
+
+class TextStreamReader(io.RawIOBase):
+    """Binary file-like view of text chunks encoded as UTF-8"""
+
+    def __init__(self, chunks: Iterator[str]):
+        self.chunks = chunks
+        self.buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer: Any):
+        while not self.buffer:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                return 0
+            self.buffer = chunk.encode("utf-8")
+        size = min(len(buffer), len(self.buffer))
+        buffer[:size] = self.buffer[:size]
+        self.buffer = self.buffer[size:]
+        return size
+
+
+def sniff_config(sample: types.ISample, *, delimiter: str) -> Dict[str, Any]:
+    # Read cache
+    # Sniffing is keyed by the sample contents as the dialect is not known yet
+    cache = None
+    if system.inference_cache:
+        cache = InferenceCache(system.inference_cache)
+        text = "\n".join([delimiter, *sample])
+        key = "csv:" + hashlib.sha256(text.encode("utf-8")).hexdigest()
+        cached = cache.read(key)
+        if cached:
+            return cached
+
+    # Sniff config
+    try:
+        sniffed = csv.Sniffer().sniff("".join(sample), delimiter)  # type: ignore
+    except csv.Error:
+        sniffed = csv.excel()
+    config: Dict[str, Any] = {}
+    for name in CONFIG_NAMES:
+        config[name] = getattr(sniffed, name)
+    # We can't rely on this guess as it's can be confused with embedded JSON
+    # https://github.com/frictionlessdata/frictionless-py/issues/493
+    if config["quotechar"] == "'":
+        config["quotechar"] = '"'
+
+    # Write cache
+    if cache:
+        cache.write(key, config)  # type: ignore
+
+    return config
+
+
 # System
 
 # https://stackoverflow.com/a/54515177
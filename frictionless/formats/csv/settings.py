@@ -7,3 +7,9 @@ DEFAULT_LINE_TERMINATOR = "\r\n"
 DEFAULT_QUOTE_CHAR = '"'
 DEFAULT_DOUBLE_QUOTE = True
 FIELD_SIZE_LIMIT = 2147483646
+DEFAULT_ENGINE = "python"
+ENGINES = ["python", "pyarrow"]
+
+# Pyarrow
+
+PYARROW_BLOCK_SIZE = 1 << 20
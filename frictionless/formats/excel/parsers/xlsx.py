@@ -10,7 +10,7 @@ import warnings
 from itertools import chain
 from typing import TYPE_CHECKING, Any, List
 
-from .... import errors
+from .... import errors, helpers
 from ....exception import FrictionlessException
 from ....platform import platform
 from ....resource import Resource
@@ -131,14 +131,16 @@ class XlsxParser(Parser):
         if self.resource.normpath and not self.resource.remote:
             stat = os.stat(self.resource.normpath)
             self.resource.stats.bytes = stat.st_size
-            md5 = hashlib.new("md5")
-            sha256 = hashlib.new("sha256")
+            algorithms = helpers.parse_hashing_algorithms(
+                system.hashing, hash=self.resource.hash
+            )
+            hashers = {algorithm: hashlib.new(algorithm) for algorithm in algorithms}
             with open(self.resource.normpath, "rb") as file:
                 for chunk in iter(lambda: file.read(4096), b""):
-                    md5.update(chunk)
-                    sha256.update(chunk)
-                self.resource.stats.md5 = md5.hexdigest()
-                self.resource.stats.sha256 = sha256.hexdigest()
+                    for hasher in hashers.values():
+                        hasher.update(chunk)
+                for algorithm, hasher in hashers.items():
+                    setattr(self.resource.stats, algorithm, hasher.hexdigest())
 
     # Write
 
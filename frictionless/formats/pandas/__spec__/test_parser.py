@@ -55,6 +55,29 @@ def test_pandas_parser_with_nan():
         assert row["x"].is_nan(), test_name
 
 
+def test_pandas_parser_with_missing_values():
+    dataframe = pd.DataFrame(
+        data={
+            "integer": pd.array([1, None], dtype="Int64"),
+            "datetime": [pd.Timestamp("2020-01-01"), pd.NaT],
+            "string": ["a", np.nan],
+        }
+    )
+    with TableResource(data=dataframe) as resource:
+        assert resource.read_rows() == [
+            {"integer": 1, "datetime": datetime(2020, 1, 1), "string": "a"},
+            {"integer": None, "datetime": None, "string": None},
+        ]
+
+
+def test_pandas_parser_wide_dataframe():
+    data = {f"field{number}": [number, number + 1] for number in range(500)}
+    dataframe = pd.DataFrame(data=data)
+    source = TableResource(data=dataframe)
+    target = source.write(format="pandas")
+    assert target.data.equals(dataframe)  # type: ignore
+
+
 def test_pandas_parser_from_dataframe_with_primary_key_having_datetime():
     df = pd.read_csv("data/vix.csv", sep=";", parse_dates=["Date"], index_col=["Date"])  # type: ignore
     with TableResource(data=df) as resource:
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from dateutil.tz import tzoffset
 
@@ -34,7 +34,6 @@ class PandasParser(Parser):
     # Read
 
     def read_cell_stream_create(self):
-        np = platform.numpy
         pd = platform.pandas
         assert isinstance(self.resource.data, pd.DataFrame)
         dataframe = self.resource.data
@@ -44,22 +43,52 @@ class PandasParser(Parser):
         if not self.resource.schema:
             self.resource.schema = schema
 
+        # Columns
+        # Columns are converted at once as per-row access is very slow for wide frames
+        columns: List[List[Any]] = []
+        for field in schema.fields:
+            if field.name in schema.primary_key:
+                index = schema.primary_key.index(field.name)
+                values = dataframe.index.get_level_values(index)  # type: ignore
+            else:
+                values = dataframe[field.name]  # type: ignore
+            columns.append(self.__read_convert_column(values))
+
         # Lists
         yield schema.field_names
-        for pk, item in dataframe.iterrows():  # type: ignore
-            cells: List[Any] = []
-            for field in schema.fields:
-                if field.name in schema.primary_key:
-                    pk = pk if isinstance(pk, tuple) else [pk]  # type: ignore
-                    value = pk[schema.primary_key.index(field.name)]  # type: ignore
-                else:
-                    value = item.to_dict()[field.name]
-                if value is np.nan:
-                    value = None
-                elif isinstance(value, pd.Timestamp):
-                    value = value.to_pydatetime()  # type: ignore
-                cells.append(value)
-            yield cells
+        for cells in zip(*columns):
+            yield list(cells)
+
+    def __read_convert_column(self, values: Any) -> List[Any]:
+        np = platform.numpy
+        pd = platform.pandas
+        pdc = platform.pandas_core_dtypes_api
+
+        # Datetime
+        if pdc.is_datetime64_any_dtype(values.dtype):  # type: ignore
+            if getattr(values.dtype, "tz", None) is None:
+                # Numpy converts microsecond precision datetimes to Python ones
+                return values.to_numpy(dtype="datetime64[us]").astype(object).tolist()
+            return [
+                cell.to_pydatetime() if cell is not pd.NaT else None
+                for cell in values.to_numpy(dtype=object)
+            ]
+
+        # Object
+        if pdc.is_object_dtype(values.dtype):  # type: ignore
+            cells = values.to_numpy(dtype=object).tolist()
+            for index, cell in enumerate(cells):
+                if cell is np.nan:
+                    cells[index] = None
+                elif isinstance(cell, pd.Timestamp):
+                    cells[index] = cell.to_pydatetime()
+            return cells
+
+        # Others
+        # Missing values of extension types (e.g. Int64) are pd.NA
+        if pdc.is_extension_array_dtype(values.dtype):  # type: ignore
+            return values.to_numpy(dtype=object, na_value=None).tolist()
+        return values.to_numpy(dtype=object).tolist()
 
     def __read_convert_schema(self):
         dataframe = self.resource.data
@@ -121,71 +150,38 @@ class PandasParser(Parser):
     # Write
 
     def write_row_stream(self, source: TableResource):
-        np = platform.numpy
         pd = platform.pandas
 
         # Get data/index
-        data_rows: List[Tuple[Any]] = []
-        index_rows: List[Tuple[Any]] = []
-        fixed_types = {}
+        values: Dict[str, List[Any]] = {}
         with source:
-            for row in source.row_stream:
-                data_values: List[Any] = []
-                index_values: List[Any] = []
+            for field in source.schema.fields:
+                values[field.name] = []
+            for batch in source.batch_stream():
                 for field in source.schema.fields:
-                    value = row[field.name]
-                    if isinstance(value, float) and np.isnan(value):
-                        value = None
-                    if isinstance(value, decimal.Decimal):
-                        value = float(value)
-                    # Convert to UTC for timezone aware datetime
-                    # From version 0.24 pandas preserves the dateutil object and doesn't by default
-                    # convert to "UTC" and fastparquet write raises error as it can't handle tzutc()
-                    # object
-                    # https://github.com/pandas-dev/pandas/issues/25423#issuecomment-485784044
-                    if isinstance(value, datetime.datetime) and value.tzinfo:
-                        value = value.astimezone(datetime.timezone.utc)
-                    # For datetime.time having zero offset from UTC, the tzinfo is set to tzutc() which
-                    # causes error while reading.
-                    if isinstance(value, datetime.time) and value.tzinfo:
-                        value = value.replace(
-                            tzinfo=tzoffset(
-                                datetime.timezone.utc,
-                                value.utcoffset().total_seconds(),  # type: ignore
-                            )
-                        )
-                    # http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na
-                    if value is None and field.type in ("number", "integer"):
-                        fixed_types[field.name] = "number"
-                        value = np.nan
-                    if field.name in source.schema.primary_key:
-                        index_values.append(value)
-                    else:
-                        data_values.append(value)
-
-                if len(source.schema.primary_key) == 1:
-                    index_rows.append(index_values[0])
-                elif len(source.schema.primary_key) > 1:
-                    index_rows.append(tuple(index_values))
-                data_rows.append(tuple(data_values))
+                    values[field.name].extend(batch.columns[field.name])
+        arrays = {
+            field.name: self.__write_convert_column(field, values.pop(field.name))
+            for field in source.schema.fields
+        }
 
         # Create index
-        pd = platform.pandas
-
         index = None
         if source.schema.primary_key:
             if len(source.schema.primary_key) == 1:
                 index_class = pd.Index
                 index_field = source.schema.get_field(source.schema.primary_key[0])
                 index_dtype = self.__write_convert_type(index_field.type)
+                index_rows = arrays[index_field.name]
                 if index_field.type in ["datetime", "date"]:
                     index_class = pd.DatetimeIndex
                     index_rows = pd.to_datetime(index_rows, utc=True)
                 index = index_class(index_rows, name=index_field.name, dtype=index_dtype)  # type: ignore
 
             elif len(source.schema.primary_key) > 1:
-                index = pd.MultiIndex.from_tuples(
-                    index_rows, names=source.schema.primary_key
+                index = pd.MultiIndex.from_arrays(
+                    [arrays[name] for name in source.schema.primary_key],
+                    names=source.schema.primary_key,
                 )
 
         # Create dtypes/columns
@@ -195,7 +191,8 @@ class PandasParser(Parser):
                 columns.append(field.name)
 
         # Create/set dataframe
-        dataframe = pd.DataFrame(data_rows, index=index, columns=columns)
+        data = {name: arrays[name] for name in columns}
+        dataframe = pd.DataFrame(data, index=index, columns=columns)
 
         # This step will see if there is any column for which the schema is defined
         # as 'integer' but Pandas inferred it as a float. This can happen if there
@@ -221,6 +218,59 @@ class PandasParser(Parser):
 
         self.resource.data = dataframe
 
+    def __write_convert_column(self, field: Field, cells: List[Any]) -> Any:
+        np = platform.numpy
+        pd = platform.pandas
+
+        # Number/Integer
+        # http://pandas.pydata.org/pandas-docs/stable/gotchas.html#support-for-integer-na
+        if field.type == "number":
+            return np.array(cells, dtype=float)
+        if field.type == "integer":
+            try:
+                if None in cells:
+                    return pd.array(cells, dtype="Int64")
+                return np.array(cells, dtype=np.int64)
+            except (OverflowError, TypeError):
+                return cells
+
+        # Datetime/Time
+        # Convert to UTC for timezone aware datetime
+        # From version 0.24 pandas preserves the dateutil object and doesn't by default
+        # convert to "UTC" and fastparquet write raises error as it can't handle tzutc()
+        # object
+        # https://github.com/pandas-dev/pandas/issues/25423#issuecomment-485784044
+        if field.type == "datetime":
+            return [
+                cell.astimezone(datetime.timezone.utc)
+                if cell is not None and cell.tzinfo
+                else cell
+                for cell in cells
+            ]
+        # For datetime.time having zero offset from UTC, the tzinfo is set to tzutc() which
+        # causes error while reading.
+        if field.type == "time":
+            return [
+                cell.replace(
+                    tzinfo=tzoffset(
+                        datetime.timezone.utc,
+                        cell.utcoffset().total_seconds(),  # type: ignore
+                    )
+                )
+                if cell is not None and cell.tzinfo
+                else cell
+                for cell in cells
+            ]
+
+        # Others
+        if field.type not in ["string", "boolean", "date"]:
+            for index, cell in enumerate(cells):
+                if isinstance(cell, float) and np.isnan(cell):
+                    cells[index] = None
+                elif isinstance(cell, decimal.Decimal):
+                    cells[index] = float(cell)
+        return cells
+
     def __write_convert_type(self, type: Optional[str] = None):
         np = platform.numpy
         pd = platform.pandas
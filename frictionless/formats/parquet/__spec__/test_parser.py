@@ -1,8 +1,9 @@
 import datetime
 
+import pyarrow.parquet as pq
 import pytest
 
-from frictionless import formats
+from frictionless import Package, formats
 from frictionless.resources import TableResource
 
 # Read
@@ -77,3 +78,75 @@ def test_parquet_parser_write_datetime_field_with_timezone(tmpdir):
                 )
             }
         ]
+
+
+def test_parquet_parser_write_types(tmpdir):
+    source = Package("data/storage/types.json").get_table_resource("types")
+    target = TableResource(path=str(tmpdir.join("table.parquet")))
+    source.write(target)
+    with target:
+        assert target.schema.to_descriptor() == {
+            "fields": [
+                {"name": "any", "type": "string"},
+                {"name": "array", "type": "string"},
+                {"name": "boolean", "type": "boolean"},
+                {"name": "date", "type": "date"},
+                {"name": "date_year", "type": "date"},
+                {"name": "datetime", "type": "datetime"},
+                {"name": "duration", "type": "string"},
+                {"name": "geojson", "type": "string"},
+                {"name": "geopoint", "type": "string"},
+                {"name": "integer", "type": "integer"},
+                {"name": "number", "type": "number"},
+                {"name": "object", "type": "string"},
+                {"name": "string", "type": "string"},
+                {"name": "time", "type": "time"},
+                {"name": "year", "type": "integer"},
+                {"name": "yearmonth", "type": "string"},
+            ],
+        }
+        assert target.read_rows() == [
+            {
+                "any": "中国人",
+                "array": '["Mike", "John"]',
+                "boolean": True,
+                "date": datetime.date(2015, 1, 1),
+                "date_year": datetime.date(2015, 1, 1),
+                "datetime": datetime.datetime(2015, 1, 1, 3, 0),
+                "duration": "P1Y1M",
+                "geojson": '{"type": "Point", "coordinates": [33, 33.33]}',
+                "geopoint": "30,70",
+                "integer": 1,
+                "number": 7,
+                "object": '{"chars": 560}',
+                "string": "english",
+                "time": datetime.time(3, 0),
+                "year": 2015,
+                "yearmonth": "2015-01",
+            },
+        ]
+
+
+def test_parquet_parser_write_row_group_size(tmpdir):
+    path = str(tmpdir.join("table.parquet"))
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(10)]
+    control = formats.ParquetControl(row_group_size=3)
+    TableResource(data=data).write(path, control=control)
+    assert pq.ParquetFile(path).num_row_groups == 4
+    with TableResource(path=path) as resource:
+        assert [row.to_list() for row in resource.read_rows()] == data[1:]
+
+
+def test_parquet_parser_filters(tmpdir):
+    path = str(tmpdir.join("table.parquet"))
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(10)]
+    control = formats.ParquetControl(row_group_size=3)
+    TableResource(data=data).write(path, control=control)
+    control = formats.ParquetControl(columns=["name"], filters=[("id", ">", 6)])
+    with TableResource(path=path, control=control) as resource:
+        assert resource.header == ["name"]
+        assert resource.read_rows() == [
+            {"name": "name7"},
+            {"name": "name8"},
+            {"name": "name9"},
+        ]
@@ -6,6 +6,7 @@ import attrs
 
 from ... import helpers
 from ...dialect import Control
+from . import settings
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -36,6 +37,15 @@ class ParquetControl(Control):
     """
     Specifies the condition to filter data(row-groups).
     For example: [('col3', 'in', [1, 2, 3, 4])])
+    With `pyarrow`, row groups are skipped using their statistics
+    and the remaining rows are filtered as well.
+    """
+
+    row_group_size: int = settings.ROW_GROUP_SIZE
+    """
+    It specifies the maximum number of rows in a row group while writing.
+    Rows are written group by group so it also limits the memory usage.
+    The default value is 65536.
     """
 
     # Convert
@@ -55,5 +65,6 @@ class ParquetControl(Control):
             "columns": {"type": "array", "items": {"type": "string"}},
             "categories": {},
             "filters": {},
+            "rowGroupSize": {"type": "integer"},
         },
     }
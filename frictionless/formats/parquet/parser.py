@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import re
+from typing import Any, List
+
+from ...exception import FrictionlessException
 from ...platform import platform
 from ...resources import TableResource
 from ...system import Parser
+from ..arrow import ArrowMapper
+from . import settings
 from .control import ParquetControl
 
 
@@ -32,6 +38,38 @@ class ParquetParser(Parser):
                 self.resource.normpath, "rb", is_text=False
             )
             handle = handles.handle
+        try:
+            ds = platform.pyarrow_dataset
+            pq = platform.pyarrow_parquet
+        except FrictionlessException:
+            yield from self.__read_cell_stream_fastparquet(handle, control)
+            return
+
+        # Record batches are streamed from the file
+        # and row groups not matching the filters are skipped using their statistics
+        with open(handle, "rb") if isinstance(handle, str) else handle as file:
+            fragment = ds.ParquetFileFormat().make_fragment(file)
+            names = control.columns or [
+                name
+                for name in fragment.physical_schema.names
+                if not re.match(settings.INDEX_COLUMN_PATTERN, name)
+            ]
+            if not self.resource.schema:
+                schema = ArrowMapper().read_schema(fragment.physical_schema, names=names)
+                self.resource.schema = schema
+            filter = (
+                pq.filters_to_expression(control.filters) if control.filters else None
+            )
+            yield names
+            batches = fragment.to_batches(
+                columns=names, filter=filter, batch_size=settings.BATCH_SIZE
+            )
+            for batch in batches:
+                columns = [column.to_pylist() for column in batch.columns]
+                for cells in zip(*columns):
+                    yield list(cells)
+
+    def __read_cell_stream_fastparquet(self, handle: Any, control: ParquetControl):
         file = platform.fastparquet.ParquetFile(handle)
         for group, df in enumerate(file.iter_row_groups(**control.to_python()), start=1):
             with TableResource(data=df, format="pandas") as resource:
@@ -44,4 +82,40 @@ class ParquetParser(Parser):
     # Write
 
     def write_row_stream(self, source: TableResource):
-        platform.fastparquet.write(self.resource.normpath, source.to_pandas())
+        control = ParquetControl.from_dialect(self.resource.dialect)
+        try:
+            pa = platform.pyarrow
+            pq = platform.pyarrow_parquet
+        except FrictionlessException:
+            platform.fastparquet.write(self.resource.normpath, source.to_pandas())
+            return
+
+        # Rows are written group by group so memory usage doesn't depend on the data size
+        mapper = ArrowMapper()
+        writer = None
+        with source:
+            try:
+                batch_stream = source.batch_stream(size=control.row_group_size)
+                for batch in batch_stream:
+                    columns: List[List[Any]] = []
+                    for field in source.schema.fields:
+                        columns.append(batch.columns[field.name])
+                    if writer is None:
+                        schema = mapper.write_schema(source.schema, columns=columns)
+                        writer = pq.ParquetWriter(self.resource.normpath, schema)
+                    arrays = [
+                        mapper.write_array(field, column, arrow_field.type)
+                        for field, column, arrow_field in zip(
+                            source.schema.fields, columns, schema
+                        )
+                    ]
+                    record_batch = pa.record_batch(arrays, schema=schema)
+                    writer.write_batch(
+                        record_batch, row_group_size=control.row_group_size
+                    )
+                if writer is None:
+                    schema = mapper.write_schema(source.schema)
+                    writer = pq.ParquetWriter(self.resource.normpath, schema)
+            finally:
+                if writer is not None:
+                    writer.close()
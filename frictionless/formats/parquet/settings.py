@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+# General
+
+BATCH_SIZE = 65536
+ROW_GROUP_SIZE = 65536
+INDEX_COLUMN_PATTERN = r"^__index_level_\d+__$"
@@ -229,6 +229,50 @@ def test_sql_adapter_package_url_argument(sqlite_url):
     ]
 
 
+def test_sql_adapter_from_url_reuses_engine(sqlite_url):
+    adapter1 = formats.SqlAdapter.from_url(sqlite_url)
+    adapter2 = formats.SqlAdapter.from_url(sqlite_url)
+    assert adapter1.engine is adapter2.engine
+
+
+def test_sql_adapter_from_url_memory_database_not_shared():
+    adapter1 = formats.SqlAdapter.from_url("sqlite://")
+    adapter2 = formats.SqlAdapter.from_url("sqlite://")
+    assert adapter1.engine is not adapter2.engine
+
+
+def test_sql_adapter_dispose(sqlite_url):
+    adapter1 = formats.SqlAdapter.from_url(sqlite_url)
+    formats.SqlAdapter.dispose(sqlite_url)
+    adapter2 = formats.SqlAdapter.from_url(sqlite_url)
+    assert adapter1.engine is not adapter2.engine
+    formats.SqlAdapter.dispose()
+    adapter3 = formats.SqlAdapter.from_url(sqlite_url)
+    assert adapter2.engine is not adapter3.engine
+
+
+def test_sql_adapter_reflect_table(sqlite_url_data):
+    adapter = formats.SqlAdapter.from_url(sqlite_url_data)
+    assert list(adapter.metadata.tables) == []
+    adapter.read_schema("fruits")
+    assert list(adapter.metadata.tables) == ["fruits"]
+    adapter.reflect()
+    assert sorted(adapter.metadata.tables) == ["fruits", "table"]
+
+
+def test_sql_adapter_invalidate(sqlite_url_data):
+    engine = sa.create_engine(sqlite_url_data)
+    adapter = formats.SqlAdapter.from_url(sqlite_url_data)
+    assert adapter.read_schema("table").field_names == ["id", "name"]
+    with engine.begin() as conn:
+        conn.execute(sa.text('ALTER TABLE "table" ADD COLUMN extra TEXT'))
+    adapter = formats.SqlAdapter.from_url(sqlite_url_data)
+    assert adapter.read_schema("table").field_names == ["id", "name"]
+    adapter.invalidate("table")
+    adapter = formats.SqlAdapter.from_url(sqlite_url_data)
+    assert adapter.read_schema("table").field_names == ["id", "name", "extra"]
+
+
 # Bugs
 
 
@@ -54,6 +54,61 @@ def test_sql_parser_where(sqlite_url_data):
         ]
 
 
+def test_sql_parser_fetch_size(sqlite_url_data):
+    control = formats.SqlControl(table="table", fetch_size=1)
+    with TableResource(path=sqlite_url_data, control=control) as resource:
+        assert resource.read_rows() == [
+            {"id": 1, "name": "english"},
+            {"id": 2, "name": "中国人"},
+        ]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"partitions": 3},
+        {"partitions": 3, "order_by": "id"},
+        {"partitions": 100, "fetch_size": 7},
+        {"partitions": 4, "partition_by": "name"},
+        {"partitions": 4, "partition_by": "name", "order_by": "name"},
+    ],
+)
+def test_sql_parser_partitions(sqlite_url, options):
+    data = [["id", "name"]] + [[number, f"name{number:03}"] for number in range(100)]
+    source = TableResource(data=data)
+    source.infer()
+    source.schema.primary_key = ["id"]
+    source.write(sqlite_url, control=formats.SqlControl(table="table"))
+    control = formats.SqlControl(table="table", **options)
+    with TableResource(path=sqlite_url, control=control) as resource:
+        rows = resource.read_rows()
+        assert [row.to_list() for row in rows] == data[1:]
+
+
+def test_sql_parser_partitions_where(sqlite_url):
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(100)]
+    source = TableResource(data=data)
+    source.write(sqlite_url, control=formats.SqlControl(table="table"))
+    control = formats.SqlControl(
+        table="table", partitions=3, partition_by="id", where="id >= 90"
+    )
+    with TableResource(path=sqlite_url, control=control) as resource:
+        rows = resource.read_rows()
+        assert [row.to_list() for row in rows] == data[91:]
+
+
+def test_sql_parser_partitions_stopped(sqlite_url):
+    data = [["id", "name"]] + [[number, f"name{number}"] for number in range(1000)]
+    source = TableResource(data=data)
+    source.write(sqlite_url, control=formats.SqlControl(table="table"))
+    control = formats.SqlControl(
+        table="table", partitions=4, partition_by="id", fetch_size=1
+    )
+    with TableResource(path=sqlite_url, control=control) as resource:
+        row = next(resource.row_stream)
+        assert row.to_list() == [0, "name0"]
+
+
 def test_sql_parser_table_is_required_error(sqlite_url_data):
     resource = TableResource(path=sqlite_url_data)
     with pytest.raises(FrictionlessException) as excinfo:
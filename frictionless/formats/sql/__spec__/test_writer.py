@@ -0,0 +1,102 @@
+import datetime
+import json
+from decimal import Decimal
+
+import pytest
+import sqlalchemy as sa
+
+from frictionless import Schema, formats
+from frictionless.formats.sql.writer import write_copy_value
+from frictionless.resources import TableResource
+
+# General
+
+
+DESCRIPTOR = {
+    "fields": [
+        {"name": "id", "type": "integer"},
+        {"name": "name", "type": "string"},
+        {"name": "price", "type": "number"},
+        {"name": "date", "type": "date"},
+        {"name": "datetime", "type": "datetime"},
+        {"name": "flag", "type": "boolean"},
+        {"name": "object", "type": "object"},
+    ]
+}
+
+
+@pytest.mark.parametrize("url", ["sqlite_url", "duckdb_url", "postgresql_url"])
+def test_sql_writer_batch_size(url, request):
+    url = request.getfixturevalue(url)
+    data: list = [[field["name"] for field in DESCRIPTOR["fields"]]]
+    for number in range(1, 6):
+        data.append(
+            [
+                number,
+                f"name{number}\ttab\nnewline\r\\backslash \\N",
+                Decimal(number) / 2,
+                datetime.date(2020, 1, number),
+                datetime.datetime(2020, 1, number, 3, 0),
+                number % 2 == 0,
+                {"number": number, "text": "\t\n\\"},
+            ]
+        )
+    data.append([6, None, None, None, None, None, None])
+    schema = Schema.from_descriptor(DESCRIPTOR)
+    control = formats.SqlControl(table="table", batch_size=2)
+    source = TableResource(data=data, schema=schema)
+    target = source.write(url, control=control)
+    rows = target.read_rows()
+    assert len(rows) == 6
+    cells = rows[2].to_dict()
+    # Objects are read as dicts from JSONB columns and as text otherwise
+    if isinstance(cells["object"], str):
+        cells["object"] = json.loads(cells["object"])
+    assert cells == {
+        "id": 3,
+        "name": "name3\ttab\nnewline\r\\backslash \\N",
+        "price": 1.5,
+        "date": datetime.date(2020, 1, 3),
+        "datetime": datetime.datetime(2020, 1, 3, 3, 0),
+        "flag": False,
+        "object": {"number": 3, "text": "\t\n\\"},
+    }
+    assert rows[3]["flag"] is True
+    assert rows[5].to_dict() == {
+        "id": 6,
+        "name": None,
+        "price": None,
+        "date": None,
+        "datetime": None,
+        "flag": None,
+        "object": None,
+    }
+
+
+def test_sql_writer_batch_size_with_metadata(sqlite_url):
+    control = formats.SqlControl(batch_size=1)
+    adapter = formats.SqlAdapter.from_url(sqlite_url, control=control)
+    resource = TableResource(path="data/invalid.csv")
+    resource.infer()
+    adapter.write_schema(resource.schema, table_name="table", with_metadata=True)
+    adapter.write_resource_with_metadata(resource, table_name="table")
+    with adapter.engine.connect() as conn:
+        query = 'SELECT "_rowNumber", "_rowValid", "id" FROM "table"'
+        records = [tuple(record) for record in conn.execute(sa.text(query))]
+    assert records[:3] == [(2, 0, 1), (3, 0, 1), (4, 0, None)]
+
+
+def test_sql_writer_write_copy_value():
+    assert write_copy_value(None) == "\\N"
+    assert write_copy_value(True) == "t"
+    assert write_copy_value(1) == "1"
+    assert write_copy_value(Decimal("1.5")) == "1.5"
+    assert write_copy_value(datetime.date(2020, 1, 1)) == "2020-01-01"
+    assert write_copy_value("a\\b\tc\nd\re") == "a\\\\b\\tc\\nd\\re"
+    assert write_copy_value("\\N") == "\\\\N"
+    assert write_copy_value(json.dumps({"text": "\t\\"})) == '{"text": "\\\\t\\\\\\\\"}'
+
+
+def test_sql_control_batch_size():
+    control = formats.SqlControl.from_descriptor({"type": "sql", "batchSize": 100})
+    assert control.batch_size == 100
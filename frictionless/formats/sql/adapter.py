@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import queue
 import re
+import threading
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional
 
 from ...package import Package
@@ -10,15 +14,16 @@ from ...system import Adapter, PublishResult
 from . import settings
 from .control import SqlControl
 from .mapper import SqlMapper
+from .writer import SqlWriter
 
 if TYPE_CHECKING:
-    from sqlalchemy import MetaData, Table
+    from sqlalchemy import Connection, MetaData, Select, Table
     from sqlalchemy.engine import Engine
 
     from ...report import Report
     from ...resources import TableResource
-    from ...schema import Schema
-    from ...table import IRowStream, Row
+    from ...schema import Field, Schema
+    from ...table import IBatchStream, IRowStream, Row
 
 
 class SqlAdapter(Adapter):
@@ -38,19 +43,106 @@ class SqlAdapter(Adapter):
             # It will fail silently if this function already exists
             if self.engine.dialect.name.startswith("sqlite"):
                 conn.connection.create_function("REGEXP", 2, regexp)  # type: ignore
-            self.metadata = sa.MetaData(schema=self.control.namespace)
-            self.metadata.reflect(conn, views=True)
+        # Tables are reflected on demand (see "reflect")
+        self.metadata = sa.MetaData(schema=self.control.namespace)
+
+    @classmethod
+    def from_url(cls, url: str, *, control: Optional[SqlControl] = None):
+        """Create an adapter reusing an engine created for the same URL
+
+        In-memory databases are not shared so every adapter gets a new engine.
+
+        Parameters:
+            url (str): database URL
+            control (SqlControl): SQL control
+
+        Returns:
+            SqlAdapter: adapter
+        """
+        sa = platform.sqlalchemy
+        if is_memory_url(url):
+            return cls(sa.create_engine(url), control=control)
+        with ENGINES_LOCK:
+            engine = ENGINES.get(url)
+            if engine is None:
+                engine = sa.create_engine(url)
+                ENGINES[url] = engine
+        return cls(engine, control=control)
+
+    @staticmethod
+    def dispose(url: Optional[str] = None) -> None:
+        """Dispose engines shared by "from_url" (and their connection pools)
+
+        Parameters:
+            url (str): database URL; dispose all the engines if not provided
+        """
+        with ENGINES_LOCK:
+            urls = [url] if url is not None else list(ENGINES)
+            engines = [ENGINES.pop(url) for url in urls if url in ENGINES]
+        for engine in engines:
+            engine.dispose()
+
+    # Reflect
+
+    def reflect(self, table_name: Optional[str] = None) -> None:
+        """Reflect a table (or all the tables) to the adapter's metadata
+
+        Reflected tables are cached per engine and shared between adapters
+        so reflecting a table doesn't depend on the number of tables in the
+        database. Tables created or dropped by adapters are invalidated
+        automatically; changes made outside require "invalidate".
+
+        Parameters:
+            table_name (str): table name; reflect all the tables if not provided
+        """
+        sa = platform.sqlalchemy
+        with REFLECTIONS_LOCK:
+            reflections = REFLECTIONS.setdefault(self.engine, {})
+            cache = reflections.get(self.control.namespace)
+            if table_name is None or cache is None:
+                cache = sa.MetaData(schema=self.control.namespace)
+                reflections[self.control.namespace] = cache
+            if table_name is None or table_name not in cache.tables:
+                with self.engine.begin() as conn:
+                    only = [table_name] if table_name else None
+                    try:
+                        cache.reflect(conn, views=True, only=only)
+                    # The table doesn't exist
+                    except sa.exc.InvalidRequestError:
+                        return
+            tables = list(cache.tables.values())
+            if table_name:
+                tables = collect_tables(cache.tables[table_name])
+            for table in tables:
+                if table.key not in self.metadata.tables:
+                    table.to_metadata(self.metadata)
+
+    def invalidate(self, table_name: Optional[str] = None) -> None:
+        """Invalidate cached reflection of a table (or all the tables)
+
+        Parameters:
+            table_name (str): table name; invalidate all the tables if not provided
+        """
+        with REFLECTIONS_LOCK:
+            reflections = REFLECTIONS.get(self.engine, {})
+            cache = reflections.get(self.control.namespace)
+            # Tables referencing the table might be affected as well
+            if cache is not None and (table_name is None or table_name in cache.tables):
+                reflections.pop(self.control.namespace)
 
     # Delete
 
     def delete_resource(self, table_name: str) -> None:
+        self.reflect(table_name)
         with self.engine.begin() as conn:
             table = self.metadata.tables[table_name]
             self.metadata.drop_all(conn, tables=[table])
+        self.invalidate(table_name)
 
     # Read
 
     def read_package(self) -> Package:
+        self.reflect()
         package = Package(resources=[])
         for table in self.metadata.sorted_tables:
             name = str(table.name)
@@ -62,41 +154,159 @@ class SqlAdapter(Adapter):
         return package
 
     def read_schema(self, table_name: str) -> Schema:
+        self.reflect(table_name)
         table = self.metadata.tables[table_name]
         return self.mapper.read_schema(table, with_metadata=self.control.with_metadata)
 
     def read_cell_stream(self, control: SqlControl) -> Generator[List[Any], None, None]:
         sa = platform.sqlalchemy
+        self.reflect(control.table)
         table = self.metadata.tables[control.table]  # type: ignore
+
+        # Prepare columns
+        columns = table.c
+        if self.control.with_metadata:
+            columns = [
+                column
+                for column in table.c
+                if column.name not in settings.METADATA_IDENTIFIERS
+            ]
+
+        # Prepare query
+        # Streaming could be not working for some backends:
+        # http://docs.sqlalchemy.org/en/latest/core/connections.html
+        query = sa.select(*columns).execution_options(
+            stream_results=True, yield_per=control.fetch_size
+        )
+        if control.order_by:
+            query = query.order_by(sa.text(control.order_by))
+        if control.where:
+            query = query.where(sa.text(control.where))
+
+        # Stream cells
+        yield [column.name for column in columns]
+        clauses = self.__create_partitions(table, query, control)
+        if clauses:
+            yield from self.__read_partitions([query.where(c) for c in clauses])
+            return
         with self.engine.begin() as conn:
-            # Prepare columns
-            columns = table.c
-            if self.control.with_metadata:
-                columns = [
-                    column
-                    for column in table.c
-                    if column.name not in settings.METADATA_IDENTIFIERS
-                ]
-
-            # Prepare query
-            # Streaming could be not working for some backends:
-            # http://docs.sqlalchemy.org/en/latest/core/connections.html
-            query = sa.select(*columns).execution_options(stream_results=True)
-            if control.order_by:
-                query = query.order_by(sa.text(control.order_by))
-            if control.where:
-                query = query.where(sa.text(control.where))
-
-            # Stream cells
             result = conn.execute(query)
-            yield list(result.keys())
-            for item in result:
-                cells = list(item)
-                yield cells
+            for items in result.partitions():
+                for item in items:
+                    yield list(item)
+
+    # Partitions
+
+    # Partitions are read in worker threads putting fetched rows to bounded queues.
+    # They are consumed in the key order so the rows are yielded deterministically
+
+    def __create_partitions(
+        self, table: Table, query: Select[Any], control: SqlControl
+    ) -> Optional[List[Any]]:
+        sa = platform.sqlalchemy
+        column = None
+        if control.partition_by:
+            column = table.c[control.partition_by]
+        elif len(table.primary_key.columns) == 1:
+            column = list(table.primary_key.columns)[0]
+        if control.partitions <= 1 or column is None:
+            return None
+        # Splitting rows sorted by another column would break the order
+        if control.order_by and control.order_by != column.name:
+            return None
+
+        # Find upper bounds
+        bounds: List[Any] = []
+        source = query.with_only_columns(column).where(column.isnot(None))
+        source = source.order_by(None).subquery()
+        with self.engine.begin() as conn:
+            if isinstance(column.type, sa.Integer):
+                bounds_query = sa.select(
+                    sa.func.min(source.c[0]), sa.func.max(source.c[0])
+                )
+                minimum, maximum = conn.execute(bounds_query).one()
+                if minimum is not None:
+                    size = maximum - minimum + 1
+                    for number in range(1, control.partitions):
+                        bounds.append(minimum + size * number // control.partitions - 1)
+                    bounds.append(maximum)
+            else:
+                tile = sa.func.ntile(control.partitions).over(order_by=source.c[0])
+                tiles = sa.select(source.c[0].label("value"), tile.label("tile"))
+                tiles = tiles.subquery()
+                bounds_query = sa.select(sa.func.max(tiles.c.value))
+                bounds_query = bounds_query.group_by(tiles.c.tile)
+                bounds_query = bounds_query.order_by(tiles.c.tile)
+                bounds = [record[0] for record in conn.execute(bounds_query)]
+        if not bounds:
+            return None
+
+        # Create clauses
+        clauses: List[Any] = []
+        lower = None
+        for bound in sorted(set(bounds)):
+            clause = column <= bound
+            if lower is not None:
+                clause = sa.and_(column > lower, clause)
+            else:
+                clause = sa.or_(column.is_(None), clause)
+            clauses.append(clause)
+            lower = bound
+        return clauses
+
+    def __read_partitions(self, queries: List[Select[Any]]):
+        stopped = threading.Event()
+        queues: List[queue.Queue[Any]] = []
+        futures: List[Future[None]] = []
+        workers = min(len(queries), settings.PARTITION_WORKERS)
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for query in queries:
+                partition: queue.Queue[Any] = queue.Queue(settings.PARTITION_PREFETCH)
+                future = executor.submit(self.__read_partition, query, partition, stopped)
+                queues.append(partition)
+                futures.append(future)
+            for partition in queues:
+                while True:
+                    items = partition.get()
+                    if items is None:
+                        break
+                    if isinstance(items, Exception):
+                        raise items
+                    yield from items
+        finally:
+            stopped.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def __read_partition(
+        self, query: Select[Any], partition: queue.Queue[Any], stopped: threading.Event
+    ):
+        def put(items: Any):
+            # The queue is not waited for forever as the reading can be stopped
+            while not stopped.is_set():
+                try:
+                    partition.put(items, timeout=settings.PARTITION_TIMEOUT)
+                    return True
+                except queue.Full:
+                    pass
+            return False
+
+        try:
+            with self.engine.begin() as conn:
+                result = conn.execute(query)
+                for items in result.partitions():
+                    if not put([list(item) for item in items]):
+                        return
+            put(None)
+        except Exception as exception:
+            put(exception)
 
     # Write
 
     def write_package(self, package: Package):
+        self.reflect()
         with self.engine.begin() as conn:
             tables: List[Table] = []
             for res in package.resources:
@@ -105,11 +315,13 @@ class SqlAdapter(Adapter):
                 table = table.to_metadata(self.metadata)
                 tables.append(table)
             self.metadata.create_all(conn, tables=tables)
+        self.invalidate()
         for table in self.metadata.sorted_tables:
             if package.has_table_resource(table.name):
                 resource = package.get_table_resource(table.name)
                 with resource:
-                    self.write_row_stream(resource.row_stream, table_name=table.name)
+                    batch_stream = resource.batch_stream(size=settings.BUFFER_SIZE)
+                    self.write_batch_stream(batch_stream, table_name=table.name)
         return PublishResult(
             url=self.engine.url.render_as_string(hide_password=True),
             context=dict(engine=self.engine),
@@ -124,6 +336,7 @@ class SqlAdapter(Adapter):
         with_metadata: bool = False,
         ignore_constraints: bool = False,
     ) -> None:
+        self.reflect(table_name)
         with self.engine.begin() as conn:
             if force:
                 existing_table = self.metadata.tables.get(table_name)
@@ -138,6 +351,7 @@ class SqlAdapter(Adapter):
             )
             table = table.to_metadata(self.metadata)
             self.metadata.create_all(conn, tables=[table])
+        self.invalidate(table_name)
 
     def write_row_stream(
         self,
@@ -146,18 +360,34 @@ class SqlAdapter(Adapter):
         table_name: str,
         on_row: Optional[Callable[[Row], None]] = None,
     ) -> None:
-        sa = platform.sqlalchemy
+        self.reflect(table_name)
         with self.engine.begin() as conn:
-            buffer: List[Dict[str, Any]] = []
+            writer: Optional[SqlWriter] = None
             table = self.metadata.tables[table_name]
             for row in row_stream:
-                buffer.append(self.mapper.write_row(row))
-                if len(buffer) > settings.BUFFER_SIZE:
-                    conn.execute(sa.insert(table), buffer)
-                    buffer.clear()
+                if writer is None:
+                    writer = self.__create_writer(conn, table, row.fields)
+                writer.append([row[name] for name in row.field_names])
                 on_row(row) if on_row else None
-            if len(buffer):
-                conn.execute(sa.insert(table), buffer)
+            writer.flush() if writer else None
+
+    def write_batch_stream(
+        self,
+        batch_stream: IBatchStream,
+        *,
+        table_name: str,
+    ) -> None:
+        self.reflect(table_name)
+        with self.engine.begin() as conn:
+            writer: Optional[SqlWriter] = None
+            table = self.metadata.tables[table_name]
+            for batch in batch_stream:
+                if writer is None:
+                    writer = self.__create_writer(conn, table, batch.fields)
+                columns = [batch.columns[name] for name in batch.field_names]
+                for cells in zip(*columns):
+                    writer.append(cells)
+            writer.flush() if writer else None
 
     def write_resource_with_metadata(
         self,
@@ -166,28 +396,75 @@ class SqlAdapter(Adapter):
         table_name: str,
         on_row: Optional[Callable[[Row], None]] = None,
     ) -> Report:
-        sa = platform.sqlalchemy
+        self.reflect(table_name)
         with self.engine.begin() as conn:
+            table = self.metadata.tables[table_name]
+            writer = self.__create_writer(
+                conn, table, resource.schema.fields, with_metadata=True
+            )
+
             # Write row
             def process_row(row: Row):
-                buffer.append(self.mapper.write_row(row, with_metadata=True))
-                if len(buffer) > settings.BUFFER_SIZE:
-                    conn.execute(sa.insert(table), buffer)
-                    buffer.clear()
+                cells = [row.row_number, row.valid]
+                cells.extend(row[name] for name in row.field_names)
+                writer.append(cells)
                 on_row(row) if on_row else None
 
             # Validate/iterate
-            buffer: List[Dict[str, Any]] = []
-            table = self.metadata.tables[table_name]
             report = resource.validate(on_row=process_row)
-            if len(buffer):
-                conn.execute(sa.insert(table), buffer)
+            writer.flush()
 
             return report
 
+    def __create_writer(
+        self,
+        conn: Connection,
+        table: Table,
+        fields: List[Field],
+        *,
+        with_metadata: bool = False,
+    ) -> SqlWriter:
+        return SqlWriter(
+            conn,
+            table,
+            mapper=self.mapper,
+            fields=fields,
+            with_metadata=with_metadata,
+            batch_size=self.control.batch_size,
+        )
+
 
 # Internal
 
+ENGINES: Dict[str, Engine] = {}
+ENGINES_LOCK = threading.Lock()
+REFLECTIONS: weakref.WeakKeyDictionary[Engine, Dict[Optional[str], MetaData]] = (
+    weakref.WeakKeyDictionary()
+)
+REFLECTIONS_LOCK = threading.RLock()
+
+
+def collect_tables(table: Table, tables: Optional[List[Table]] = None) -> List[Table]:
+    # A table is collected along with tables referenced by its foreign keys
+    tables = tables if tables is not None else []
+    if table not in tables:
+        tables.append(table)
+        for fk in table.foreign_keys:
+            collect_tables(fk.column.table, tables)
+    return tables
+
+
+def is_memory_url(url: str) -> bool:
+    sa = platform.sqlalchemy
+    try:
+        parsed = sa.engine.make_url(url)
+    except sa.exc.ArgumentError:
+        return False
+    if parsed.get_backend_name() not in ["sqlite", "duckdb"]:
+        return False
+    database = parsed.database or ""
+    return database in ["", ":memory:"] or parsed.query.get("mode") == "memory"
+
 
 def regexp(expr: str, item: str):
     reg = re.compile(expr)
@@ -5,6 +5,7 @@ from typing import Optional
 import attrs
 
 from ...dialect import Control
+from . import settings
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -54,6 +55,32 @@ class SqlControl(Control):
     _rowNumber or _rowValid
     """
 
+    fetch_size: int = settings.BUFFER_SIZE
+    """
+    It specifies the number of rows fetched from the database at once
+    while reading. The default value is 1000.
+    """
+
+    partitions: int = 1
+    """
+    It specifies the number of partitions read in parallel threads.
+    A table is split by ranges of the `partition_by` column.
+    The default value is 1 (no partitioning).
+    """
+
+    partition_by: Optional[str] = None
+    """
+    Column used to split a table into partitions. Integer columns are split
+    into equal ranges and other columns are split using the NTILE window
+    function. It defaults to a single-column primary key if there is one.
+    """
+
+    batch_size: int = settings.BUFFER_SIZE
+    """
+    It specifies the number of rows written to the database at once.
+    The default value is 1000.
+    """
+
     # Metadata
 
     metadata_profile_patch = {
@@ -65,5 +92,9 @@ class SqlControl(Control):
             "namespace": {"type": "string"},
             "basepath": {"type": "string"},
             "withMetadata": {"type": "boolean"},
+            "fetchSize": {"type": "integer"},
+            "partitions": {"type": "integer"},
+            "partitionBy": {"type": "string"},
+            "batchSize": {"type": "integer"},
         },
     }
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Type
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type
 
 from ...platform import platform
 from ...schema import Field, Schema
@@ -318,27 +318,47 @@ class SqlMapper(Mapper):
 
     def write_row(self, row: Row, *, with_metadata: bool = False) -> Dict[str, Any]:
         """Convert frictionless Row to a sqlalchemy Item for insertion"""
-        sa = platform.sqlalchemy
         item = {}
         if with_metadata:
             item["_rowNumber"] = row.row_number
             item["_rowValid"] = row.valid
         for field in row.fields:
-            cell = row[field.name]
-            if cell is not None:
-                column_type = self.write_type(field.type)  # type: ignore
-                if field.type != "string" and column_type is sa.Text:
-                    cell, _ = field.write_cell(cell)
-                elif field.type in ["object", "geojson"]:
-                    cell = json.dumps(cell)
-                elif field.type == "datetime":
-                    if cell.tzinfo is not None:
-                        dt = cell.astimezone(timezone.utc)
-                        cell = dt.replace(tzinfo=None)
-                elif field.type == "time":
-                    if cell.tzinfo is not None:
-                        dt = datetime.combine(date.min, cell)
-                        dt = dt.astimezone(timezone.utc)
-                        cell = dt.time()
-            item[field.name] = cell
+            column_type = self.write_type(field.type)  # type: ignore
+            item[field.name] = self.write_cell(row[field.name], field, column_type)
         return item  # type: ignore
+
+    def create_cell_writer(self, field: Field) -> Optional[Callable[[Any], Any]]:
+        """Create a function converting frictionless cells for insertion
+
+        It's a precomputed version of "write_cell" for a field.
+        It returns None if cells don't need to be converted.
+        """
+        sa = platform.sqlalchemy
+        column_type = self.write_type(field.type)
+        if field.type != "string" and column_type is sa.Text:
+            value_writer = field.create_value_writer()
+            return lambda cell: value_writer(cell) if cell is not None else None
+        elif field.type in ["object", "geojson"]:
+            return lambda cell: json.dumps(cell) if cell is not None else None
+        elif field.type in ["datetime", "time"]:
+            return lambda cell: self.write_cell(cell, field, column_type)
+        return None
+
+    def write_cell(self, cell: Any, field: Field, column_type: Type[TypeEngine]) -> Any:  # type: ignore
+        """Convert frictionless cell to a sqlalchemy value for insertion"""
+        sa = platform.sqlalchemy
+        if cell is not None:
+            if field.type != "string" and column_type is sa.Text:
+                cell, _ = field.write_cell(cell)
+            elif field.type in ["object", "geojson"]:
+                cell = json.dumps(cell)
+            elif field.type == "datetime":
+                if cell.tzinfo is not None:
+                    dt = cell.astimezone(timezone.utc)
+                    cell = dt.replace(tzinfo=None)
+            elif field.type == "time":
+                if cell.tzinfo is not None:
+                    dt = datetime.combine(date.min, cell)
+                    dt = dt.astimezone(timezone.utc)
+                    cell = dt.time()
+        return cell
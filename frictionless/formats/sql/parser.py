@@ -3,8 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from ...exception import FrictionlessException
-from ...platform import platform
 from ...system import Parser
+from . import settings
 from .adapter import SqlAdapter
 from .control import SqlControl
 
@@ -32,8 +32,7 @@ class SqlParser(Parser):
         control = SqlControl.from_dialect(self.resource.dialect)
         if not control.table:
             raise FrictionlessException('Please provide "dialect.sql.table" for reading')
-        engine = platform.sqlalchemy.create_engine(self.resource.normpath)
-        adapter = SqlAdapter(engine, control=control)
+        adapter = SqlAdapter.from_url(self.resource.normpath, control=control)
         if not adapter:
             raise FrictionlessException(f"Not supported source: {self.resource.normpath}")
         if not self.resource.schema:
@@ -47,10 +46,10 @@ class SqlParser(Parser):
         control = SqlControl.from_dialect(self.resource.dialect)
         if not control.table:
             raise FrictionlessException('Please provide "dialect.sql.table" for writing')
-        engine = platform.sqlalchemy.create_engine(self.resource.normpath)
-        adapter = SqlAdapter(engine, control=control)
+        adapter = SqlAdapter.from_url(self.resource.normpath, control=control)
         if not adapter:
             raise FrictionlessException(f"Not supported source: {self.resource.normpath}")
         with source:
             adapter.write_schema(source.schema, table_name=control.table)
-            adapter.write_row_stream(source.row_stream, table_name=control.table)
+            batch_stream = source.batch_stream(size=settings.BUFFER_SIZE)
+            adapter.write_batch_stream(batch_stream, table_name=control.table)
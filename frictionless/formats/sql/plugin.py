@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlparse
 
-from ...platform import platform
 from ...system import Plugin
 from . import settings
 from .adapter import SqlAdapter
@@ -33,8 +32,7 @@ class SqlPlugin(Plugin):
                 parsed = urlparse(source)
                 for prefix in settings.SCHEME_PREFIXES:
                     if parsed.scheme.startswith(prefix):
-                        engine = platform.sqlalchemy.create_engine(source)
-                        return SqlAdapter(engine, control=control)  # type: ignore
+                        return SqlAdapter.from_url(source, control=control)  # type: ignore
 
     def create_parser(self, resource: Resource):
         if resource.format == "sql":
@@ -7,6 +7,12 @@ ROW_NUMBER_IDENTIFIER = "_rowNumber"
 ROW_VALID_IDENTIFIER = "_rowValid"
 METADATA_IDENTIFIERS = [ROW_NUMBER_IDENTIFIER, ROW_VALID_IDENTIFIER]
 
+# Partitions
+
+PARTITION_WORKERS = 8
+PARTITION_PREFETCH = 4
+PARTITION_TIMEOUT = 0.1
+
 # Prefixes
 
 # https://docs.sqlalchemy.org/en/13/core/engines.html
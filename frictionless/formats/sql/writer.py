@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING, Any, Callable, List, Optional, Sequence, Tuple
+
+from ...exception import FrictionlessException
+from ...platform import platform
+from . import settings
+from .mapper import SqlMapper
+
+if TYPE_CHECKING:
+    from sqlalchemy import Connection, Table
+
+    from ...schema import Field
+
+
+class SqlWriter:
+    """Bulk writer of typed cells to a SQL table
+
+    Cells are converted using a conversion plan precomputed for the fields
+    and written in batches using a native bulk path if it's available:
+    - PostgreSQL: `COPY ... FROM STDIN`
+    - SQLite: `executemany` with a prepared statement
+    - DuckDB: Arrow ingestion (requires `pyarrow`)
+    Other databases use SQLAlchemy's `insert`.
+
+    Parameters:
+        connection (Connection): connection having an open transaction
+        table (Table): table to write to
+        mapper (SqlMapper): mapper of the adapter
+        fields (Field[]): fields of the written cells
+        with_metadata (bool): whether cells are prefixed by a row number and validity
+        batch_size (int): number of rows written at once
+    """
+
+    def __init__(
+        self,
+        connection: Connection,
+        table: Table,
+        *,
+        mapper: SqlMapper,
+        fields: List[Field],
+        with_metadata: bool = False,
+        batch_size: int = settings.BUFFER_SIZE,
+    ):
+        self.__connection = connection
+        self.__table = table
+        self.__batch_size = batch_size
+        self.__buffer: List[Sequence[Any]] = []
+
+        # Prepare columns
+        self.__names = [field.name for field in fields]
+        writers = [mapper.create_cell_writer(field) for field in fields]
+        if with_metadata:
+            self.__names = settings.METADATA_IDENTIFIERS + self.__names
+            writers = [None, None] + writers
+
+        # Prepare method
+        dialect = connection.dialect
+        if dialect.name == "postgresql":
+            self.__write = self.__write_postgresql
+            writers = [compose(writer, write_copy_value) for writer in writers]
+        elif dialect.name == "sqlite":
+            self.__write = self.__write_executemany
+            # Values are converted as SQLAlchemy does for its own statements
+            processors = [
+                table.c[name].type.dialect_impl(dialect).bind_processor(dialect)
+                for name in self.__names
+            ]
+            writers = list(map(compose, writers, processors))
+        elif dialect.name == "duckdb" and has_pyarrow():
+            self.__write = self.__write_arrow
+        else:
+            self.__write = self.__write_insert
+
+        # Prepare plan
+        # Only the columns needing a conversion are processed
+        self.__plan: List[Tuple[int, Callable[[Any], Any]]] = [
+            (index, writer) for index, writer in enumerate(writers) if writer
+        ]
+
+    def append(self, cells: Sequence[Any]) -> None:
+        """Append cells of a row writing a batch if it's full"""
+        self.__buffer.append(cells)
+        if len(self.__buffer) >= self.__batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write appended rows"""
+        if self.__buffer:
+            items = self.__convert(self.__buffer)
+            self.__buffer = []
+            self.__write(items)
+
+    # Convert
+
+    def __convert(self, rows: List[Sequence[Any]]) -> List[List[Any]]:
+        items: List[List[Any]] = []
+        plan = self.__plan
+        for row in rows:
+            cells = list(row)
+            for index, writer in plan:
+                cells[index] = writer(cells[index])
+            items.append(cells)
+        return items
+
+    # Write
+
+    def __write_insert(self, items: List[List[Any]]):
+        sa = platform.sqlalchemy
+        names = self.__names
+        records = [dict(zip(names, cells)) for cells in items]
+        self.__connection.execute(sa.insert(self.__table), records)
+
+    def __write_executemany(self, items: List[List[Any]]):
+        preparer = self.__connection.dialect.identifier_preparer
+        table = preparer.format_table(self.__table)
+        columns = ", ".join(preparer.quote(name) for name in self.__names)
+        values = ", ".join("?" for _ in self.__names)
+        query = f"INSERT INTO {table} ({columns}) VALUES ({values})"
+        self.__connection.exec_driver_sql(query, [tuple(cells) for cells in items])
+
+    def __write_postgresql(self, items: List[List[Any]]):
+        preparer = self.__connection.dialect.identifier_preparer
+        table = preparer.format_table(self.__table)
+        columns = ", ".join(preparer.quote(name) for name in self.__names)
+        query = f"COPY {table} ({columns}) FROM STDIN"
+        data = "".join("\t".join(cells) + "\n" for cells in items)
+        cursor = self.__connection.connection.driver_connection.cursor()  # type: ignore
+        try:
+            # Support both psycopg3 and psycopg2
+            if hasattr(cursor, "copy_expert"):
+                cursor.copy_expert(query, io.StringIO(data))
+            else:
+                with cursor.copy(query) as copy:
+                    copy.write(data)
+        finally:
+            cursor.close()
+
+    def __write_arrow(self, items: List[List[Any]]):
+        pa = platform.pyarrow
+        try:
+            columns = list(zip(*items))
+            arrays = [pa.array(column) for column in columns]
+            batch = pa.Table.from_arrays(arrays, names=self.__names)
+        # Values that Arrow can't represent are inserted as is
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            return self.__write_insert(items)
+        preparer = self.__connection.dialect.identifier_preparer
+        table = preparer.format_table(self.__table)
+        columns = ", ".join(preparer.quote(name) for name in self.__names)
+        query = f"INSERT INTO {table} ({columns}) SELECT {columns} FROM {ARROW_VIEW}"
+        driver = self.__connection.connection.driver_connection  # type: ignore
+        driver.register(ARROW_VIEW, batch)
+        try:
+            self.__connection.exec_driver_sql(query)
+        finally:
+            driver.unregister(ARROW_VIEW)
+
+
+# Internal
+
+ARROW_VIEW = "frictionless_batch"
+
+
+def compose(
+    first: Optional[Callable[[Any], Any]], second: Optional[Callable[[Any], Any]]
+) -> Optional[Callable[[Any], Any]]:
+    if first and second:
+        return lambda value: second(first(value))
+    return first or second
+
+
+def has_pyarrow() -> bool:
+    try:
+        return bool(platform.pyarrow)
+    except FrictionlessException:
+        return False
+
+
+def write_copy_value(value: Any) -> str:
+    # https://www.postgresql.org/docs/current/sql-copy.html#id-1.9.3.55.9.2
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, str):
+        for char, escape in COPY_ESCAPES:
+            value = value.replace(char, escape)
+        return value
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return str(value)
+
+
+COPY_ESCAPES = [("\\", "\\\\"), ("\t", "\\t"), ("\n", "\\n"), ("\r", "\\r")]
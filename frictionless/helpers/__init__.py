@@ -1 +1,2 @@
+from .formula import Formula, compile_formula
 from .general import *
@@ -0,0 +1,93 @@
+import datetime
+import warnings
+from decimal import Decimal
+
+import pytest
+import simpleeval  # type: ignore
+
+from frictionless import helpers
+
+NAMES = {
+    "a": 1,
+    "b": 2.5,
+    "s": "hello",
+    "l": [1, 2, 3],
+    "d": {"x": 1},
+    "n": None,
+    "dec": Decimal("1.5"),
+    "dt": datetime.date(2020, 1, 2),
+}
+
+
+def evaluate(function):
+    try:
+        return ("result", function())
+    except Exception as exception:
+        return ("error", type(exception))
+
+
+# General
+
+
+@pytest.mark.parametrize("compound", [True, False])
+@pytest.mark.parametrize(
+    "source",
+    [
+        "a + b",
+        "a > 0 and b < 3 and s == 'hello'",
+        "a or n",
+        "n and a",
+        "not a",
+        "a < b < 3",
+        "1 < a < 0",
+        "a if n else b",
+        "s.upper()[1:3]",
+        "d['x'] + d.x + l[-1]",
+        "int('3') + a",
+        "dt.year + dec",
+        "f'{a}-{b:.2f}'",
+        "a in l and n is None",
+        "[x * 2 for x in l if x > 1]",
+        "{k: v for k, v in d.items()}",
+        "[[y for y in l] for x in l]",
+        "[1, *l] + [{1, 2}, (1, a), {'a': a, **d}]",
+        "x",
+        "foo()",
+        "s.__class__",
+        "s.format(1)",
+        "type(a)",
+        "lambda: 1",
+        "import os",
+        "import(os)",
+        "2 ** 10000000",
+        "'a' * 1000000",
+        "[x for x in range(3)]",
+        "a @ b",
+        "",
+    ],
+)
+def test_formula(source, compound):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        if compound:
+            evaluator = simpleeval.EvalWithCompoundTypes(names=dict(NAMES))
+        else:
+            evaluator = simpleeval.SimpleEval(names=dict(NAMES))
+        formula = helpers.Formula(source, compound=compound)
+        assert evaluate(lambda: formula(dict(NAMES))) == evaluate(
+            lambda: evaluator.eval(source)
+        )
+
+
+def test_formula_comprehension_limit():
+    formula = helpers.Formula("[x for x in l]")
+    assert formula({"l": list(range(10000))}) == list(range(10000))
+    with pytest.raises(simpleeval.IterableTooLong):
+        formula({"l": list(range(10001))})
+
+
+def test_compile_formula_cached():
+    formula = helpers.compile_formula("a + 1")
+    assert helpers.compile_formula("a + 1") is formula
+    assert formula({"a": 1}) == 2
+    assert formula({"a": 2}) == 3
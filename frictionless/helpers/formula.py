@@ -0,0 +1,467 @@
+from __future__ import annotations
+
+import ast
+import functools
+import types
+import warnings
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import simpleeval  # type: ignore
+
+IEvaluate = Callable[[Any], Any]
+
+
+class Formula:
+    """Python expression compiled to a function of names
+
+    The expression is parsed once and compiled to nested Python closures
+    following the semantics of the `simpleeval` evaluators and sharing their
+    safety guarantees: the operators, functions and limits of the evaluators
+    are used and forbidden names, attributes and functions are rejected.
+    As in `simpleeval`, errors (including syntax errors) are raised
+    on evaluation so a formula can be created for any string.
+
+    Parameters:
+        source (str): Python expression
+        compound (bool): support compound types as `EvalWithCompoundTypes`
+    """
+
+    def __init__(self, source: str, *, compound: bool = True):
+        self.source = source
+        self.compound = compound
+        self.__scoped = False
+        try:
+            self.__evaluate = self.__compile_source()
+        except Exception as exception:
+            self.__evaluate = create_raise(exception)
+
+    def __call__(self, names: Any) -> Any:
+        """Evaluate the formula
+
+        Parameters:
+            names (dict): mapping of names (e.g. a row) used by the formula
+
+        Returns:
+            any: result
+        """
+        if self.__scoped:
+            names = Scope(names, counter=[0])
+        return self.__evaluate(names)
+
+    # Compile
+
+    def __compile_source(self) -> IEvaluate:
+        if self.compound:
+            evaluator = simpleeval.EvalWithCompoundTypes()  # type: ignore
+        else:
+            evaluator = simpleeval.SimpleEval()  # type: ignore
+        self.__operators: Dict[Any, Any] = evaluator.operators  # type: ignore
+        self.__functions: Dict[str, Any] = evaluator.functions  # type: ignore
+        self.__attr_index_fallback = getattr(evaluator, "ATTR_INDEX_FALLBACK", True)
+        node = simpleeval.SimpleEval.parse(self.source)  # type: ignore
+        if isinstance(node, ast.Expr):
+            return self.__compile(node.value)
+        if isinstance(node, (ast.Assign, ast.AugAssign)):
+            message = f"Assignment ({self.source}) attempted, but this is ignored"
+            warnings.warn(message, simpleeval.AssignmentAttempted)  # type: ignore
+            return self.__compile(node.value)
+        if isinstance(node, ast.Import):
+            return create_raise(FeatureNotAvailable("Sorry, 'import' is not allowed."))
+        return self.__compile(node)
+
+    def __compile(self, node: ast.AST) -> IEvaluate:
+        name = type(node).__name__
+        method = getattr(self, f"_Formula__compile_{name.lower()}", None)
+        if method is None or (compound_node(node) and not self.compound):
+            note = f"Sorry, {name} is not available in this evaluator"
+            return create_raise(FeatureNotAvailable(note))
+        return method(node)
+
+    def __compile_constant(self, node: ast.Constant) -> IEvaluate:
+        value = node.value
+        if hasattr(value, "__len__") and len(value) > MAX_STRING_LENGTH:
+            note = f"Literal in statement is too long! ({len(value)}, when {MAX_STRING_LENGTH} is max)"
+            return create_raise(IterableTooLong(note))
+        return lambda names: value
+
+    def __compile_name(self, node: ast.Name) -> IEvaluate:
+        name = node.id
+        functions = self.__functions
+        source = self.source
+
+        def evaluate(names: Any):
+            try:
+                value = names[name]
+            except (TypeError, KeyError):
+                if not hasattr(names, "__getitem__"):
+                    note = f'Trying to use name (variable) "{name}" when no "names" defined for evaluator'
+                    raise InvalidExpression(note)
+                if name in functions:
+                    return functions[name]
+                raise NameNotDefined(name, source)
+            if type(value) not in PRIMITIVE_TYPES:
+                check_item(value)
+            return value
+
+        return evaluate
+
+    def __compile_unaryop(self, node: ast.UnaryOp) -> IEvaluate:
+        operator = self.__operators.get(type(node.op))
+        if operator is None:
+            return create_raise(OperatorNotDefined(node.op, self.source))
+        operand = self.__compile(node.operand)
+        return lambda names: operator(operand(names))
+
+    def __compile_binop(self, node: ast.BinOp) -> IEvaluate:
+        operator = self.__operators.get(type(node.op))
+        if operator is None:
+            return create_raise(OperatorNotDefined(node.op, self.source))
+        left = self.__compile(node.left)
+        right = self.__compile(node.right)
+        return lambda names: operator(left(names), right(names))
+
+    def __compile_boolop(self, node: ast.BoolOp) -> IEvaluate:
+        values = [self.__compile(value) for value in node.values]
+        is_and = isinstance(node.op, ast.And)
+
+        def evaluate(names: Any):
+            result = False
+            for value in values:
+                result = value(names)
+                if bool(result) is not is_and:
+                    break
+            return result
+
+        return evaluate
+
+    def __compile_compare(self, node: ast.Compare) -> IEvaluate:
+        left = self.__compile(node.left)
+        pairs: List[Tuple[Any, IEvaluate]] = []
+        for operation, comparator in zip(node.ops, node.comparators):
+            operator = self.__operators.get(type(operation))
+            if operator is None:
+                return create_raise(KeyError(type(operation)))
+            pairs.append((operator, self.__compile(comparator)))
+        if len(pairs) == 1:
+            operator, right = pairs[0]
+            return lambda names: operator(left(names), right(names))
+
+        def evaluate(names: Any):
+            right = left(names)
+            result = True
+            for operator, comparator in pairs:
+                if not result:
+                    break
+                value = right
+                right = comparator(names)
+                result = operator(value, right)
+            return result
+
+        return evaluate
+
+    def __compile_ifexp(self, node: ast.IfExp) -> IEvaluate:
+        test = self.__compile(node.test)
+        body = self.__compile(node.body)
+        orelse = self.__compile(node.orelse)
+        return lambda names: body(names) if test(names) else orelse(names)
+
+    def __compile_call(self, node: ast.Call) -> IEvaluate:
+        if isinstance(node.func, ast.Attribute):
+            function = self.__compile(node.func)
+        elif isinstance(node.func, ast.Name):
+            if node.func.id not in self.__functions:
+                return create_raise(FunctionNotDefined(node.func.id, self.source))
+            value = self.__functions[node.func.id]
+            if value in DISALLOW_FUNCTIONS:
+                return create_raise(FeatureNotAvailable("This function is forbidden"))
+            function = lambda names: value
+        else:
+            note = "Lambda Functions not implemented"
+            return create_raise(FeatureNotAvailable(note))
+        args = [self.__compile(arg) for arg in node.args]
+        keywords = [(item.arg, self.__compile(item.value)) for item in node.keywords]
+
+        def evaluate(names: Any):
+            result = function(names)(
+                *[arg(names) for arg in args],
+                **dict((name, value(names)) for name, value in keywords),  # type: ignore
+            )
+            if type(result) not in PRIMITIVE_TYPES:
+                check_item(result)
+            return result
+
+        return evaluate
+
+    def __compile_subscript(self, node: ast.Subscript) -> IEvaluate:
+        container = self.__compile(node.value)
+        index = node.slice
+        if AstIndex is not None and isinstance(index, AstIndex):
+            index = index.value  # type: ignore
+        key = self.__compile(index)
+
+        def evaluate(names: Any):
+            result = container(names)[key(names)]
+            if type(result) not in PRIMITIVE_TYPES:
+                check_item(result)
+            return result
+
+        return evaluate
+
+    def __compile_slice(self, node: ast.Slice) -> IEvaluate:
+        none: IEvaluate = lambda names: None
+        lower = self.__compile(node.lower) if node.lower is not None else none
+        upper = self.__compile(node.upper) if node.upper is not None else none
+        step = self.__compile(node.step) if node.step is not None else none
+        return lambda names: slice(lower(names), upper(names), step(names))
+
+    def __compile_attribute(self, node: ast.Attribute) -> IEvaluate:
+        attr = node.attr
+        source = self.source
+        fallback = self.__attr_index_fallback
+        for prefix in DISALLOW_PREFIXES:
+            if attr.startswith(prefix):
+                note = f"Sorry, access to __attributes  or func_ attributes is not available. ({attr})"
+                return create_raise(FeatureNotAvailable(note))
+        if attr in DISALLOW_METHODS:
+            note = f"Sorry, this method is not available. ({attr})"
+            return create_raise(FeatureNotAvailable(note))
+        value = self.__compile(node.value)
+
+        def evaluate(names: Any):
+            target = value(names)
+            try:
+                item = getattr(target, attr)
+            except (AttributeError, TypeError):
+                item = MISSING
+                if fallback:
+                    try:
+                        item = target[attr]
+                    except (KeyError, TypeError):
+                        pass
+                if item is MISSING:
+                    raise AttributeDoesNotExist(attr, source)
+            if isinstance(item, types.ModuleType):
+                note = "Sorry, modules are not allowed in attribute access"
+                raise FeatureNotAvailable(note)
+            if callable(item) and item in DISALLOW_FUNCTIONS:
+                raise FeatureNotAvailable("This function is forbidden")
+            if type(item) not in PRIMITIVE_TYPES:
+                check_item(item)
+            return item
+
+        return evaluate
+
+    def __compile_joinedstr(self, node: ast.JoinedStr) -> IEvaluate:
+        values = [self.__compile(value) for value in node.values]
+
+        def evaluate(names: Any):
+            length = 0
+            parts: List[str] = []
+            for value in values:
+                part = str(value(names))
+                length += len(part)
+                if length > MAX_STRING_LENGTH:
+                    note = "Sorry, I will not evaluate something this long."
+                    raise IterableTooLong(note)
+                parts.append(part)
+            return "".join(parts)
+
+        return evaluate
+
+    def __compile_formattedvalue(self, node: ast.FormattedValue) -> IEvaluate:
+        value = self.__compile(node.value)
+        if not node.format_spec:
+            return value
+        spec = self.__compile(node.format_spec)
+        return lambda names: ("{:" + spec(names) + "}").format(value(names))
+
+    # Compound
+
+    def __compile_tuple(self, node: ast.Tuple) -> IEvaluate:
+        items = [self.__compile(item) for item in node.elts]
+        return lambda names: tuple(item(names) for item in items)
+
+    def __compile_set(self, node: ast.Set) -> IEvaluate:
+        items = [self.__compile(item) for item in node.elts]
+        return lambda names: {item(names) for item in items}
+
+    def __compile_list(self, node: ast.List) -> IEvaluate:
+        items: List[Tuple[bool, IEvaluate]] = []
+        for item in node.elts:
+            if isinstance(item, ast.Starred):
+                items.append((True, self.__compile(item.value)))
+            else:
+                items.append((False, self.__compile(item)))
+
+        def evaluate(names: Any):
+            result: List[Any] = []
+            for starred, item in items:
+                if starred:
+                    result.extend(item(names))
+                else:
+                    result.append(item(names))
+            return result
+
+        return evaluate
+
+    def __compile_dict(self, node: ast.Dict) -> IEvaluate:
+        items: List[Tuple[Optional[IEvaluate], IEvaluate]] = []
+        for key, value in zip(node.keys, node.values):
+            compiled_key = self.__compile(key) if key is not None else None
+            items.append((compiled_key, self.__compile(value)))
+
+        def evaluate(names: Any):
+            result: Dict[Any, Any] = {}
+            for key, value in items:
+                if key is None:
+                    result.update(value(names))
+                else:
+                    result[key(names)] = value(names)
+            return result
+
+        return evaluate
+
+    def __compile_listcomp(self, node: ast.ListComp) -> IEvaluate:
+        return self.__compile_comprehension(node, element=self.__compile(node.elt))
+
+    def __compile_generatorexp(self, node: ast.GeneratorExp) -> IEvaluate:
+        return self.__compile_comprehension(node, element=self.__compile(node.elt))
+
+    def __compile_dictcomp(self, node: ast.DictComp) -> IEvaluate:
+        key = self.__compile(node.key)
+        value = self.__compile(node.value)
+        return self.__compile_comprehension(node, element=value, key=key)
+
+    # Comprehension names are resolved using a scope chained to the outer names
+    def __compile_comprehension(
+        self, node: Any, *, element: IEvaluate, key: Optional[IEvaluate] = None
+    ) -> IEvaluate:
+        self.__scoped = True
+        generators: List[Tuple[ast.AST, IEvaluate, List[IEvaluate]]] = []
+        for generator in node.generators:
+            iterator = self.__compile(generator.iter)
+            ifs = [self.__compile(condition) for condition in generator.ifs]
+            generators.append((generator.target, iterator, ifs))
+
+        def evaluate(names: Scope):
+            scope = Scope(names, counter=names.counter)
+            result: Any = {} if key is not None else []
+
+            def generate(index: int):
+                target, iterator, ifs = generators[index]
+                for item in iterator(scope):
+                    scope.counter[0] += 1
+                    if scope.counter[0] > MAX_COMPREHENSION_LENGTH:
+                        note = "Comprehension generates too many elements"
+                        raise IterableTooLong(note)
+                    assign_target(scope.names, target, item)
+                    if all(condition(scope) for condition in ifs):
+                        if len(generators) > index + 1:
+                            generate(index + 1)
+                        elif key is not None:
+                            result[key(scope)] = element(scope)
+                        else:
+                            result.append(element(scope))
+
+            generate(0)
+            return result
+
+        return evaluate
+
+
+@functools.lru_cache(maxsize=256)
+def compile_formula(source: str, *, compound: bool = True) -> Formula:
+    """Compile a formula caching the result
+
+    Parameters:
+        source (str): Python expression
+        compound (bool): support compound types as `EvalWithCompoundTypes`
+
+    Returns:
+        Formula: compiled formula
+    """
+    return Formula(source, compound=compound)
+
+
+# Internal
+
+
+class Scope:
+    __slots__ = ["names", "outer", "counter"]
+
+    def __init__(self, outer: Any, *, counter: List[int]):
+        self.names: Dict[str, Any] = {}
+        self.outer = outer
+        self.counter = counter
+
+    def __getitem__(self, name: str):
+        if name in self.names:
+            return self.names[name]
+        return self.outer[name]
+
+
+def assign_target(names: Dict[str, Any], target: Any, value: Any):
+    if isinstance(target, ast.Name):
+        names[target.id] = value
+    else:
+        for item, item_value in zip(target.elts, value):
+            assign_target(names, item, item_value)
+
+
+def check_item(item: Any):
+    if type(item) in PRIMITIVE_TYPES:
+        return
+    if ModuleWrapper is not None and isinstance(item, ModuleWrapper):
+        return
+    if isinstance(item, types.ModuleType):
+        raise FeatureNotAvailable("Sorry, modules are not allowed")
+    if isinstance(item, (list, tuple, set, frozenset)):
+        for element in item:
+            check_item(element)
+    elif isinstance(item, dict):
+        for value in item.values():
+            check_item(value)
+    elif callable(item) and item in DISALLOW_FUNCTIONS:
+        raise FeatureNotAvailable("This function is forbidden")
+
+
+def compound_node(node: ast.AST) -> bool:
+    return isinstance(
+        node,
+        (
+            ast.Dict,
+            ast.Tuple,
+            ast.List,
+            ast.Set,
+            ast.ListComp,
+            ast.GeneratorExp,
+            ast.DictComp,
+        ),
+    )
+
+
+# The traceback is reset to not grow on every evaluation
+def create_raise(exception: Exception) -> IEvaluate:
+    def evaluate(names: Any):
+        raise exception.with_traceback(None)
+
+    return evaluate
+
+
+# Older versions of simpleeval don't have some of the limits
+FeatureNotAvailable = simpleeval.FeatureNotAvailable  # type: ignore
+FunctionNotDefined = simpleeval.FunctionNotDefined  # type: ignore
+NameNotDefined = simpleeval.NameNotDefined  # type: ignore
+AttributeDoesNotExist = simpleeval.AttributeDoesNotExist  # type: ignore
+InvalidExpression = simpleeval.InvalidExpression  # type: ignore
+IterableTooLong = simpleeval.IterableTooLong  # type: ignore
+OperatorNotDefined = getattr(simpleeval, "OperatorNotDefined", KeyError)
+ModuleWrapper = getattr(simpleeval, "ModuleWrapper", None)
+MAX_STRING_LENGTH = simpleeval.MAX_STRING_LENGTH  # type: ignore
+MAX_COMPREHENSION_LENGTH = getattr(simpleeval, "MAX_COMPREHENSION_LENGTH", 10000)
+DISALLOW_PREFIXES = getattr(simpleeval, "DISALLOW_PREFIXES", ["_", "func_"])
+DISALLOW_METHODS = getattr(simpleeval, "DISALLOW_METHODS", [])
+DISALLOW_FUNCTIONS = simpleeval.DISALLOW_FUNCTIONS  # type: ignore
+PRIMITIVE_TYPES = frozenset({int, float, str, bool, type(None), bytes, complex})
+AstIndex = getattr(ast, "Index", None)
+MISSING = object()
@@ -332,6 +332,20 @@ def parse_resource_hash_v1(hash: str) -> Tuple[str, str]:
     return parts[0], parts[1]
 
 
+def parse_hashing_algorithms(hashing: str, *, hash: Optional[str] = None) -> List[str]:
+    if hashing == "auto":
+        if hash:
+            algorithm, _ = parse_resource_hash_v1(hash)
+            if algorithm in ["md5", "sha256"]:
+                return [algorithm]
+        return []
+    if hashing == "both":
+        return ["md5", "sha256"]
+    if hashing in ["md5", "sha256"]:
+        return [hashing]
+    return []
+
+
 class Timer:
     def __init__(self):
         self.__start = datetime.datetime.now()
@@ -34,13 +34,13 @@ class Indexer:
     adapter: SqlAdapter = attrs.field(init=False)
 
     def __attrs_post_init__(self):
-        sa = platform.sqlalchemy
+        SqlAdapter = platform.frictionless_formats.SqlAdapter
         if self.resource.format != "csv":
             self.fast = False
-        engine = self.database
-        if isinstance(engine, str):
-            engine = sa.create_engine(engine)
-        self.adapter = platform.frictionless_formats.SqlAdapter(engine)
+        if isinstance(self.database, str):
+            self.adapter = SqlAdapter.from_url(self.database)
+        else:
+            self.adapter = SqlAdapter(self.database)
 
     # Index
 
@@ -492,6 +492,37 @@ class Package(Metadata, metaclass=Factory):
             limit_errors=limit_errors,
         )
 
+    async def avalidate(
+        self: Package,
+        checklist: Optional[Checklist] = None,
+        *,
+        name: Optional[str] = None,
+        concurrency: int = settings.DEFAULT_CONCURRENCY,
+        limit_rows: Optional[int] = None,
+        limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
+    ):
+        """Validate package asynchronously
+
+        Resources are validated concurrently overlapping network reads.
+
+        Parameters:
+            checklist? (checklist): a Checklist object
+            concurrency? (int): a number of resources validated at the same time
+
+        Returns:
+            Report: validation report
+
+        """
+        validator = Validator()
+        return await validator.avalidate_package(
+            self,
+            checklist=checklist,
+            name=name,
+            concurrency=concurrency,
+            limit_rows=limit_rows,
+            limit_errors=limit_errors,
+        )
+
     # Convert
 
     def to_copy(self, **options: Any) -> Self:
@@ -12,6 +12,7 @@ from ..system import system
 if TYPE_CHECKING:
     from ..package import Package
     from ..resource import Resource
+    from ..schema import Schema
 
 
 # NOTE:
@@ -23,7 +24,6 @@ if TYPE_CHECKING:
 # We might consider adding `process_schema/row` etc to the Step class
 
 
-# TODO: support something like "step.transform_resource_row"
 @attrs.define(kw_only=True, repr=False)
 class Step(Metadata):
     """Step representation.
@@ -80,6 +80,25 @@ class Step(Metadata):
         """
         pass
 
+    def create_row_transform(
+        self, schema: Schema
+    ) -> Optional[types.IRowTransformFunction]:
+        """Create row transform for the streaming mode
+
+        A step supporting the streaming mode updates the schema in-place
+        and returns a function transforming a list of typed cells
+        (it returns None to skip the row). Consecutive row transforms are
+        applied in a single pass. Other steps return None without updating
+        the schema and are applied using `transform_resource`.
+
+        Parameters:
+            schema (Schema): schema of the incoming rows
+
+        Returns:
+            function?: row transform
+        """
+        return None
+
     # Convert
 
     @classmethod
@@ -188,12 +188,30 @@ class Platform:
 
         return requests
 
+    @cached_property
+    def requests_adapters(self):
+        import requests.adapters
+
+        return requests.adapters
+
     @cached_property
     def requests_utils(self):
         import requests.utils
 
         return requests.utils
 
+    @cached_property
+    def urllib3(self):
+        import urllib3
+
+        return urllib3
+
+    @cached_property
+    def urllib3_exceptions(self):
+        import urllib3.exceptions
+
+        return urllib3.exceptions
+
     @cached_property
     def rfc3986(self):
         import rfc3986  # type: ignore
@@ -339,6 +357,41 @@ class Platform:
 
         return numpy
 
+    @cached_property
+    @extras(name="pandas")
+    def pyarrow(self):
+        import pyarrow  # type: ignore
+
+        return pyarrow
+
+    @cached_property
+    @extras(name="arrow")
+    def pyarrow_csv(self):
+        import pyarrow.csv  # type: ignore
+
+        return pyarrow.csv
+
+    @cached_property
+    @extras(name="arrow")
+    def pyarrow_ipc(self):
+        import pyarrow.ipc  # type: ignore
+
+        return pyarrow.ipc
+
+    @cached_property
+    @extras(name="parquet")
+    def pyarrow_dataset(self):
+        import pyarrow.dataset  # type: ignore
+
+        return pyarrow.dataset
+
+    @cached_property
+    @extras(name="parquet")
+    def pyarrow_parquet(self):
+        import pyarrow.parquet  # type: ignore
+
+        return pyarrow.parquet
+
     @cached_property
     @extras(name="parquet")
     def fastparquet(self):
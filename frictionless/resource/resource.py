@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import json
 import warnings
 from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Optional, Union, cast
@@ -264,6 +265,14 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
     def __exit__(self, type, value, traceback):  # type: ignore
         self.close()
 
+    async def __aenter__(self):
+        if self.closed:
+            await self.aopen()
+        return self
+
+    async def __aexit__(self, type, value, traceback):  # type: ignore
+        await self.aclose()
+
     @property
     def paths(self) -> List[str]:
         """All paths of the resource"""
@@ -419,6 +428,20 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
             raise
         return self
 
+    async def aopen(self):
+        """Open the resource asynchronously
+
+        Network and disk reads run in a thread not blocking the event loop.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.open)
+        return self
+
+    async def aclose(self) -> None:
+        """Close the resource asynchronously"""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.close)
+
     # Convert
 
     @classmethod
@@ -499,7 +522,9 @@ class Resource(Metadata, metaclass=Factory):  # type: ignore
         if not self.closed:
             note = "Resource.infer cannot be used on a open resource"
             raise FrictionlessException(errors.ResourceError(note=note))
-        with self:
+        # The inferred hash is always sha256
+        hashing = "both" if system.hashing in ["md5", "both"] else "sha256"
+        with system.use_context(hashing=hashing), self:
             if not stats:
                 return
             helpers.pass_through(self.byte_stream)
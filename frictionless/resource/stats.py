@@ -33,3 +33,8 @@ class ResourceStats:
     """
     Number of rows in a resource.
     """
+
+    seconds: Optional[float] = None
+    """
+    Time spent on opening a resource including metadata detection.
+    """
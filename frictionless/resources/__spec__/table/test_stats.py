@@ -2,7 +2,7 @@ import sys
 
 import pytest
 
-from frictionless import Dialect
+from frictionless import Dialect, system
 from frictionless.resources import TableResource
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
@@ -29,6 +29,45 @@ def test_resource_stats_hash_compressed():
         )
 
 
+def test_resource_stats_hash_hashing_none():
+    with system.use_context(hashing="none"):
+        with TableResource(path="data/doublequote.csv") as resource:
+            resource.read_rows()
+            assert resource.stats.md5 is None
+            assert resource.stats.sha256 is None
+            assert resource.stats.bytes == 7346
+
+
+def test_resource_stats_hash_hashing_auto():
+    hash = "sha256:41fdde1d8dbcb3b2d4a1410acd7ad842781f076076a73b049863d6c1c73868db"
+    with system.use_context(hashing="auto"):
+        with TableResource(path="data/doublequote.csv", hash=hash) as resource:
+            resource.read_rows()
+            assert resource.stats.md5 is None
+            assert resource.stats.sha256 == hash.split(":")[1]
+
+
+def test_resource_stats_hash_hashing_thread():
+    with system.use_context(hashing_thread=True):
+        with TableResource(path="data/doublequote.csv") as resource:
+            resource.read_rows()
+            assert resource.stats.md5 == "d82306001266c4343a2af4830321ead8"
+            assert (
+                resource.stats.sha256
+                == "41fdde1d8dbcb3b2d4a1410acd7ad842781f076076a73b049863d6c1c73868db"
+            )
+
+
+def test_resource_stats_hash_hashing_none_infer():
+    resource = TableResource(path="data/doublequote.csv")
+    with system.use_context(hashing="none"):
+        resource.infer(stats=True)
+    assert (
+        resource.hash
+        == "sha256:41fdde1d8dbcb3b2d4a1410acd7ad842781f076076a73b049863d6c1c73868db"
+    )
+
+
 @pytest.mark.vcr
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="pytest-vcr bug in Python3.8/9")
 def test_resource_stats_hash_remote():
@@ -52,6 +91,11 @@ def test_resource_stats_bytes_compressed():
         assert resource.stats.bytes == 1265
 
 
+def test_resource_stats_seconds():
+    with TableResource(path="data/doublequote.csv") as resource:
+        assert isinstance(resource.stats.seconds, float)
+
+
 @pytest.mark.vcr
 @pytest.mark.skipif(sys.version_info < (3, 10), reason="pytest-vcr bug in Python3.8/9")
 def test_resource_stats_bytes_remote():
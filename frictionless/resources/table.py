@@ -1,9 +1,24 @@
 from __future__ import annotations
 
 import builtins
+import hashlib
+import json
 import os
 import warnings
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+from functools import partial
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import attrs
 
 from frictionless.schema.field import Field
 
@@ -14,8 +29,11 @@ from ..exception import FrictionlessException
 from ..indexer import Indexer
 from ..platform import platform
 from ..resource import Resource
+from ..schema import Schema
 from ..system import system
-from ..table import Header, Lookup, Row, Table
+from ..system.cache import InferenceCache
+from ..table import Batch, CompactRow, Header, Lookup, Row, Table
+from ..table.keys import KeyMap, KeyMemory, KeySet
 from ..transformer import Transformer
 from ..validator import Validator
 
@@ -25,7 +43,7 @@ if TYPE_CHECKING:
     from ..indexer import IOnProgress, IOnRow
     from ..pipeline import Pipeline
     from ..system import Loader, Parser
-    from ..table import IRowStream
+    from ..table import IBatchStream, IRowStream
 
 
 class TableResource(Resource):
@@ -43,6 +61,10 @@ class TableResource(Resource):
         self.__header: Optional[Header] = None
         self.__lookup: Optional[Lookup] = None
         self.__row_stream: Optional[IRowStream] = None
+        self.__batch_stream: Optional[Callable[[int], IBatchStream]] = None
+        self.__inference_key: Optional[str] = None
+        self.__inference: Optional[types.IDescriptor] = None
+        self.__key_memory: Optional[KeyMemory] = None
         super().__attrs_post_init__()
 
     # Open/Close
@@ -138,6 +160,23 @@ class TableResource(Resource):
             raise FrictionlessException("resource is not open")
         return self.__row_stream
 
+    def batch_stream(self, *, size: int = settings.DEFAULT_BATCH_SIZE) -> IBatchStream:
+        """Batch stream in form of a generator of Batch objects
+
+        It's an alternative to the row stream reading the same data
+        in column-oriented chunks. Only one of the streams can be
+        consumed after the resource is opened.
+
+        Parameters:
+            size (int): maximum amount of rows in a batch
+
+        Yields:
+            gen<Batch[]>?: batch stream
+        """
+        if self.__batch_stream is None:
+            raise FrictionlessException("resource is not open")
+        return self.__batch_stream(size)
+
     @property
     def closed(self) -> bool:
         """Whether the table is closed
@@ -159,7 +198,9 @@ class TableResource(Resource):
     def open(self):
         """Open the resource as "io.open" does"""
         self.close()
+        timer = helpers.Timer()
         try:
+            self.__open_inference()
             self.__open_parser()
             self.__open_buffer()
             self.__open_sample()
@@ -167,14 +208,55 @@ class TableResource(Resource):
             self.__open_labels()
             self.__open_fragment()
             self.__open_schema()
+            self.__save_inference()
             self.__open_header()
             self.__open_lookup()
             self.__open_row_stream()
         except Exception:
             self.close()
             raise
+        self.stats.seconds = timer.time
         return self
 
+    def __open_inference(self):
+        self.__inference_key = None
+        self.__inference = None
+
+        # Prepare key
+        # The key covers the file state and all the options affecting detection
+        if not system.inference_cache or self.detector.encoding_function:
+            return
+        if not self.normpath or self.remote or self.multipart:
+            return
+        try:
+            stat = os.stat(self.normpath)
+        except OSError:
+            return
+        options = [
+            settings.VERSION,
+            self.normpath,
+            stat.st_size,
+            stat.st_mtime_ns,
+            self.format,
+            self.compression,
+            self.innerpath,
+            self.get_defined("encoding"),
+            self.dialect.to_descriptor(),
+            self.schema.to_descriptor(),
+            attrs.asdict(self.detector),
+            system.detect_field_candidates(),
+        ]
+        text = json.dumps(options, sort_keys=True, default=str)
+        self.__inference_key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+        # Read inference
+        cache = InferenceCache(system.inference_cache)
+        self.__inference = cache.read(self.__inference_key)
+        if self.__inference:
+            self.encoding = self.__inference["encoding"]
+            self.dialect = Dialect.from_descriptor(self.__inference["dialect"])
+            self.schema = Schema.from_descriptor(self.__inference["schema"])
+
     def __open_parser(self):
         self.__parser = system.create_parser(self)
         self.__parser.open()
@@ -191,7 +273,8 @@ class TableResource(Resource):
 
     def __open_dialect(self):
         self.metadata_assigned.add("dialect")
-        self.dialect = self.detector.detect_dialect(self.sample, dialect=self.dialect)
+        if not self.__inference:
+            self.dialect = self.detector.detect_dialect(self.sample, dialect=self.dialect)
 
     def __open_labels(self):
         self.__labels = self.dialect.read_labels(self.sample)
@@ -201,15 +284,25 @@ class TableResource(Resource):
 
     def __open_schema(self):
         self.metadata_assigned.add("schema")
-        self.schema = self.detector.detect_schema(
-            self.fragment,
-            labels=self.labels,
-            schema=self.schema,
-            field_candidates=system.detect_field_candidates(),
-            header_case=self.dialect.header_case,
-        )
+        if not self.__inference:
+            self.schema = self.detector.detect_schema(
+                self.fragment,
+                labels=self.labels,
+                schema=self.schema,
+                field_candidates=system.detect_field_candidates(),
+                header_case=self.dialect.header_case,
+            )
         self.stats.fields = len(self.schema.fields)
 
+    def __save_inference(self):
+        if self.__inference_key and not self.__inference:
+            cache = InferenceCache(system.inference_cache)  # type: ignore
+            inference: types.IDescriptor = {}
+            inference["encoding"] = self.encoding
+            inference["dialect"] = self.dialect.to_descriptor()
+            inference["schema"] = self.schema.to_descriptor()
+            cache.write(self.__inference_key, inference)
+
     def __open_header(self):
         assert self.__labels is not None
 
@@ -230,6 +323,9 @@ class TableResource(Resource):
                 raise FrictionlessException(error)
 
     def __open_lookup(self):
+        # Integrity keys of the lookup and the row stream share the memory limit
+        limit = system.limit_memory * 1024 * 1024
+        self.__key_memory = KeyMemory(limit=limit)
         self.__lookup = Lookup()
         for fk in self.schema.foreign_keys:
             # Prepare source
@@ -244,8 +340,11 @@ class TableResource(Resource):
                 if not self.package.has_resource(source_name):
                     note = f'failed to handle a foreign key for resource "{self.name}" as resource "{source_name}" does not exist'
                     raise FrictionlessException(errors.ResourceError(note=note))
-                source_res = self.package.get_resource(source_name)
+                reference = self.package.get_resource(source_name)
+                # The referenced resource might be in use (e.g. validated concurrently)
+                source_res = reference.to_copy()
             else:
+                reference = None
                 source_res = self.to_copy()
             if source_res.schema:
                 source_res.schema.foreign_keys = []
@@ -254,15 +353,23 @@ class TableResource(Resource):
             self.__lookup.setdefault(source_name, {})
             if source_key in self.__lookup[source_name]:
                 continue
-            self.__lookup[source_name][source_key] = set()
-            if not source_res:
-                continue
-            with source_res:
-                for row in source_res.row_stream:  # type: ignore
-                    cells = tuple(row.get(field_name) for field_name in source_key)  # type: ignore
-                    if set(cells) == {None}:  # type: ignore
-                        continue
-                    self.__lookup[source_name][source_key].add(cells)
+            read = partial(self.__read_lookup, source_res, source_key)
+            if reference and system.key_index:
+                keys = system.key_index.build(reference, source_key, read)
+            else:
+                keys = KeySet(memory=self.__key_memory)
+                read(keys)
+            self.__lookup[source_name][source_key] = keys
+
+    def __read_lookup(self, source: TableResource, key: Tuple[str, ...], keys: KeySet):
+        if not source:
+            return
+        with source:
+            for row in source.row_stream:  # type: ignore
+                cells = tuple(row.get(field_name) for field_name in key)  # type: ignore
+                if set(cells) == {None}:  # type: ignore
+                    continue
+                keys.add(cells)
 
     def __open_row_stream(self):
         # TODO: we need to rework this field_info / row code
@@ -285,13 +392,14 @@ class TableResource(Resource):
             )
 
         # Create state
-        memory_unique: Dict[str, Any] = {}
-        memory_primary: Dict[Tuple[Any], Any] = {}
+        assert self.__key_memory
+        memory_unique: Dict[str, KeyMap] = {}
+        memory_primary = KeyMap(memory=self.__key_memory)
         foreign_groups: List[Any] = []
         is_integrity = bool(self.schema.primary_key)
         for field in self.schema.fields:
             if field.constraints.get("unique"):
-                memory_unique[field.name] = {}
+                memory_unique[field.name] = KeyMap(memory=self.__key_memory)
                 is_integrity = True
         if self.__lookup:
             for fk in self.schema.foreign_keys:
@@ -307,102 +415,169 @@ class TableResource(Resource):
             self.cell_stream
         )
 
+        # Check integrity
+        # The cells are accessed using the "read_cell" function and the row
+        # is only requested via the "read_row" function if there is an error
+        def check_integrity(
+            row_number: int,
+            read_cell: Callable[[str], Any],
+            read_row: Callable[[], Row],
+        ):
+            # Unique Error
+            if memory_unique:
+                for field_name in memory_unique.keys():
+                    cell = read_cell(field_name)
+                    if cell is not None:
+                        match = memory_unique[field_name].replace(cell, row_number)
+                        if match:
+                            row = read_row()
+                            func = errors.UniqueError.from_row
+                            note = errors.UniqueError.match_note % match
+                            error = func(row, note=note, field_name=field_name)
+                            row.errors.append(error)
+
+            # Primary Key Error
+            if self.schema.primary_key:
+                try:
+                    labels = primary_key_labels
+                    cells = tuple(read_cell(label) for label in labels)
+                except KeyError:
+                    # Row does not have primary_key as label
+                    # There should already be a missing-label error in
+                    # in self.header corresponding to the schema primary key
+                    assert not self.header.valid
+                else:
+                    if set(cells) == {None}:
+                        row = read_row()
+                        note = 'cells composing the primary keys are all "None"'
+                        error = errors.PrimaryKeyError.from_row(row, note=note)
+                        row.errors.append(error)
+                    else:
+                        match = memory_primary.replace(cells, row_number)
+                        if match:
+                            row = read_row()
+                            note = errors.PrimaryKeyError.match_note % match
+                            error = errors.PrimaryKeyError.from_row(row, note=note)
+                            row.errors.append(error)
+
+            # Foreign Key Error
+            if foreign_groups:
+                for group in foreign_groups:
+                    group_lookup = self.lookup.get(group["sourceName"])
+                    if group_lookup:
+                        cells = tuple(read_cell(name) for name in group["targetKey"])
+                        if set(cells) == {None}:
+                            continue
+                        match = cells in group_lookup.get(group["sourceKey"], set())
+                        if not match:
+                            note = (
+                                'for "%s": values "%s" not found in the lookup table "%s" as "%s"'
+                                % (
+                                    ", ".join(group["targetKey"]),
+                                    ", ".join(str(d) for d in cells),
+                                    group["sourceName"],
+                                    ", ".join(group["sourceKey"]),
+                                )
+                            )
+
+                            row = read_row()
+                            error = errors.ForeignKeyError.from_row(
+                                row,
+                                note=note,
+                                field_names=list(group["targetKey"]),
+                                field_values=list(cells),
+                                reference_name=group["sourceName"],
+                                reference_field_names=list(group["sourceKey"]),
+                            )
+                            row.errors.append(error)
+
+        # Handle errors
+        def handle_errors(row: Row):
+            if system.onerror != "ignore":
+                if not row.valid:
+                    error = row.errors[0]
+                    if system.onerror == "raise":
+                        raise FrictionlessException(error)
+                    warnings.warn(error.message, UserWarning)
+
         # Create row stream
         def row_stream():
+            RowClass = CompactRow if system.compact_rows else Row
             self.stats.rows = 0
             for row_number, cells in enumerated_content_stream:
                 self.stats.rows += 1
 
-                row = Row(
+                row = RowClass(
                     cells,
                     field_info=field_info,
                     row_number=row_number,
                 )
 
-                # Unique Error
-                if is_integrity and memory_unique:
-                    for field_name in memory_unique.keys():
-                        cell = row[field_name]
-                        if cell is not None:
-                            match = memory_unique[field_name].get(cell)
-                            memory_unique[field_name][cell] = row.row_number
-                            if match:
-                                func = errors.UniqueError.from_row
-                                note = "the same as in the row at position %s" % match
-                                error = func(row, note=note, field_name=field_name)
-                                row.errors.append(error)
-
-                # Primary Key Error
-                if is_integrity and self.schema.primary_key:
-                    try:
-                        cells = self.primary_key_cells(row, self.dialect.header_case)
-                    except KeyError:
-                        # Row does not have primary_key as label
-                        # There should already be a missing-label error in
-                        # in self.header corresponding to the schema primary key
-                        assert not self.header.valid
-                    else:
-                        if set(cells) == {None}:
-                            note = 'cells composing the primary keys are all "None"'
-                            error = errors.PrimaryKeyError.from_row(row, note=note)
-                            row.errors.append(error)
-                        else:
-                            match = memory_primary.get(cells)
-                            memory_primary[cells] = row.row_number
-                            if match:
-                                note = "the same as in the row at position %s" % match
-                                error = errors.PrimaryKeyError.from_row(row, note=note)
-                                row.errors.append(error)
-
-                # Foreign Key Error
-                if is_integrity and foreign_groups:
-                    for group in foreign_groups:
-                        group_lookup = self.lookup.get(group["sourceName"])
-                        if group_lookup:
-                            cells = tuple(row[name] for name in group["targetKey"])
-                            if set(cells) == {None}:
-                                continue
-                            match = cells in group_lookup.get(group["sourceKey"], set())
-                            if not match:
-                                note = (
-                                    'for "%s": values "%s" not found in the lookup table "%s" as "%s"'
-                                    % (
-                                        ", ".join(group["targetKey"]),
-                                        ", ".join(str(d) for d in cells),
-                                        group["sourceName"],
-                                        ", ".join(group["sourceKey"]),
-                                    )
-                                )
-
-                                error = errors.ForeignKeyError.from_row(
-                                    row,
-                                    note=note,
-                                    field_names=list(group["targetKey"]),
-                                    field_values=list(cells),
-                                    reference_name=group["sourceName"],
-                                    reference_field_names=list(group["sourceKey"]),
-                                )
-                                row.errors.append(error)
+                # Check integrity
+                if is_integrity:
+                    check_integrity(row_number, row.__getitem__, lambda: row)
 
                 # Handle errors
-                if system.onerror != "ignore":
-                    if not row.valid:
-                        error = row.errors[0]
-                        if system.onerror == "raise":
-                            raise FrictionlessException(error)
-                        warnings.warn(error.message, UserWarning)
+                handle_errors(row)
 
                 # Yield row
                 yield row
 
+        # Create batch stream
+        def batch_stream(size: int):
+            self.stats.rows = 0
+            field_info["column_readers"] = {}
+            for field, *_ in field_info["mapping"].values():
+                column_reader = field.create_column_reader()
+                field_info["column_readers"][field.name] = column_reader
+            while True:
+                items = list(islice(enumerated_content_stream, size))
+                if not items:
+                    break
+                self.stats.rows += len(items)
+
+                batch = Batch(
+                    [cells for _, cells in items],
+                    field_info=field_info,
+                    row_numbers=[row_number for row_number, _ in items],
+                )
+
+                # Check integrity
+                if is_integrity:
+                    columns = batch.columns
+                    for index, row_number in enumerate(batch.row_numbers):
+                        check_integrity(
+                            row_number,
+                            lambda name: columns[name][index],
+                            partial(batch.get_row, index),
+                        )
+
+                # Handle errors
+                for row in batch.error_rows:
+                    handle_errors(row)
+
+                # Yield batch
+                yield batch
+
         if self.detector.schema_sync:
             # Missing required labels are not included in the
             # field_info parameter used for row creation
             for field in self.schema.fields:
                 self.remove_missing_required_label_from_field_info(field, field_info)
 
+        # Create primary key labels
+        primary_key_labels = self.schema.primary_key
+        if not self.dialect.header_case:
+            lower_primary_key = [pk.lower() for pk in self.schema.primary_key]
+            primary_key_labels = [
+                label
+                for label in field_info["names"]
+                if label.lower() in lower_primary_key
+            ]
+
         # Create row stream
         self.__row_stream = row_stream()
+        self.__batch_stream = batch_stream
 
     def remove_missing_required_label_from_field_info(
         self, field: Field, field_info: Dict[str, Any]
@@ -474,13 +649,19 @@ class TableResource(Resource):
                     break
             return result
 
-    def read_rows(self, *, size: Optional[int] = None) -> List[Row]:
+    def read_rows(
+        self, *, size: Optional[int] = None, compact: Optional[bool] = None
+    ) -> List[Row]:
         """Read rows into memory
 
+        Parameters:
+            size (int): maximum amount of rows to read
+            compact (bool): read memory efficient compact rows
+
         Returns:
             Row[]: table rows
         """
-        with helpers.ensure_open(self):
+        with system.use_context(compact_rows=compact), helpers.ensure_open(self):
             rows: List[Row] = []
             for row in self.row_stream:
                 rows.append(row)
@@ -531,7 +712,9 @@ class TableResource(Resource):
         if not self.closed:
             note = "Resource.infer cannot be used on a open resource"
             raise FrictionlessException(errors.ResourceError(note=note))
-        with self:
+        # The inferred hash is always sha256
+        hashing = "both" if system.hashing in ["md5", "both"] else "sha256"
+        with system.use_context(hashing=hashing), self:
             if not stats:
                 return
             helpers.pass_through(self.row_stream)
@@ -622,9 +805,23 @@ class TableResource(Resource):
 
     # Transform
 
-    def transform(self, pipeline: Pipeline):
+    def transform(self, pipeline: Pipeline, *, streaming: bool = False):
+        """Transform resource
+
+        By default, the steps preceding "table_normalize" receive cells as they
+        are in the source (e.g. strings for CSV). In the streaming mode, the source
+        is parsed once and all the steps receive typed cells as if the pipeline
+        started with "table_normalize" (invalid cells are None).
+
+        Parameters:
+            pipeline (Pipeline): transform pipeline
+            streaming (bool): parse the source once and fuse row transforms
+
+        Returns:
+            TableResource: transformed resource
+        """
         transformer = Transformer()
-        return transformer.transform_table_resource(self, pipeline)
+        return transformer.transform_table_resource(self, pipeline, streaming=streaming)
 
     # Validate
 
@@ -637,6 +834,8 @@ class TableResource(Resource):
         parallel: bool = False,
         limit_rows: Optional[int] = None,
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
     ):
         validator = Validator()
         return validator.validate_resource(
@@ -645,6 +844,8 @@ class TableResource(Resource):
             on_row=on_row,
             limit_rows=limit_rows,
             limit_errors=limit_errors,
+            batch_size=batch_size,
+            workers=workers,
         )
 
     # Export
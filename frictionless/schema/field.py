@@ -151,6 +151,72 @@ class Field(Metadata):
 
         return cell_reader
 
+    def read_column(self, column: List[Any]):
+        column_reader = self.create_column_reader()
+        return column_reader(column)
+
+    def create_column_reader(self) -> types.IColumnReader:
+        cell_reader = self.create_cell_reader()
+
+        # Create column value reader
+        # Vectorized readers are only used for fields without value constraints
+        # as the constraints are checked by the cell reader one by one
+        column_value_reader = None
+        constraints = set(self.supported_constraints).intersection(self.constraints)
+        if not constraints.difference(["required"]):
+            try:
+                column_value_reader = self.create_column_value_reader()
+            except FrictionlessException:
+                # NumPy is an optional dependency
+                column_value_reader = None
+
+        # Create missing values
+        missing_values = self.missing_values
+        if not self.has_defined("missing_values") and self.schema:
+            missing_values = self.schema.missing_values
+
+        # Create reader
+        def column_reader(column: List[Any]):
+            values: List[Any] = []
+            notes: List[types.INotes] = []
+
+            # Read fast path
+            fast_values: Dict[int, Any] = {}
+            if column_value_reader:
+                indexes = [
+                    index
+                    for index, cell in enumerate(column)
+                    if isinstance(cell, str) and cell not in missing_values
+                ]
+                if indexes:
+                    cells = [column[index] for index in indexes]
+                    result, mask = column_value_reader(cells)
+                    for position, index in enumerate(indexes):
+                        if not mask[position]:
+                            fast_values[index] = result[position]
+
+            # Read slow path
+            for index, cell in enumerate(column):
+                if index in fast_values:
+                    values.append(fast_values[index])
+                    notes.append(None)
+                    continue
+                value, cell_notes = cell_reader(cell)
+                values.append(value)
+                notes.append(cell_notes)
+
+            return values, notes
+
+        return column_reader
+
+    def create_column_value_reader(self) -> Optional[types.IColumnValueReader]:
+        """Create a vectorized value reader for a list of strings
+
+        It returns a list of values and an error mask; the cells
+        marked as errors are read by the scalar cell reader.
+        """
+        return None
+
     def create_value_reader(self) -> types.IValueReader:
         # Create reader
         def value_reader(cell: Any):
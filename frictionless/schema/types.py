@@ -112,6 +112,14 @@ class ICellReader(Protocol):
     def __call__(self, cell: Any) -> Tuple[Any, INotes]: ...
 
 
+class IColumnReader(Protocol):
+    def __call__(self, column: List[Any]) -> Tuple[List[Any], List[INotes]]: ...
+
+
+class IColumnValueReader(Protocol):
+    def __call__(self, column: List[str]) -> Tuple[List[Any], List[bool]]: ...
+
+
 class ICellWriter(Protocol):
     def __call__(
         self, cell: Any, *, ignore_missing: bool = False
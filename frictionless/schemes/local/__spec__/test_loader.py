@@ -1,7 +1,8 @@
 from importlib import import_module
 
-from frictionless import Resource
+from frictionless import Resource, schemes, system
 from frictionless.resources import TableResource
+from frictionless.system.loader import MappedByteStream
 
 # Read
 
@@ -24,3 +25,46 @@ def test_local_loader_pathlib_path():
             {"id": 1, "name": "english"},
             {"id": 2, "name": "中国人"},
         ]
+
+
+def test_local_loader_memory_map(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n")
+        for number in range(100000):
+            file.write(f"{number},name{number}\n")
+    rows = {}
+    stats = {}
+    with system.use_context(trusted=True):
+        for memory_map in [True, False]:
+            control = schemes.LocalControl(memory_map=memory_map)
+            with TableResource(path=path, control=control) as resource:
+                rows[memory_map] = [row.to_dict() for row in resource.row_stream]
+                stats[memory_map] = [
+                    resource.stats.md5,
+                    resource.stats.sha256,
+                    resource.stats.bytes,
+                    resource.stats.rows,
+                ]
+            with schemes.LocalLoader(resource) as loader:
+                assert hasattr(loader.byte_stream, "getbuffer") == memory_map
+    assert rows[True] == rows[False]
+    assert rows[True][-1] == {"id": 99999, "name": "name99999"}
+    assert stats[True] == stats[False]
+
+
+def test_local_loader_memory_map_byte_stream(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "wb") as file:
+        file.write(b"id,name\n1,english\n2,german\n")
+    with MappedByteStream(path) as byte_stream:
+        assert len(byte_stream) == 27
+        assert byte_stream.readline() == b"id,name\n"
+        assert byte_stream.read(3) == b"1,e"
+        with byte_stream.getbuffer() as view:
+            assert view[-9:] == b"2,german\n"
+        substream = byte_stream.substream(8, 18)
+        assert substream.read() == b"1,english\n"
+        substream.seek(2)
+        assert list(substream) == [b"english\n"]
+        assert byte_stream.read() == b"nglish\n2,german\n"
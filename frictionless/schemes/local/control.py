@@ -10,3 +10,17 @@ class LocalControl(Control):
     """Local control representation"""
 
     type = "local"
+
+    memory_map: bool = True
+    """
+    Reads files larger than 1MB using a memory mapping if set to True.
+    It is set to True by default.
+    """
+
+    # Metadata
+
+    metadata_profile_patch = {
+        "properties": {
+            "memoryMap": {"type": "boolean"},
+        },
+    }
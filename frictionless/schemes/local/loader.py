@@ -1,9 +1,14 @@
 from __future__ import annotations
 
 import io
+import os
+import stat
 
 from ... import helpers
 from ...system import Loader
+from ...system.loader import MappedByteStream
+from . import settings
+from .control import LocalControl
 
 
 class LocalLoader(Loader):
@@ -13,10 +18,23 @@ class LocalLoader(Loader):
 
     def read_byte_stream_create(self):
         assert self.resource.normpath
+        control = LocalControl.from_dialect(self.resource.dialect)
         scheme = "file://"
         path = self.resource.normpath
         if path.startswith(scheme):
             path = path.replace(scheme, "", 1)
+        # Large regular files are memory-mapped so the buffer, hashing
+        # and byte ranges are read directly from the mapping
+        if control.memory_map:
+            info = os.stat(path)
+            if (
+                stat.S_ISREG(info.st_mode)
+                and info.st_size >= settings.MEMORY_MAP_MIN_SIZE
+            ):
+                try:
+                    return MappedByteStream(path)
+                except (OSError, ValueError):
+                    pass
         byte_stream = io.open(path, "rb")
         return byte_stream
 
@@ -0,0 +1,5 @@
+from __future__ import annotations
+
+# General
+
+MEMORY_MAP_MIN_SIZE = 1048576
@@ -1,9 +1,13 @@
+import asyncio
 import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
-from frictionless import Dialect, platform, schemes
+from frictionless import Dialect, platform, schemes, system
 from frictionless.resources import TableResource
+from frictionless.schemes.remote.loader import RemoteByteStream
 
 BASEURL = "https://raw.githubusercontent.com/frictionlessdata/frictionless-py/master/%s"
 
@@ -86,3 +90,95 @@ def test_remote_loader_if_remote_basepath_and_file_scheme_issue_1388():
         {"id": 1, "name": "english"},
         {"id": 2, "name": "中国人"},
     ]
+
+
+# Prefetch
+
+
+def test_remote_loader_http_prefetch(http_server):
+    dialect = Dialect(header=False)
+    with TableResource(path=http_server % "table-1MB.csv", dialect=dialect) as resource:
+        rows = [row.to_dict() for row in resource.read_rows()]
+        md5 = resource.stats.md5
+    with system.use_context(http_prefetch=2):
+        with TableResource(
+            path=http_server % "table-1MB.csv", dialect=dialect
+        ) as resource:
+            assert [row.to_dict() for row in resource.read_rows()] == rows
+            assert resource.stats.md5 == md5
+
+
+def test_remote_loader_http_prefetch_close_early(http_server):
+    with system.use_context(http_prefetch=1):
+        with TableResource(path=http_server % "table-1MB.csv") as resource:
+            assert resource.header
+
+
+# Byte Stream
+
+
+def test_remote_byte_stream_seek(http_server):
+    with open("data/table-1MB.csv", "rb") as file:
+        data = file.read()
+    session = platform.requests.Session()
+    stream = RemoteByteStream(http_server % "table-1MB.csv", session=session, timeout=10)
+    stream.open()
+    assert stream.ranges
+    assert stream.read(100) == data[:100]
+    assert stream.seek(-100, 2) == len(data) - 100
+    assert stream.read() == data[-100:]
+    assert stream.seek(500000) == 500000
+    assert stream.read(100) == data[500000:500100]
+    assert stream.tell() == 500100
+    stream.seek(0)
+    assert stream.read(200) == data[:200]
+    stream.close()
+
+
+def test_remote_byte_stream_resume():
+    data = b"id,name\n" + b"".join(b"%d,name%d\n" % (i, i) for i in range(10000))
+    requests = []
+
+    # The first response is interrupted in the middle
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):  # type: ignore
+            pass
+
+        def do_GET(self):
+            start = int(self.headers.get("Range", "bytes=0-")[6:-1])
+            requests.append(start)
+            self.send_response(206 if start else 200)
+            self.send_header("Accept-Ranges", "bytes")
+            self.send_header("Content-Length", str(len(data) - start))
+            self.end_headers()
+            end = len(data) // 2 if len(requests) == 1 else len(data)
+            self.wfile.write(data[start:end])
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        path = "http://127.0.0.1:%s/table.csv" % server.server_address[1]
+        with TableResource(path=path) as resource:
+            rows = resource.read_rows()
+            assert len(rows) == 10000
+            assert rows[-1].to_dict() == {"id": 9999, "name": "name9999"}
+            assert resource.stats.bytes == len(data)
+        assert len(requests) == 2
+        assert 0 < requests[1] <= len(data) // 2
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+# Async
+
+
+def test_remote_loader_aopen(http_server):
+    async def read():
+        async with TableResource(path=http_server % "table.csv") as resource:
+            return resource.read_rows()
+
+    assert asyncio.run(read()) == [
+        {"id": 1, "name": "english"},
+        {"id": 2, "name": "中国人"},
+    ]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import io
-from typing import TYPE_CHECKING, Optional
+import queue
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
 from ... import types
 from ...platform import platform
 from ...system import Loader, system
+from . import settings
 from .control import RemoteControl
 
 if TYPE_CHECKING:
@@ -25,7 +28,10 @@ class RemoteLoader(Loader):
         control = RemoteControl.from_dialect(self.resource.dialect)
         session = system.http_session
         timeout = control.http_timeout
-        byte_stream = RemoteByteStream(path, session=session, timeout=timeout).open()
+        prefetch = system.http_prefetch
+        byte_stream = RemoteByteStream(
+            path, session=session, timeout=timeout, prefetch=prefetch
+        ).open()
         if control.http_preload:
             buffer = io.BufferedRandom(io.BytesIO())  # type: ignore
             buffer.write(byte_stream.read())
@@ -48,10 +54,22 @@ class RemoteLoader(Loader):
 
 
 class RemoteByteStream:
-    def __init__(self, source: str, *, session: Session, timeout: int):
+    """Seekable byte stream over HTTP
+
+    The head of the data is cached so re-reading it (e.g. after sniffing
+    a buffer) doesn't download it again. If the server advertises
+    `Accept-Ranges`, seeking uses range requests and dropped connections
+    are resumed from the last read byte.
+    """
+
+    def __init__(self, source: str, *, session: Session, timeout: int, prefetch: int = 0):
         self.__source = source
         self.__session = session
         self.__timeout = timeout
+        self.__prefetch = prefetch
+        self.__response: Optional[Any] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__closed = True
 
     def __iter__(self):  # type: ignore
         while True:
@@ -73,33 +91,191 @@ class RemoteByteStream:
     def closed(self):
         return self.__closed
 
+    @property
+    def ranges(self) -> bool:
+        """Whether the server supports range requests"""
+        return self.__ranges
+
     def open(self):
         self.__closed = False
-        self.seek(0)
+        self.__position = 0
+        self.__head = bytearray()
+        self.__ranges = False
+        self.__length: Optional[int] = None
+        self.__connect(0)
+        assert self.__response
+        headers = self.__response.headers
+        length = headers.get("Content-Length")
+        encoding = headers.get("Content-Encoding", "identity")
+        if headers.get("Accept-Ranges") == "bytes" and length and encoding == "identity":
+            self.__ranges = True
+            self.__length = int(length)
         return self
 
     def close(self):
+        self.__disconnect()
         self.__closed = True
 
     def tell(self):
-        return self.__response.raw.tell()
+        return self.__position
 
     def flush(self):
         pass
 
     def read(self, size: Optional[int] = -1):
-        if size == -1:
+        if size is not None and size < 0:
             size = None
-        return self.__response.raw.read(size)
+        data = bytearray()
+
+        # Read head
+        head = self.__head
+        if self.__position < len(head):
+            end = len(head) if size is None else min(len(head), self.__position + size)
+            data += head[self.__position : end]
+            self.__position = end
+
+        # Read stream
+        while size is None or len(data) < size:
+            chunk = self.__read_stream(CHUNK_SIZE if size is None else size - len(data))
+            if not chunk:
+                break
+            if (
+                self.__position == len(head)
+                and len(head) < settings.DEFAULT_HTTP_HEAD_SIZE
+            ):
+                head += chunk[: settings.DEFAULT_HTTP_HEAD_SIZE - len(head)]
+            data += chunk
+            self.__position += len(chunk)
+
+        return bytes(data)
 
     def read1(self, size: int = -1):
         return self.read(size)
 
     def seek(self, offset: int, whence: int = 0):
-        assert offset == 0
-        assert whence == 0
-        self.__response = self.__session.get(
-            self.__source, stream=True, timeout=self.__timeout
+        if whence == io.SEEK_CUR:
+            offset += self.__position
+        elif whence == io.SEEK_END:
+            if self.__length is None:
+                note = "seeking from the end requires range requests support"
+                raise io.UnsupportedOperation(note)
+            offset += self.__length
+        if offset < 0:
+            raise ValueError(f"negative seek position {offset}")
+        self.__position = offset
+        return offset
+
+    # Stream
+
+    def __read_stream(self, size: int) -> bytes:
+        if self.__stream_position != self.__position:
+            self.__disconnect()
+            self.__connect(self.__position)
+        if self.__prefetch and not self.__thread:
+            self.__start_thread()
+        if self.__thread:
+            chunk = self.__read_prefetched(size)
+        else:
+            chunk = self.__download(size)
+        self.__stream_position += len(chunk)
+        return chunk
+
+    def __connect(self, offset: int):
+        self.__response = self.__request(offset)
+        self.__offset = offset if self.__response.status_code == 206 else 0
+        self.__stream_position = offset
+        # The server might ignore the range so we skip to the offset
+        while self.__offset < offset:
+            if not self.__download(min(offset - self.__offset, CHUNK_SIZE)):
+                break
+
+    def __disconnect(self):
+        self.__stop_thread()
+        if self.__response:
+            self.__response.close()
+            self.__response = None
+
+    def __request(self, offset: int):
+        headers = {"Range": f"bytes={offset}-"} if offset and self.__ranges else {}
+        response = self.__session.get(
+            self.__source, stream=True, timeout=self.__timeout, headers=headers
         )
-        self.__response.raise_for_status()
-        self.__response.raw.decode_content = True
+        response.raise_for_status()
+        response.raw.decode_content = True
+        return response
+
+    def __download(self, size: int) -> bytes:
+        attempts = settings.DEFAULT_HTTP_RESUME_ATTEMPTS
+        while True:
+            try:
+                assert self.__response
+                chunk = self.__response.raw.read(size)
+                if not chunk and self.__length and self.__offset < self.__length:
+                    raise OSError("connection closed before the end of the data")
+                self.__offset += len(chunk)
+                return chunk
+            except (
+                OSError,
+                platform.requests.RequestException,
+                platform.urllib3_exceptions.HTTPError,
+            ):
+                # The download is resumed from the last read byte
+                if not self.__ranges or not attempts:
+                    raise
+                attempts -= 1
+                if self.__response:
+                    self.__response.close()
+                self.__response = self.__request(self.__offset)
+
+    # Prefetch
+
+    # Network reads are done in a background thread putting chunks to a bounded
+    # queue so downloading overlaps with parsing without unbounded buffering
+
+    def __start_thread(self):
+        self.__buffer = bytearray()
+        self.__finished = False
+        self.__stopped = threading.Event()
+        self.__queue: queue.Queue[Any] = queue.Queue(maxsize=self.__prefetch)
+        self.__thread = threading.Thread(target=self.__run_thread, daemon=True)
+        self.__thread.start()
+
+    def __stop_thread(self):
+        if self.__thread:
+            self.__stopped.set()
+            # Unblock the thread waiting for a free slot in the queue
+            while self.__thread.is_alive():
+                try:
+                    self.__queue.get(timeout=PREFETCH_TIMEOUT)
+                except queue.Empty:
+                    pass
+            self.__thread = None
+
+    def __run_thread(self):
+        try:
+            while not self.__stopped.is_set():
+                chunk = self.__download(PREFETCH_CHUNK_SIZE)
+                self.__queue.put(chunk)
+                if not chunk:
+                    break
+        except Exception as exception:
+            self.__queue.put(exception)
+
+    def __read_prefetched(self, size: int):
+        while not self.__finished and len(self.__buffer) < size:
+            chunk = self.__queue.get()
+            if isinstance(chunk, Exception):
+                self.__finished = True
+                raise chunk
+            if not chunk:
+                self.__finished = True
+                break
+            self.__buffer += chunk
+        data = bytes(self.__buffer[:size])
+        del self.__buffer[:size]
+        return data
+
+
+CHUNK_SIZE = 65536
+PREFETCH_CHUNK_SIZE = 65536
+PREFETCH_TIMEOUT = 0.1
@@ -4,3 +4,5 @@ from __future__ import annotations
 
 DEFAULT_HTTP_TIMEOUT = 10
 DEFAULT_SCHEMES = ["http", "https", "ftp", "ftps"]
+DEFAULT_HTTP_HEAD_SIZE = 1048576
+DEFAULT_HTTP_RESUME_ATTEMPTS = 3
@@ -13,6 +13,9 @@ UNDEFINED = object()
 NAME_PATTERN = "^([-a-z0-9._/])+$"
 TYPE_PATTERN = "^([-a-z/])+$"
 PACKAGE_PATH = "datapackage.json"
+INFERENCE_CACHE_PATH = "inference.db"
+HTTP_CACHE_PATH = "http.db"
+HTTP_CACHE_BODIES_PATH = "http"
 COMPRESSION_FORMATS = ["zip", "gz", "bz2", "xz"]
 
 # Defaults
@@ -26,6 +29,9 @@ DEFAULT_COMPRESSION = ""
 DEFAULT_BASEPATH = ""
 DEFAULT_TRUSTED = False
 DEFAULT_ONERROR = "ignore"
+DEFAULT_HASHING = "both"
+DEFAULT_HASHING_THREAD = False
+DEFAULT_COMPACT_ROWS = False
 DEFAULT_HEADER = True
 DEFAULT_HEADER_ROWS = [1]
 DEFAULT_HEADER_JOIN = " "
@@ -35,6 +41,13 @@ DEFAULT_MISSING_VALUES = [""]
 DEFAULT_LIMIT_ERRORS = 1000
 DEFAULT_LIMIT_MEMORY = 1000
 DEFAULT_BUFFER_SIZE = 10000
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_SHARD_BLOCK_SIZE = 1048576
+DEFAULT_INFERENCE_CACHE_SIZE = 1000
+DEFAULT_CONCURRENCY = 32
+DEFAULT_HTTP_POOL_SIZE = 32
+DEFAULT_HTTP_PREFETCH = 16
+DEFAULT_HTTP_CACHE_SIZE = 1073741824
 DEFAULT_SAMPLE_SIZE = 100
 DEFAULT_ENCODING_CONFIDENCE = 0.5
 DEFAULT_FIELD_CONFIDENCE = 0.9
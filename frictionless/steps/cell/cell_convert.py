@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import attrs
 
@@ -8,6 +8,7 @@ from ...pipeline import Step
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -49,6 +50,37 @@ class cell_convert(Step):
         else:
             resource.data = table.update(self.field_name, self.value)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        function = self.function
+        indexes = list(range(len(schema.fields)))
+        if not self.field_name:
+            if not function:
+                function = lambda _: self.value  # type: ignore
+        else:
+            indexes = [schema.field_names.index(self.field_name)]
+            if not function and self.mapping:
+                mapping = self.mapping
+
+                def function(cell: Any):
+                    try:
+                        return mapping[cell] if cell in mapping else cell
+                    except TypeError:
+                        return cell
+
+            elif not function:
+                function = lambda _: self.value  # type: ignore
+
+        # Failed conversions result in None as petl does
+        def transform(cells: List[Any]):
+            for index in indexes:
+                try:
+                    cells[index] = function(cells[index])  # type: ignore
+                except Exception:
+                    cells[index] = None
+            return cells
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import attrs
 
@@ -8,6 +8,7 @@ from ...pipeline import Step
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -35,6 +36,22 @@ class cell_format(Step):
         else:
             resource.data = table.format(self.field_name, self.template)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        indexes = list(range(len(schema.fields)))
+        if self.field_name:
+            indexes = [schema.field_names.index(self.field_name)]
+
+        # Failed conversions result in None as petl does
+        def transform(cells: List[Any]):
+            for index in indexes:
+                try:
+                    cells[index] = self.template.format(cells[index])
+                except Exception:
+                    cells[index] = None
+            return cells
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Optional
+import re
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import attrs
 
@@ -9,6 +10,7 @@ from ...platform import platform
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -43,6 +45,26 @@ class cell_replace(Step):
                 function = platform.petl.sub  # type: ignore
             resource.data = function(table, self.field_name, pattern, self.replace)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        indexes = list(range(len(schema.fields)))
+        convert = lambda cell: self.replace if cell == self.pattern else cell  # type: ignore
+        if self.field_name:
+            indexes = [schema.field_names.index(self.field_name)]
+            if self.pattern.startswith("<regex>"):
+                regex = re.compile(self.pattern.replace("<regex>", ""))
+                convert = lambda cell: regex.sub(self.replace, cell)  # type: ignore
+
+        # Failed conversions result in None as petl does
+        def transform(cells: List[Any]):
+            for index in indexes:
+                try:
+                    cells[index] = convert(cells[index])
+                except Exception:
+                    cells[index] = None
+            return cells
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
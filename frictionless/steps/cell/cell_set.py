@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, List
 
 import attrs
 
@@ -8,6 +8,7 @@ from ...pipeline import Step
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -32,6 +33,15 @@ class cell_set(Step):
         table = resource.to_petl()  # type: ignore
         resource.data = table.update(self.field_name, self.value)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        index = schema.field_names.index(self.field_name)
+
+        def transform(cells: List[Any]):
+            cells[index] = self.value
+            return cells
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
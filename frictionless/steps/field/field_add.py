@@ -1,17 +1,20 @@
 from __future__ import annotations
 
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any, Optional
+from itertools import count
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
+from ... import helpers
 from ...pipeline import Step
+from ...platform import platform
 from ...schema import Field
 
 if TYPE_CHECKING:
     from ... import types
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -84,10 +87,40 @@ class field_add(Step):
             resource.data = table.addrownumbers(field=self.name)  # type: ignore
         else:
             if self.formula:
-                function = lambda row: simpleeval.simple_eval(self.formula, names=row)  # type: ignore
+                function = helpers.compile_formula(self.formula, compound=False)
             value = value or function  # type: ignore
             resource.data = table.addfield(self.name, value=value, index=index)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        value = self.value
+        position = self.position
+        function = self.function
+        names = schema.field_names
+        Record = platform.petl.Record  # type: ignore
+        descriptor = deepcopy(self.descriptor) or {}
+        if self.name:
+            descriptor["name"] = self.name
+        descriptor.setdefault("type", "any")
+        if self.incremental:
+            position = position or 1
+            descriptor["type"] = "integer"
+        field = Field.from_descriptor(descriptor)
+        index = position - 1 if position else len(names)
+        schema.add_field(field, position=position)
+        if self.incremental:
+            numbers = count(1)
+            function = lambda _: next(numbers)  # type: ignore
+        elif self.formula:
+            function = helpers.compile_formula(self.formula, compound=False)
+        value = value or function  # type: ignore
+
+        def transform(cells: List[Any]):
+            cell = value(Record(cells, names)) if callable(value) else value
+            cells.insert(index, cell)
+            return cells
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List
 
 import attrs
 
@@ -8,6 +8,7 @@ from ...pipeline import Step
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -34,6 +35,18 @@ class field_filter(Step):
                 resource.schema.remove_field(name)
         resource.data = table.cut(*resource.schema.field_names)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        names = schema.field_names
+        for name in names:
+            if name not in self.names:
+                schema.remove_field(name)
+        keep = [names.index(name) for name in schema.field_names]
+
+        def transform(cells: List[Any]):
+            return [cells[index] for index in keep]
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List
 
 import attrs
 
@@ -8,6 +8,7 @@ from ...pipeline import Step
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -38,6 +39,17 @@ class field_move(Step):
         resource.schema.fields.insert(self.position - 1, field)  # type: ignore
         resource.data = table.movefield(self.name, self.position - 1)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        index = schema.field_names.index(self.name)
+        field = schema.remove_field(self.name)
+        schema.fields.insert(self.position - 1, field)  # type: ignore
+
+        def transform(cells: List[Any]):
+            cells.insert(self.position - 1, cells.pop(index))
+            return cells
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
@@ -34,6 +34,18 @@ class field_remove(Step):
                 indexes.append(index)
         resource.data = table.cutout(*indexes)
 
+    def create_row_transform(self, schema):
+        names = schema.field_names
+        for name in names:
+            if name in self.names:
+                schema.remove_field(name)
+        keep = [names.index(name) for name in schema.field_names]
+
+        def transform(cells):
+            return [cells[index] for index in keep]
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
@@ -4,8 +4,8 @@ from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
+from ... import helpers
 from ...pipeline import Step
 
 if TYPE_CHECKING:
@@ -60,7 +60,8 @@ class field_update(Step):
         new_name = descriptor.get("name")
         resource.schema.update_field(self.name, descriptor)
         if self.formula:
-            function = lambda _, row: simpleeval.simple_eval(self.formula, names=row)  # type: ignore
+            formula = helpers.compile_formula(self.formula, compound=False)
+            function = lambda _, row: formula(row)  # type: ignore
             pass_row = True
         if function:
             resource.data = table.convert(self.name, function, pass_row=pass_row)  # type: ignore
@@ -1,4 +1,6 @@
-from frictionless import Pipeline, Step, steps
+from typing import List
+
+from frictionless import Pipeline, Schema, Step, steps
 from frictionless.resources import TableResource
 
 # General
@@ -48,6 +50,61 @@ def test_step_row_sort_with_reverse():
     ]
 
 
+def test_step_row_sort_with_reverse_per_field():
+    source = TableResource(
+        data=[["id", "name"], [1, "a"], [2, "b"], [1, "c"], [2, "a"]],
+    )
+    pipeline = Pipeline(
+        steps=[
+            steps.row_sort(field_names=["id", "name"], reverse=[True, False]),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.read_rows() == [
+        {"id": 2, "name": "a"},
+        {"id": 2, "name": "b"},
+        {"id": 1, "name": "a"},
+        {"id": 1, "name": "c"},
+    ]
+
+
+def test_step_row_sort_with_memory_limit():
+    messages: List[str] = []
+    data = [["id", "name"]] + [[index % 7, "x" * 50] for index in range(10000)]
+    source = TableResource(data=data)
+    pipeline = Pipeline(
+        steps=[
+            steps.row_sort(
+                field_names=["id"], memory_limit=1, on_progress=messages.append
+            ),
+        ],
+    )
+    target = source.transform(pipeline)
+    rows = target.read_rows()
+    assert [row["id"] for row in rows] == sorted(index % 7 for index in range(10000))
+    assert messages[0].startswith("spilled run 1")
+    assert messages[-1].startswith("merging")
+
+
+def test_step_row_sort_with_typed_values():
+    source = TableResource(
+        data=[["id"], ["10"], ["9"], [None], ["100"]],
+        schema=Schema.from_descriptor({"fields": [{"name": "id", "type": "integer"}]}),
+    )
+    pipeline = Pipeline(
+        steps=[
+            steps.row_sort(field_names=["id"]),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.read_rows() == [
+        {"id": None},
+        {"id": 9},
+        {"id": 10},
+        {"id": 100},
+    ]
+
+
 # Bugs
 
 
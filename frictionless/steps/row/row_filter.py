@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import attrs
-import simpleeval  # type: ignore
 
+from ... import helpers
 from ...pipeline import Step
+from ...platform import platform
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -40,11 +42,21 @@ class row_filter(Step):
         function = self.function
         table = resource.to_petl()  # type: ignore
         if self.formula:
-            # NOTE: review EvalWithCompoundTypes/sync with checks
-            evalclass = simpleeval.EvalWithCompoundTypes  # type: ignore
-            function = lambda row: evalclass(names=row).eval(self.formula)  # type: ignore
+            function = helpers.compile_formula(self.formula)
         resource.data = table.select(function)  # type: ignore
 
+    def create_row_transform(self, schema: Schema):
+        function = self.function
+        names = schema.field_names
+        Record = platform.petl.Record  # type: ignore
+        if self.formula:
+            function = helpers.compile_formula(self.formula)
+
+        def transform(cells: List[Any]):
+            return cells if function(Record(cells, names)) else None  # type: ignore
+
+        return transform
+
     # Metadata
 
     metadata_profile_patch = {
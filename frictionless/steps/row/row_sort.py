@@ -1,10 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
 import attrs
 
 from ...pipeline import Step
+from ...system import system
+from ...table.sorter import RowSorter
+from ...transformer.transformer import read_cells
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -17,6 +20,10 @@ class row_sort(Step):
     This step can be added using the `steps` parameter
     for the `transform` function.
 
+    Rows are sorted by their typed values. If the rows don't fit
+    the memory limit, sorted runs are moved to temporary files
+    and merged afterwards.
+
     """
 
     type = "row-sort"
@@ -28,16 +35,43 @@ class row_sort(Step):
     left to right.
     """
 
-    reverse: bool = False
+    reverse: Union[bool, List[bool]] = False
     """
     The sort will be reversed if it is set to True.
+    A list of booleans sets the order for every field.
+    """
+
+    memory_limit: Optional[int] = None
+    """
+    Memory limit for sorting in MB. Defaults to `system.limit_memory`.
+    """
+
+    on_progress: Optional[Any] = None
+    """
+    Python function receiving progress messages of sorting.
     """
 
     # Transform
 
     def transform_resource(self, resource: Resource):
-        table = resource.to_petl()  # type: ignore
-        resource.data = table.sort(self.field_names, reverse=self.reverse)  # type: ignore
+        current = resource.to_copy()
+        limit = self.memory_limit or system.limit_memory
+
+        # Data
+        def data():  # type: ignore
+            with current:
+                sorter = RowSorter(
+                    schema=current.schema,  # type: ignore
+                    field_names=self.field_names,
+                    reverse=self.reverse,
+                    limit=limit * 1024 * 1024,
+                    on_progress=self.on_progress,
+                )
+                yield current.header.to_list()  # type: ignore
+                yield from sorter.sort(read_cells(current))
+
+        # Meta
+        resource.data = data
 
     # Metadata
 
@@ -46,5 +80,7 @@ class row_sort(Step):
         "properties": {
             "fieldNames": {"type": "array"},
             "reverse": {},
+            "memoryLimit": {"type": "integer"},
+            "onProgress": {},
         },
     }
@@ -57,3 +57,60 @@ def test_step_table_aggregate_multiple():
         {"name": "germany", "sum": 160, "min": 77, "max": 83},
         {"name": "spain", "sum": 80, "min": 33, "max": 47},
     ]
+
+
+def test_step_table_aggregate_builtin():
+    source = TableResource(path="data/transform-groups.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.table_aggregate(
+                group_names=["name"],
+                aggregation={
+                    "count": ("id", "count"),
+                    "sum": ("population", "sum"),
+                    "min": ("year", "min"),
+                    "mean": ("population", "mean"),
+                },
+            ),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.schema.to_descriptor() == {
+        "fields": [
+            {"name": "name", "type": "string"},
+            {"name": "count", "type": "integer"},
+            {"name": "sum", "type": "integer"},
+            {"name": "min", "type": "integer"},
+            {"name": "mean", "type": "number"},
+        ]
+    }
+    assert target.read_rows() == [
+        {"name": "france", "count": 2, "sum": 120, "min": 1920, "mean": 60},
+        {"name": "germany", "count": 2, "sum": 160, "min": 1920, "mean": 80},
+        {"name": "spain", "count": 2, "sum": 80, "min": 1920, "mean": 40},
+    ]
+
+
+def test_step_table_aggregate_from_descriptor_with_group_names():
+    source = TableResource(path="data/transform-groups.csv")
+    pipeline = Pipeline.from_descriptor(
+        {
+            "steps": [
+                {
+                    "type": "table-aggregate",
+                    "groupNames": ["year", "name"],
+                    "aggregation": {"max": ["population", "max"]},
+                    "memoryLimit": 10,
+                }
+            ]
+        }
+    )
+    target = source.transform(pipeline)
+    assert target.read_rows() == [
+        {"year": 1920, "name": "france", "max": 54},
+        {"year": 1920, "name": "germany", "max": 77},
+        {"year": 1920, "name": "spain", "max": 33},
+        {"year": 2020, "name": "france", "max": 66},
+        {"year": 2020, "name": "germany", "max": 83},
+        {"year": 2020, "name": "spain", "max": 47},
+    ]
@@ -291,3 +291,46 @@ def test_step_table_join_mode_left_from_descriptor_issue_996():
         {"id": 2, "name": "france", "population": 66, "note": "vine"},
         {"id": 3, "name": "spain", "population": 47, "note": None},
     ]
+
+
+def test_step_table_join_with_field_names():
+    source = TableResource(
+        data=[["id", "year", "name"], [1, 2020, "a"], [1, 2021, "b"], [2, 2020, "c"]]
+    )
+    pipeline = Pipeline(
+        steps=[
+            steps.table_join(
+                resource=TableResource(
+                    data=[["id", "year", "note"], [1, 2021, "x"], [2, 2020, "y"]]
+                ),
+                field_names=["id", "year"],
+            ),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.schema.field_names == ["id", "year", "name", "note"]
+    assert target.read_rows() == [
+        {"id": 1, "year": 2021, "name": "b", "note": "x"},
+        {"id": 2, "year": 2020, "name": "c", "note": "y"},
+    ]
+
+
+def test_step_table_join_hash_is_true_mode_outer():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.table_join(
+                resource=TableResource(data=[["id", "note"], [1, "beer"], [4, "rum"]]),
+                field_name="id",
+                mode="outer",
+                use_hash=True,
+            ),
+        ],
+    )
+    target = source.transform(pipeline)
+    assert target.read_rows() == [
+        {"id": 1, "name": "germany", "population": 83, "note": "beer"},
+        {"id": 2, "name": "france", "population": 66, "note": None},
+        {"id": 3, "name": "spain", "population": 47, "note": None},
+        {"id": 4, "name": None, "population": None, "note": "rum"},
+    ]
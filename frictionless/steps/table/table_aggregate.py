@@ -1,11 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import attrs
 
-from ... import fields
 from ...pipeline import Step
+from ...system import system
+from ...table.aggregator import RowAggregator
+from ...transformer.transformer import read_cells
 
 if TYPE_CHECKING:
     from ...resource import Resource
@@ -18,39 +20,71 @@ class table_aggregate(Step):
     This step can be added using the `steps` parameter
     for the `transform` function.
 
+    Rows are aggregated in a single pass keeping only aggregation
+    states of the groups in memory. If the groups don't fit the memory
+    limit, the rest of the rows is partitioned to temporary files.
+
     """
 
     type = "table-aggregate"
 
     aggregation: Dict[str, Any]
     """
-    A dictionary with aggregation function. The values
-    could be max, min, len and sum.
+    A dictionary with aggregation function. The keys are names of the
+    result fields and the values are pairs of a field name and either
+    a built-in aggregate: count, sum, min, max, mean, variance, stdev
+    and approx-distinct; or a function receiving a list of the group values.
     """
 
-    group_name: str
+    group_name: Optional[str] = None
     """
     Field by which the rows will be grouped.
     """
 
+    group_names: Optional[List[str]] = None
+    """
+    Fields by which the rows will be grouped.
+    It's used instead of `group_name` if provided.
+    """
+
+    memory_limit: Optional[int] = None
+    """
+    Memory limit for aggregating in MB. Defaults to `system.limit_memory`.
+    """
+
     # Transform
 
     def transform_resource(self, resource: Resource):
-        table = resource.to_petl()  # type: ignore
-        field = resource.schema.get_field(self.group_name)
-        resource.schema.fields.clear()
-        resource.schema.add_field(field)
-        for name in self.aggregation.keys():
-            resource.schema.add_field(fields.AnyField(name=name))
-        resource.data = table.aggregate(self.group_name, self.aggregation)  # type: ignore
+        current = resource.to_copy()
+        limit = self.memory_limit or system.limit_memory
+        aggregator = RowAggregator(
+            schema=current.schema,  # type: ignore
+            group_names=self.group_names or [self.group_name],  # type: ignore
+            aggregation=self.aggregation,
+            limit=limit * 1024 * 1024,
+        )
+
+        # Data
+        def data():  # type: ignore
+            with current:
+                yield resource.schema.field_names  # type: ignore
+                yield from aggregator.aggregate(read_cells(current))  # type: ignore
+
+        # Meta
+        resource.schema.fields.clear()  # type: ignore
+        for field in aggregator.fields:
+            resource.schema.add_field(field)  # type: ignore
+        resource.data = data
 
     # Metadata
 
     metadata_profile_patch = {
         "type": "object",
-        "required": ["groupName", "aggregation"],
+        "required": ["aggregation"],
         "properties": {
             "groupName": {"type": "string"},
+            "groupNames": {"type": "array"},
             "aggregation": {"type": "object"},
+            "memoryLimit": {"type": "integer"},
         },
     }
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-from typing import Optional, Union
+import os
+from typing import List, Optional, Union
 
 import attrs
 
 from ...pipeline import Step
-from ...platform import platform
 from ...resource import Resource
+from ...system import system
+from ...table.joiner import RowJoiner
+from ...transformer.transformer import read_cells
 
 DEFAULT_MODE = "inner"
 
@@ -30,13 +33,19 @@ class table_join(Step):
     field_name: Optional[str] = None
     """
     Field name with which the join will be performed comparing it's value between two tables.
-    If not provided natural join is tried. For more information, please see the following document:
-    https://petl.readthedocs.io/en/stable/_modules/petl/transform/joins.html
+    If not provided natural join is tried using the fields present in both tables.
+    """
+
+    field_names: Optional[List[str]] = None
+    """
+    Names of the fields with which the join will be performed (composite key).
+    It's used instead of `field_name` if provided.
     """
 
     use_hash: bool = False
     """
-    Specify whether to use hash or not. If True, an alternative implementation of join will be used.
+    Specify whether to use hash or not. If True, a hash join is used: it streams rows in the order
+    of the larger table instead of sorting both tables by the key.
     """
 
     mode: str = DEFAULT_MODE
@@ -45,6 +54,11 @@ class table_join(Step):
     "negate". The default mode is "inner".
     """
 
+    memory_limit: Optional[int] = None
+    """
+    Memory limit for joining in MB. Defaults to `system.limit_memory`.
+    """
+
     # Transform
 
     def transform_resource(self, resource: Resource):
@@ -53,35 +67,34 @@ class table_join(Step):
         if isinstance(source, str):
             assert target.package
             source = target.package.get_resource(source)
-        source.infer()  # type: ignore
-        view1 = target.to_petl()  # type: ignore
-        view2 = source.to_petl()  # type: ignore
-        if self.mode not in ["negate"]:
-            for field in source.schema.fields:  # type: ignore
-                if field.name != self.field_name:
-                    target.schema.fields.append(field.to_copy())
-        if self.mode == "inner":
-            join = platform.petl.hashjoin if self.use_hash else platform.petl.join  # type: ignore
-            resource.data = join(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "left":
-            leftjoin = (  # type: ignore
-                platform.petl.hashleftjoin if self.use_hash else platform.petl.leftjoin  # type: ignore
-            )
-            resource.data = leftjoin(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "right":
-            rightjoin = (  # type: ignore
-                platform.petl.hashrightjoin if self.use_hash else platform.petl.rightjoin  # type: ignore
-            )
-            resource.data = rightjoin(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "outer":
-            resource.data = platform.petl.outerjoin(view1, view2, self.field_name)  # type: ignore
-        elif self.mode == "cross":
-            resource.data = platform.petl.crossjoin(view1, view2)  # type: ignore
-        elif self.mode == "negate":
-            antijoin = (  # type: ignore
-                platform.petl.hashantijoin if self.use_hash else platform.petl.antijoin  # type: ignore
-            )
-            resource.data = antijoin(view1, view2, self.field_name)  # type: ignore
+        # The schema is required before reading the data
+        if not source.schema:  # type: ignore
+            source.infer()  # type: ignore
+        current = target.to_copy()
+        field_names = self.field_names or ([self.field_name] if self.field_name else [])
+        if not field_names and self.mode != "cross":
+            names = source.schema.field_names  # type: ignore
+            field_names = [name for name in target.schema.field_names if name in names]  # type: ignore
+        joiner = RowJoiner(
+            left_schema=current.schema,  # type: ignore
+            right_schema=source.schema,  # type: ignore
+            field_names=field_names,
+            mode=self.mode,
+            use_hash=self.use_hash,
+            build_side=select_build_side(current, source),  # type: ignore
+            limit=(self.memory_limit or system.limit_memory) * 1024 * 1024,
+        )
+        for name in joiner.field_names[len(target.schema.fields) :]:  # type: ignore
+            target.schema.add_field(source.schema.get_field(name).to_copy())  # type: ignore
+
+        # Data
+        def data():  # type: ignore
+            with current, source.to_copy() as joined:  # type: ignore
+                yield joiner.field_names
+                yield from joiner.join(read_cells(current), read_cells(joined))  # type: ignore
+
+        # Meta
+        resource.data = data
 
     # Metadata
 
@@ -90,11 +103,13 @@ class table_join(Step):
         "properties": {
             "resource": {"type": ["object", "string"]},
             "fieldName": {"type": "string"},
+            "fieldNames": {"type": "array"},
             "mode": {
                 "type": "string",
                 "enum": ["inner", "left", "right", "outer", "cross", "negate"],
             },
             "hash": {},
+            "memoryLimit": {"type": "integer"},
         },
     }
 
@@ -102,3 +117,19 @@ class table_join(Step):
     def metadata_select_property_class(cls, name: str):
         if name == "resource":
             return Resource
+
+
+# Internal
+
+
+# A hash table is built for the smaller table if the sizes are known
+def select_build_side(left: Resource, right: Resource) -> str:
+    sizes = []
+    for resource in [left, right]:
+        if resource.memory or resource.remote or resource.multipart:
+            return "right"
+        try:
+            sizes.append(os.path.getsize(resource.normpath))  # type: ignore
+        except (OSError, TypeError):
+            return "right"
+    return "left" if sizes[0] < sizes[1] else "right"
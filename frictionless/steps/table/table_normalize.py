@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, List
 
 import attrs
 
@@ -8,6 +8,7 @@ from ...pipeline import Step
 
 if TYPE_CHECKING:
     from ...resource import Resource
+    from ...schema import Schema
 
 
 @attrs.define(kw_only=True, repr=False)
@@ -35,3 +36,14 @@ class table_normalize(Step):
 
         # Meta
         resource.data = data
+
+    def create_row_transform(self, schema: Schema):
+        cell_readers = [field.create_cell_reader() for field in schema.fields]
+
+        # Invalid cells become None as they do in "transform_resource"
+        def transform(cells: List[Any]):
+            for index, cell_reader in enumerate(cell_readers):
+                cells[index] = cell_reader(cells[index])[0]
+            return cells
+
+        return transform
@@ -0,0 +1,102 @@
+import os
+
+from frictionless import Detector, Resource, system
+from frictionless.resources import TableResource
+from frictionless.system.cache import HttpCache, InferenceCache
+
+# General
+
+
+def test_inference_cache(tmpdir):
+    cache = InferenceCache(str(tmpdir))
+    cache.write("key", {"encoding": "utf-8"})
+    assert cache.read("key") == {"encoding": "utf-8"}
+    assert cache.read("bad") is None
+
+
+def test_inference_cache_size(tmpdir):
+    cache = InferenceCache(str(tmpdir), size=2)
+    cache.write("key1", 1)
+    cache.write("key2", 2)
+    assert cache.read("key1") == 1
+    cache.write("key3", 3)
+    assert cache.read("key1") == 1
+    assert cache.read("key2") is None
+    assert cache.read("key3") == 3
+
+
+def test_inference_cache_resource(tmpdir):
+    with system.use_context(inference_cache=str(tmpdir)):
+        with TableResource(path="data/table.csv") as resource:
+            descriptor = resource.to_descriptor()
+            rows = [row.to_dict() for row in resource.read_rows()]
+        with TableResource(path="data/table.csv") as resource:
+            assert resource.to_descriptor() == descriptor
+            assert [row.to_dict() for row in resource.read_rows()] == rows
+    assert os.path.exists(os.path.join(tmpdir, "inference.db"))
+
+
+def test_inference_cache_resource_options(tmpdir):
+    with system.use_context(inference_cache=str(tmpdir)):
+        with TableResource(path="data/table.csv") as resource:
+            assert resource.schema.get_field("id").type == "integer"
+        detector = Detector(field_type="string")
+        with TableResource(path="data/table.csv", detector=detector) as resource:
+            assert resource.schema.get_field("id").type == "string"
+
+
+def test_inference_cache_resource_file_changed(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n1,english\n")
+    with system.use_context(inference_cache=str(tmpdir), trusted=True):
+        with TableResource(path=path) as resource:
+            assert resource.schema.get_field("name").type == "string"
+        with open(path, "w") as file:
+            file.write("id,name\n1,2\n")
+        os.utime(path, ns=(0, 0))
+        with TableResource(path=path) as resource:
+            assert resource.schema.get_field("name").type == "integer"
+
+
+# Http
+
+
+def test_http_cache(tmpdir):
+    cache = HttpCache(str(tmpdir))
+    cache.write("key", {"etag": "1"}, [b"id,", b"name"])
+    entry = cache.read("key")
+    assert entry
+    headers, path = entry
+    assert headers == {"etag": "1"}
+    with open(path, "rb") as file:
+        assert file.read() == b"id,name"
+    assert cache.read("bad") is None
+
+
+def test_http_cache_size(tmpdir):
+    cache = HttpCache(str(tmpdir), size=10)
+    cache.write("key1", {}, [b"12345"])
+    cache.write("key2", {}, [b"12345"])
+    assert cache.read("key1")
+    cache.write("key3", {}, [b"12345"])
+    assert cache.read("key1")
+    assert cache.read("key2") is None
+    assert cache.read("key3")
+
+
+def test_http_cache_resource(http_server, tmpdir):
+    with system.use_context(http_cache=str(tmpdir)):
+        with TableResource(path=http_server % "table.csv") as resource:
+            rows = [row.to_dict() for row in resource.read_rows()]
+        with TableResource(path=http_server % "table.csv") as resource:
+            assert [row.to_dict() for row in resource.read_rows()] == rows
+    assert HttpCache(str(tmpdir)).stats == {"hits": 1, "misses": 1}
+
+
+def test_http_cache_metadata(http_server, tmpdir):
+    with system.use_context(http_cache=str(tmpdir)):
+        resource1 = Resource(http_server % "resource.json")
+        resource2 = Resource(http_server % "resource.json")
+        assert resource1.to_descriptor() == resource2.to_descriptor()
+    assert HttpCache(str(tmpdir)).stats == {"hits": 1, "misses": 1}
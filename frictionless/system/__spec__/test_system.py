@@ -1,4 +1,5 @@
 import sys
+import threading
 
 import pytest
 import requests
@@ -23,3 +24,24 @@ def test_system_use_context_http_session():
             assert isinstance(control, schemes.RemoteControl)
             assert resource.header == ["id", "name"]
     assert system.http_session is not session
+
+
+def test_system_use_local_context():
+    context = system.copy_context()
+    results = []
+
+    def work():
+        with system.use_local_context(context):
+            with system.use_context(hashing="none"):
+                results.append(system.hashing)
+            results.append(system.hashing)
+
+    with system.use_context(hashing="md5"):
+        context = system.copy_context()
+        thread = threading.Thread(target=work)
+        with system.use_context(hashing="sha256"):
+            thread.start()
+            thread.join()
+            assert system.hashing == "sha256"
+    assert results == ["none", "md5"]
+    assert system.hashing == "both"
@@ -0,0 +1,303 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .. import settings
+from ..platform import platform
+
+
+class InferenceCache:
+    """Persistent cache of inferred metadata
+
+    It's a key-value store backed by SQLite. When the number of entries
+    exceeds the size the least recently used ones are evicted.
+
+    Parameters:
+        directory (str): directory to keep the cache database
+        size (int): maximum number of entries
+
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        size: int = settings.DEFAULT_INFERENCE_CACHE_SIZE,
+    ):
+        self.__path = os.path.join(directory, settings.INFERENCE_CACHE_PATH)
+        self.__directory = directory
+        self.__size = size
+
+    def read(self, key: str) -> Optional[Any]:
+        """Read a cached value
+
+        Parameters:
+            key (str): cache key
+
+        Returns:
+            any: cached value or None if it's missing
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                query = "SELECT value FROM inference WHERE key = ?"
+                record = connection.execute(query, (key,)).fetchone()
+                if record is None:
+                    return None
+                query = "UPDATE inference SET used = ? WHERE key = ?"
+                connection.execute(query, (time.time(), key))
+                return json.loads(record[0])
+        # The cache is an optimization so its failures are not fatal
+        except (sqlite3.Error, OSError):
+            return None
+
+    def write(self, key: str, value: Any) -> None:
+        """Write a value to the cache
+
+        Parameters:
+            key (str): cache key
+            value (any): JSON serializable value
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                query = "INSERT OR REPLACE INTO inference VALUES (?, ?, ?)"
+                connection.execute(query, (key, json.dumps(value), time.time()))
+                query = "DELETE FROM inference WHERE key NOT IN "
+                query += "(SELECT key FROM inference ORDER BY used DESC LIMIT ?)"
+                connection.execute(query, (self.__size,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    # Connect
+
+    def __connect(self):
+        os.makedirs(self.__directory, exist_ok=True)
+        connection = sqlite3.connect(self.__path, timeout=INFERENCE_CACHE_TIMEOUT)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS inference "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, used REAL NOT NULL)"
+        )
+        return connection
+
+
+class HttpCache:
+    """Persistent cache of HTTP responses
+
+    Response bodies are stored as files along with their headers in a SQLite
+    index. When the total size exceeds the limit the least recently used
+    responses are evicted. Hit and miss counters are persisted as well.
+
+    Parameters:
+        directory (str): directory to keep the cache
+        size (int): maximum total size of the bodies in bytes
+
+    """
+
+    def __init__(self, directory: str, *, size: int = settings.DEFAULT_HTTP_CACHE_SIZE):
+        self.__path = os.path.join(directory, settings.HTTP_CACHE_PATH)
+        self.__bodies = os.path.join(directory, settings.HTTP_CACHE_BODIES_PATH)
+        self.__directory = directory
+        self.__size = size
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Hit and miss counters"""
+        stats = {"hits": 0, "misses": 0}
+        try:
+            with closing(self.__connect()) as connection, connection:
+                for name, value in connection.execute("SELECT * FROM counters"):
+                    stats[name] = value
+        except (sqlite3.Error, OSError):
+            pass
+        return stats
+
+    def read(self, key: str) -> Optional[Tuple[Dict[str, str], str]]:
+        """Read a cached response
+
+        Parameters:
+            key (str): cache key
+
+        Returns:
+            (dict, str)?: response headers and body path or None if it's missing
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                query = "SELECT headers FROM http WHERE key = ?"
+                record = connection.execute(query, (key,)).fetchone()
+                path = self.__get_body_path(key)
+                if record is None or not os.path.isfile(path):
+                    return None
+                query = "UPDATE http SET used = ? WHERE key = ?"
+                connection.execute(query, (time.time(), key))
+                return json.loads(record[0]), path
+        except (sqlite3.Error, OSError):
+            return None
+
+    def write(
+        self, key: str, headers: Dict[str, str], chunks: Iterable[bytes]
+    ) -> Optional[Tuple[Dict[str, str], str]]:
+        """Write a response to the cache
+
+        Parameters:
+            key (str): cache key
+            headers (dict): response headers
+            chunks (bytes[]): response body
+
+        Returns:
+            (dict, str)?: response headers and body path or None if it's failed
+        """
+        try:
+            os.makedirs(self.__bodies, exist_ok=True)
+            path = self.__get_body_path(key)
+            size = 0
+            # The body is moved in place when complete as the cache can be shared
+            with tempfile.NamedTemporaryFile(dir=self.__bodies, delete=False) as file:
+                for chunk in chunks:
+                    file.write(chunk)
+                    size += len(chunk)
+            os.replace(file.name, path)
+            with closing(self.__connect()) as connection, connection:
+                query = "INSERT OR REPLACE INTO http VALUES (?, ?, ?, ?)"
+                connection.execute(query, (key, json.dumps(headers), size, time.time()))
+                self.__evict(connection, key=key)
+            return headers, path
+        except (sqlite3.Error, OSError):
+            return None
+
+    def count(self, name: str) -> None:
+        """Increment a counter
+
+        Parameters:
+            name (str): counter name e.g. "hits"
+        """
+        try:
+            with closing(self.__connect()) as connection, connection:
+                query = "INSERT INTO counters VALUES (?, 1) "
+                query += "ON CONFLICT (name) DO UPDATE SET value = value + 1"
+                connection.execute(query, (name,))
+        except (sqlite3.Error, OSError):
+            pass
+
+    # Helpers
+
+    def __get_body_path(self, key: str):
+        return os.path.join(self.__bodies, hashlib.sha256(key.encode()).hexdigest())
+
+    def __evict(self, connection: sqlite3.Connection, *, key: str):
+        query = "SELECT key, size FROM http WHERE key != ? ORDER BY used DESC"
+        total = connection.execute("SELECT SUM(size) FROM http").fetchone()[0]
+        if total <= self.__size:
+            return
+        records = connection.execute(query, (key,)).fetchall()
+        while total > self.__size and records:
+            evicted, size = records.pop()
+            connection.execute("DELETE FROM http WHERE key = ?", (evicted,))
+            try:
+                os.remove(self.__get_body_path(evicted))
+            except OSError:
+                pass
+            total -= size
+
+    # Connect
+
+    def __connect(self):
+        os.makedirs(self.__directory, exist_ok=True)
+        connection = sqlite3.connect(self.__path, timeout=HTTP_CACHE_TIMEOUT)
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = NORMAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS http (key TEXT PRIMARY KEY, "
+            "headers TEXT NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS counters "
+            "(name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        return connection
+
+
+class HttpCacheAdapter:
+    """Transport adapter for `requests` caching responses on disk
+
+    Responses having `ETag` or `Last-Modified` headers are stored in the cache
+    and revalidated using conditional requests. Only full `GET` requests are
+    cached; the others are sent as is.
+
+    Parameters:
+        adapter (requests.adapters.HTTPAdapter): adapter to send requests
+        cache (HttpCache): cache to use
+
+    """
+
+    def __init__(self, adapter: Any, *, cache: HttpCache):
+        self.__adapter = adapter
+        self.__cache = cache
+
+    def send(self, request: Any, **options: Any):
+        if request.method != "GET" or "Range" in request.headers:
+            return self.__adapter.send(request, **options)
+
+        # Revalidate
+        key = request.url
+        entry = self.__cache.read(key)
+        if entry:
+            headers, _ = entry
+            if "etag" in headers:
+                request.headers["If-None-Match"] = headers["etag"]
+            if "last-modified" in headers:
+                request.headers["If-Modified-Since"] = headers["last-modified"]
+        response = self.__adapter.send(request, **{**options, "stream": True})
+        if entry and response.status_code == 304:
+            response.close()
+            self.__cache.count("hits")
+            return self.__build_response(request, entry)
+        self.__cache.count("misses")
+
+        # Store
+        cache_control = response.headers.get("Cache-Control", "")
+        if response.status_code == 200 and "no-store" not in cache_control:
+            if "ETag" in response.headers or "Last-Modified" in response.headers:
+                headers = {
+                    name.lower(): value for name, value in response.headers.items()
+                }
+                chunks = response.raw.stream(HTTP_CACHE_CHUNK_SIZE, decode_content=False)
+                entry = self.__cache.write(key, headers, chunks)
+                response.close()
+                # The body is already consumed so the request is repeated
+                if not entry:
+                    return self.__adapter.send(request, **options)
+                return self.__build_response(request, entry)
+
+        return response
+
+    def close(self):
+        self.__adapter.close()
+
+    # Helpers
+
+    def __build_response(self, request: Any, entry: Tuple[Dict[str, str], str]):
+        headers, path = entry
+        raw = platform.urllib3.HTTPResponse(
+            body=open(path, "rb"),
+            headers=headers,
+            status=200,
+            reason="OK",
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.__adapter.build_response(request, raw)
+
+
+# Internal
+
+INFERENCE_CACHE_TIMEOUT = 10
+HTTP_CACHE_TIMEOUT = 10
+HTTP_CACHE_CHUNK_SIZE = 65536
@@ -3,14 +3,18 @@ from __future__ import annotations
 import atexit
 import hashlib
 import io
+import mmap
 import os
+import queue
 import shutil
 import tempfile
-from typing import TYPE_CHECKING, Any, Optional, cast
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
-from .. import errors, settings
+from .. import errors, helpers, settings
 from ..exception import FrictionlessException
 from ..platform import platform
+from .system import system
 
 if TYPE_CHECKING:
     from .. import types
@@ -338,9 +342,27 @@ class ByteStreamWithStatsHandling:
     def __init__(self, byte_stream: types.IByteStream, *, resource: Resource):
         self.__byte_stream = byte_stream
         self.__resource = resource
-        self.__md5 = hashlib.new("md5")
-        self.__sha256 = hashlib.new("sha256")
+        self.__hashers: Dict[str, Any] = {}
         self.__bytes = 0
+        self.__queue: Optional[queue.Queue[Optional[bytes]]] = None
+        self.__thread: Optional[threading.Thread] = None
+        self.__mapped = isinstance(byte_stream, MappedByteStream)
+        self.__stopped = False
+
+        # Create hashers
+        algorithms = helpers.parse_hashing_algorithms(system.hashing, hash=resource.hash)
+        for algorithm in algorithms:
+            self.__hashers[algorithm] = hashlib.new(algorithm)
+
+        # Start thread
+        # Hashlib releases GIL for big chunks so reading and hashing overlap
+        # (mapped files are hashed over the mapping independently from reading)
+        if self.__hashers and system.hashing_thread:
+            target = self.__hash_mapping if self.__mapped else self.__hash_chunks
+            if not self.__mapped:
+                self.__queue = queue.Queue(maxsize=HASHING_QUEUE_SIZE)
+            self.__thread = threading.Thread(target=target, daemon=True)
+            self.__thread.start()
 
     def __getattr__(self, name: str):
         return getattr(self.__byte_stream, name)
@@ -356,19 +378,162 @@ class ByteStreamWithStatsHandling:
     def closed(self):
         return self.__byte_stream.closed
 
+    def close(self):
+        self.__stopped = True
+        self.__stop_thread()
+        self.__byte_stream.close()
+
     def read1(self, size: Optional[int] = -1):
         size = -1 if size is None else size
         chunk = cast(bytes, self.__byte_stream.read1(size))  # type: ignore
 
         # Calculate
-        self.__md5.update(chunk)
-        self.__sha256.update(chunk)
+        if chunk and not self.__mapped:
+            if self.__queue:
+                self.__queue.put(chunk)
+            else:
+                for hasher in self.__hashers.values():
+                    hasher.update(chunk)
         self.__bytes += len(chunk)
 
         # Store (hash on EOF)
         if size == -1 or not chunk:
-            self.__resource.stats.md5 = self.__md5.hexdigest()
-            self.__resource.stats.sha256 = self.__sha256.hexdigest()
+            if self.__mapped and not self.__thread and not self.__stopped:
+                self.__hash_mapping()
+            self.__stop_thread()
+            self.__stopped = True
+            for algorithm, hasher in self.__hashers.items():
+                setattr(self.__resource.stats, algorithm, hasher.hexdigest())
         self.__resource.stats.bytes = self.__bytes
 
         return chunk
+
+    # Thread
+
+    def __hash_chunks(self):
+        while True:
+            chunk = self.__queue.get()  # type: ignore
+            if chunk is None:
+                break
+            for hasher in self.__hashers.values():
+                hasher.update(chunk)
+
+    def __hash_mapping(self):
+        byte_stream = cast(MappedByteStream, self.__byte_stream)
+        with byte_stream.getbuffer() as view:
+            for start in range(0, len(view), HASHING_BLOCK_SIZE):
+                if self.__stopped:
+                    break
+                with view[start : start + HASHING_BLOCK_SIZE] as block:
+                    for hasher in self.__hashers.values():
+                        hasher.update(block)
+
+    def __stop_thread(self):
+        if self.__thread:
+            if self.__queue:
+                self.__queue.put(None)
+            self.__thread.join()
+            self.__queue = None
+            self.__thread = None
+
+
+class MappedByteStream(io.BufferedIOBase):
+    """Read-only byte stream backed by a memory-mapped file
+
+    Reading doesn't require system calls and the contents can be accessed
+    without copying using `getbuffer`. Sub-streams created by `substream`
+    share the mapping so a byte range can be read without reopening the file.
+    Memory views have to be released before closing the stream.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        mapping: Optional[mmap.mmap] = None,
+        start: int = 0,
+        end: Optional[int] = None,
+    ):
+        self.name = path
+        self.__owner = mapping is None
+        if mapping is None:
+            with open(path, "rb") as file:
+                mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.__mapping = mapping
+        self.__start = start
+        self.__end = len(mapping) if end is None else min(end, len(mapping))
+        self.__position = start
+
+    def __len__(self):
+        return self.__end - self.__start
+
+    def getbuffer(self) -> memoryview:
+        """Memory view of the stream contents"""
+        return memoryview(self.__mapping)[self.__start : self.__end]
+
+    def substream(self, start: int, end: int) -> MappedByteStream:
+        """Byte stream limited to a byte range of this stream"""
+        return MappedByteStream(
+            self.name,
+            mapping=self.__mapping,
+            start=self.__start + start,
+            end=self.__start + end,
+        )
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def read(self, size: Optional[int] = -1):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        end = self.__end
+        if size is not None and size >= 0:
+            end = min(self.__position + size, end)
+        chunk = self.__mapping[self.__position : end]
+        self.__position = max(end, self.__position)
+        return chunk
+
+    def read1(self, size: Optional[int] = -1):
+        return self.read(size)
+
+    def readinto(self, buffer: Any):
+        chunk = self.read(len(buffer))
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def readline(self, size: Optional[int] = -1):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        end = self.__mapping.find(b"\n", self.__position, self.__end) + 1
+        if not end:
+            end = self.__end
+        if size is not None and size >= 0:
+            end = min(self.__position + size, end)
+        return self.read(end - self.__position)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            offset = self.__start + offset
+        elif whence == io.SEEK_CUR:
+            offset = self.__position + offset
+        else:
+            offset = self.__end + offset
+        self.__position = max(offset, self.__start)
+        return self.tell()
+
+    def tell(self):
+        return self.__position - self.__start
+
+    def close(self):
+        if not self.closed and self.__owner:
+            self.__mapping.close()
+        super().close()
+
+
+# Internal
+
+HASHING_QUEUE_SIZE = 16
+HASHING_BLOCK_SIZE = 1048576
@@ -3,6 +3,7 @@ from __future__ import annotations
 import inspect
 import os
 import pkgutil
+import threading
 from collections import OrderedDict
 from contextlib import contextmanager
 from functools import cached_property
@@ -13,6 +14,7 @@ from .. import errors, settings
 from ..dialect import Control
 from ..exception import FrictionlessException
 from ..platform import platform
+from .cache import HttpCache, HttpCacheAdapter
 
 if TYPE_CHECKING:
     from .. import types
@@ -22,6 +24,7 @@ if TYPE_CHECKING:
     from ..pipeline import Step
     from ..resource import Resource
     from ..schema import Field
+    from ..table.keys import KeyIndex
     from .adapter import Adapter
     from .loader import Loader
     from .parser import Parser
@@ -31,6 +34,22 @@ if TYPE_CHECKING:
 # NOTE:
 # Shall we add plugin.identity/priority/etc as we do in Livemark?
 
+# Attributes set by "use_context" (the HTTP session is private)
+CONTEXT_ATTRIBUTES = {
+    "trusted",
+    "onerror",
+    "standards",
+    "hashing",
+    "hashing_thread",
+    "limit_memory",
+    "compact_rows",
+    "key_index",
+    "inference_cache",
+    "http_cache",
+    "http_prefetch",
+    "_System__http_session",
+}
+
 
 class System:
     """System representation
@@ -72,9 +91,86 @@ class System:
     The default value is v2.
     """
 
+    hashing: types.IHashing = settings.DEFAULT_HASHING
+    """
+    Hashing algorithms used to calculate stats while reading bytes such as
+    "auto", "none", "md5", "sha256" or "both". The "auto" policy only uses
+    an algorithm of the resource's declared hash. The default value is "both".
+    """
+
+    hashing_thread: bool = settings.DEFAULT_HASHING_THREAD
+    """
+    A flag that indicates if hashing is done in a background thread
+    so reading and hashing can overlap. The default value is False.
+    """
+
+    limit_memory: int = settings.DEFAULT_LIMIT_MEMORY
+    """
+    A memory limit in megabytes for keys used by integrity checks such as
+    unique, primary key and foreign key constraints. If it's exceeded the keys
+    are moved to a temporary on-disk index. The default value is 1000.
+    """
+
+    compact_rows: bool = settings.DEFAULT_COMPACT_ROWS
+    """
+    A flag that indicates if row streams yield memory efficient compact rows
+    sharing the same API with regular rows. The default value is False.
+    """
+
+    key_index: Optional[KeyIndex] = None
+    """
+    An index of referenced keys shared between resources. If it's provided
+    foreign key lookups of a referenced resource are built only once. It's
+    created automatically for the time of a package validation.
+    """
+
+    http_cache: Optional[str] = None
+    """
+    A directory to cache HTTP responses of the default session used to
+    load remote data and metadata. Responses are revalidated using conditional
+    requests. The default value is None which means that the cache is disabled.
+    """
+
+    http_prefetch: int = 0
+    """
+    A number of chunks of remote data read ahead in a background thread
+    overlapping network reads with parsing. The default value is 0 which means
+    that data is read on demand. Async methods as `package.avalidate` use
+    `settings.DEFAULT_HTTP_PREFETCH` if it's not set.
+    """
+
+    inference_cache: Optional[str] = None
+    """
+    A directory to persist inferred encoding, dialect and schema of local files.
+    Repeated opens of an unchanged file skip detection. The default value is None
+    which means that the cache is disabled.
+    """
+
     def __init__(self):
         self.__dynamic_plugins: OrderedDict[str, Plugin] = OrderedDict()
         self.__http_session = None
+        self.__http_default_sessions: Dict[Optional[str], Any] = {}
+        self.__local = threading.local()
+
+    # A thread using a local context (see "use_local_context") reads and
+    # writes the context attributes without affecting other threads
+
+    def __getattribute__(self, name: str):
+        if name in CONTEXT_ATTRIBUTES:
+            local = object.__getattribute__(self, "_System__local")
+            context = getattr(local, "context", None)
+            if context is not None:
+                return context[name]
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name: str, value: Any):
+        if name in CONTEXT_ATTRIBUTES:
+            local = self.__dict__.get("_System__local")
+            context = getattr(local, "context", None)
+            if context is not None:
+                context[name] = value
+                return
+        object.__setattr__(self, name, value)
 
     @property
     def http_session(self):
@@ -86,11 +182,23 @@ class System:
         Returns:
             requests.Session: a HTTP session
         """
-        if not self.__http_session:
+        if self.__http_session:
+            return self.__http_session
+        http_session = self.__http_default_sessions.get(self.http_cache)
+        if not http_session:
             http_session = platform.requests.Session()
             http_session.headers.update(settings.DEFAULT_HTTP_HEADERS)
-            self.__http_session = http_session
-        return self.__http_session
+            # Connections are pooled for resources read concurrently
+            adapter = platform.requests_adapters.HTTPAdapter(
+                pool_maxsize=settings.DEFAULT_HTTP_POOL_SIZE
+            )
+            if self.http_cache:
+                cache = HttpCache(self.http_cache)
+                adapter = HttpCacheAdapter(adapter, cache=cache)
+            http_session.mount("http://", adapter)
+            http_session.mount("https://", adapter)
+            self.__http_default_sessions[self.http_cache] = http_session
+        return http_session
 
     @cached_property
     def methods(self) -> Dict[str, Any]:
@@ -159,12 +267,28 @@ class System:
         trusted: Optional[bool] = None,
         onerror: Optional[types.IOnerror] = None,
         standards: Optional[types.IStandards] = None,
+        hashing: Optional[types.IHashing] = None,
+        hashing_thread: Optional[bool] = None,
+        limit_memory: Optional[int] = None,
+        compact_rows: Optional[bool] = None,
+        key_index: Optional[KeyIndex] = None,
+        inference_cache: Optional[str] = None,
+        http_cache: Optional[str] = None,
+        http_prefetch: Optional[int] = None,
         http_session: Optional[Any] = None,
     ):
         # Current
         current_trusted = self.trusted
         current_onerror = self.onerror
         current_standards = self.standards
+        current_hashing = self.hashing
+        current_hashing_thread = self.hashing_thread
+        current_limit_memory = self.limit_memory
+        current_compact_rows = self.compact_rows
+        current_key_index = self.key_index
+        current_inference_cache = self.inference_cache
+        current_http_cache = self.http_cache
+        current_http_prefetch = self.http_prefetch
         current_http_session = self.__http_session
 
         # Update
@@ -174,15 +298,67 @@ class System:
             self.onerror = onerror
         if standards is not None:
             self.standards = standards
+        if hashing is not None:
+            self.hashing = hashing
+        if hashing_thread is not None:
+            self.hashing_thread = hashing_thread
+        if limit_memory is not None:
+            self.limit_memory = limit_memory
+        if compact_rows is not None:
+            self.compact_rows = compact_rows
+        if key_index is not None:
+            self.key_index = key_index
+        if inference_cache is not None:
+            self.inference_cache = inference_cache
+        if http_cache is not None:
+            self.http_cache = http_cache
+        if http_prefetch is not None:
+            self.http_prefetch = http_prefetch
         if http_session is not None:
             self.__http_session = http_session
-        yield self
+        try:
+            yield self
 
         # Recover
-        self.trusted = current_trusted
-        self.onerror = current_onerror
-        self.standards = current_standards
-        self.__http_session = current_http_session
+        finally:
+            self.trusted = current_trusted
+            self.onerror = current_onerror
+            self.standards = current_standards
+            self.hashing = current_hashing
+            self.hashing_thread = current_hashing_thread
+            self.limit_memory = current_limit_memory
+            self.compact_rows = current_compact_rows
+            self.key_index = current_key_index
+            self.inference_cache = current_inference_cache
+            self.http_cache = current_http_cache
+            self.http_prefetch = current_http_prefetch
+            self.__http_session = current_http_session
+
+    def copy_context(self) -> Dict[str, Any]:
+        """Copy the context of the current thread
+
+        Returns:
+            dict: context to be used by "use_local_context"
+        """
+        return {name: getattr(self, name) for name in CONTEXT_ATTRIBUTES}
+
+    @contextmanager
+    def use_local_context(self, context: Dict[str, Any]):
+        """Use a context local to the current thread
+
+        It's meant to be used by worker threads: the context is copied in the
+        calling thread using "copy_context", and "use_context" calls made by the
+        worker thread inside of this context don't affect other threads.
+
+        Parameters:
+            context (dict): context created by "copy_context"
+        """
+        current = getattr(self.__local, "context", None)
+        self.__local.context = dict(context)
+        try:
+            yield self
+        finally:
+            self.__local.context = current
 
     # Hooks
 
@@ -1,5 +1,10 @@
+from .aggregator import RowAggregator
+from .batch import Batch
 from .header import Header
+from .joiner import RowJoiner
 from .lookup import Lookup
-from .row import Row
+from .row import CompactRow, Row
+from .sorter import RowSorter
+from .spill import SpillFile
 from .table import Table
 from .types import *
@@ -0,0 +1,91 @@
+import statistics
+from decimal import Decimal
+
+import pytest
+
+from frictionless import Schema
+from frictionless.table.aggregator import RowAggregator
+
+SCHEMA = Schema.from_descriptor(
+    {
+        "fields": [
+            {"name": "group", "type": "integer"},
+            {"name": "kind", "type": "string"},
+            {"name": "value", "type": "number"},
+        ]
+    }
+)
+AGGREGATION = {
+    "count": ("value", "count"),
+    "sum": ("value", "sum"),
+    "min": ("value", "min"),
+    "max": ("value", "max"),
+    "mean": ("value", "mean"),
+    "variance": ("value", "variance"),
+    "rows": ("value", len),
+}
+
+
+# General
+
+
+@pytest.mark.parametrize("limit", [8192, 1024 * 1024])
+def test_row_aggregator(limit):
+    rows = [
+        [index % 200, "ab"[index % 2], Decimal(index % 7) if index % 11 else None]
+        for index in range(3000)
+    ]
+    aggregator = RowAggregator(
+        schema=SCHEMA,
+        group_names=["group", "kind"],
+        aggregation=AGGREGATION,  # type: ignore
+        limit=limit,
+    )
+    result = list(aggregator.aggregate([list(row) for row in rows]))
+    groups = sorted({(row[0], row[1]) for row in rows})
+    assert [row[:2] for row in result] == [list(group) for group in groups]
+    for cells in result:
+        all_values = [row[2] for row in rows if row[:2] == cells[:2]]
+        values = [value for value in all_values if value is not None]
+        assert cells[2:7] == [
+            len(values),
+            sum(values),
+            min(values),
+            max(values),
+            sum(values) / len(values),
+        ]
+        assert float(cells[7]) == pytest.approx(float(statistics.variance(values)))
+        assert cells[8] == len(all_values)
+
+
+def test_row_aggregator_fields():
+    aggregator = RowAggregator(
+        schema=SCHEMA,
+        group_names=["kind"],
+        aggregation=AGGREGATION,  # type: ignore
+        limit=1024 * 1024,
+    )
+    assert [field.to_descriptor() for field in aggregator.fields] == [
+        {"name": "kind", "type": "string"},
+        {"name": "count", "type": "integer"},
+        {"name": "sum", "type": "number"},
+        {"name": "min", "type": "number"},
+        {"name": "max", "type": "number"},
+        {"name": "mean", "type": "number"},
+        {"name": "variance", "type": "number"},
+        {"name": "rows", "type": "any"},
+    ]
+
+
+def test_row_aggregator_approx_distinct():
+    aggregator = RowAggregator(
+        schema=SCHEMA,
+        group_names=["kind"],
+        aggregation={"distinct": ("group", "approx-distinct")},
+        limit=1024 * 1024,
+    )
+    rows = [[index % 10, "a", None] for index in range(1000)]
+    rows += [[index, "b", None] for index in range(100000)]
+    result = list(aggregator.aggregate(rows))
+    assert result[0] == ["a", 10]
+    assert abs(result[1][1] - 100000) < 100000 * 0.1
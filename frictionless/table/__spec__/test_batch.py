@@ -0,0 +1,85 @@
+from frictionless import Schema, fields
+from frictionless.resources import TableResource
+
+# General
+
+
+def test_basic():
+    resource = TableResource(path="data/table.csv")
+    with resource:
+        batches = list(resource.batch_stream(size=1))
+    assert len(batches) == 2
+    batch = batches[0]
+    assert len(batch) == 1
+    assert batch.field_names == ["id", "name"]
+    assert batch.row_numbers == [2]
+    assert batch.cell_lists == [["1", "english"]]
+    assert batch.columns == {"id": [1], "name": ["english"]}
+    assert batch.errors == []
+    assert batch.valid
+    assert list(batch.error_rows) == []
+    assert batch.to_lists() == [[1, "english"]]
+
+
+def test_rows():
+    resource = TableResource(path="data/table.csv")
+    with resource:
+        batch = next(resource.batch_stream())
+    rows = list(batch.rows)
+    assert rows == [{"id": 1, "name": "english"}, {"id": 2, "name": "中国人"}]
+    assert rows[0].row_number == 2
+    assert rows[0].valid
+    assert rows[1].to_list() == [2, "中国人"]
+
+
+def test_stats_rows():
+    resource = TableResource(path="data/table.csv")
+    with resource:
+        for _ in resource.batch_stream(size=1):
+            pass
+    assert resource.stats.rows == 2
+
+
+def test_error_rows():
+    resource = TableResource(path="data/invalid.csv")
+    with resource:
+        batch = next(resource.batch_stream())
+    assert [row.row_number for row in batch.error_rows] == [2, 3, 4, 5]
+    assert [error.type for error in batch.errors] == [
+        "missing-cell",
+        "missing-cell",
+        "missing-cell",
+        "missing-cell",
+        "blank-row",
+        "extra-cell",
+    ]
+    assert not batch.valid
+
+
+def test_errors_match_row_stream():
+    source = [["id", "value"], ["1", "a"], ["b", "2"], [], ["1", "3", "extra"]]
+    schema = Schema(
+        fields=[
+            fields.IntegerField(name="id", constraints={"unique": True}),
+            fields.IntegerField(name="value", constraints={"maximum": 2}),
+        ]
+    )
+    row_errors = []
+    for row in TableResource(data=source, schema=schema).read_rows():
+        row_errors.extend(error.to_descriptor() for error in row.errors)
+    batch_errors = []
+    with TableResource(data=source, schema=schema) as resource:
+        for batch in resource.batch_stream(size=2):
+            batch_errors.extend(error.to_descriptor() for error in batch.errors)
+    assert batch_errors == row_errors
+
+
+def test_primary_key():
+    source = [["id", "name"], ["1", "a"], ["1", "b"]]
+    schema = Schema.describe(source)
+    schema.primary_key = ["id"]
+    with TableResource(data=source, schema=schema) as resource:
+        batch = next(resource.batch_stream())
+    assert batch.columns == {"id": [1, 1], "name": ["a", "b"]}
+    assert [error.type for error in batch.errors] == ["primary-key"]
+    assert [row.row_number for row in batch.error_rows] == [3]
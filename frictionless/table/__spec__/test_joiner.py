@@ -0,0 +1,103 @@
+import pytest
+
+from frictionless import Schema
+from frictionless.table.joiner import RowJoiner
+
+LEFT_SCHEMA = Schema.from_descriptor(
+    {
+        "fields": [
+            {"name": "id", "type": "integer"},
+            {"name": "year", "type": "integer"},
+            {"name": "name", "type": "string"},
+        ]
+    }
+)
+RIGHT_SCHEMA = Schema.from_descriptor(
+    {
+        "fields": [
+            {"name": "year", "type": "integer"},
+            {"name": "id", "type": "integer"},
+            {"name": "note", "type": "string"},
+        ]
+    }
+)
+LEFT_ROWS = [[index % 50, 2000 + index % 3, f"n{index}"] for index in range(300)]
+RIGHT_ROWS = [[2000 + index % 4, index % 60, f"r{index}"] for index in range(240)]
+
+
+def join(left, right, mode):
+    result = []
+    left_keys = {tuple(row[:2]) for row in left}
+    right_keys = {(row[1], row[0]) for row in right}
+    for left_row in left:
+        if tuple(left_row[:2]) not in right_keys:
+            if mode in ["left", "outer"]:
+                result.append(left_row + [None])
+            if mode == "negate":
+                result.append(left_row)
+        elif mode != "negate":
+            for right_row in right:
+                if left_row[:2] == [right_row[1], right_row[0]]:
+                    result.append(left_row + [right_row[2]])
+    if mode in ["right", "outer"]:
+        for right_row in right:
+            if (right_row[1], right_row[0]) not in left_keys:
+                result.append([right_row[1], right_row[0], None, right_row[2]])
+    return result
+
+
+# General
+
+
+@pytest.mark.parametrize("mode", ["inner", "left", "right", "outer", "negate"])
+@pytest.mark.parametrize("use_hash", [False, True])
+@pytest.mark.parametrize("build_side", ["left", "right"])
+@pytest.mark.parametrize("limit", [32768, 1024 * 1024])
+def test_row_joiner(mode, use_hash, build_side, limit):
+    joiner = RowJoiner(
+        left_schema=LEFT_SCHEMA,
+        right_schema=RIGHT_SCHEMA,
+        field_names=["id", "year"],
+        mode=mode,
+        use_hash=use_hash,
+        build_side=build_side,
+        limit=limit,
+    )
+    left = [list(row) for row in LEFT_ROWS]
+    right = [list(row) for row in RIGHT_ROWS]
+    rows = list(joiner.join(left, right))
+    expected = join(LEFT_ROWS, RIGHT_ROWS, mode)
+    assert sorted(rows, key=str) == sorted(expected, key=str)
+
+
+def test_row_joiner_merge_join_sorted_by_key():
+    joiner = RowJoiner(
+        left_schema=LEFT_SCHEMA,
+        right_schema=RIGHT_SCHEMA,
+        field_names=["id"],
+        limit=1024 * 1024,
+    )
+    left = [[2, 2000, "a"], [1, 2000, "b"], [2, 2001, "c"]]
+    right = [[2000, 2, "x"], [2000, 1, "y"]]
+    assert joiner.field_names == ["id", "year", "name", "year", "note"]
+    assert list(joiner.join(left, right)) == [
+        [1, 2000, "b", 2000, "y"],
+        [2, 2000, "a", 2000, "x"],
+        [2, 2001, "c", 2000, "x"],
+    ]
+
+
+def test_row_joiner_typed_keys():
+    schema = Schema.from_descriptor({"fields": [{"name": "id"}]})
+    for use_hash in [False, True]:
+        joiner = RowJoiner(
+            left_schema=schema,
+            right_schema=schema,
+            field_names=["id"],
+            use_hash=use_hash,
+            limit=1024 * 1024,
+        )
+        assert list(joiner.join([[1], ["1"], [None]], [["1"], [1.0]])) in [
+            [[1], ["1"]],
+            [["1"], [1]],
+        ]
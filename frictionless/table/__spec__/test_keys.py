@@ -0,0 +1,81 @@
+from decimal import Decimal
+
+from frictionless.table.keys import KeyBloom, KeyIndex, KeyMap, KeyMemory, KeySet
+
+# General
+
+
+def test_key_map():
+    keys = KeyMap(memory=KeyMemory(limit=1024 * 1024))
+    assert keys.replace("a", 1) is None
+    assert keys.replace(("a", 1), 2) is None
+    assert keys.replace("a", 3) == 1
+    assert keys.get("a") == 3
+    assert keys.get(("a", 1)) == 2
+    assert keys.get("b") is None
+    assert not keys.spilled
+
+
+def test_key_map_spilled():
+    keys = KeyMap(memory=KeyMemory(limit=0))
+    assert keys.replace("a", 1) is None
+    assert keys.spilled
+    assert keys.replace(("a", 1), 2) is None
+    assert keys.replace("a", 3) == 1
+    assert keys.get("a") == 3
+    assert keys.get(("a", 1)) == 2
+    assert keys.get(("a", "1")) is None
+    assert keys.get("b") is None
+
+
+def test_key_map_spilled_equal_numbers():
+    keys = KeyMap(memory=KeyMemory(limit=0))
+    keys.set(1, 1)
+    assert keys.get(1.0) == 1
+    assert keys.get(Decimal("1.00")) == 1
+    assert keys.get("1") is None
+
+
+def test_key_set_shared_memory():
+    memory = KeyMemory(limit=1000)
+    keys1 = KeySet(memory=memory)
+    keys2 = KeySet(memory=memory)
+    for number in range(10):
+        keys1.add(number)
+        keys2.add(str(number))
+    assert keys1.spilled or keys2.spilled
+    assert 5 in keys1
+    assert "5" in keys2
+    assert "5" not in keys1
+    assert 10 not in keys1
+
+
+def test_key_set_spilled_bloom():
+    keys = KeySet(memory=KeyMemory(limit=0), bloom=True)
+    for number in range(3000):
+        keys.add(number)
+    assert keys.spilled
+    assert len(keys) == 3000
+    assert all(number in keys for number in range(3000))
+    assert not any(number in keys for number in range(3000, 6000))
+
+
+def test_key_bloom():
+    bloom = KeyBloom(capacity=1000)
+    for number in range(1000):
+        bloom.add(str(number))
+    assert bloom.full
+    assert all(str(number) in bloom for number in range(1000))
+    positives = sum(str(number) in bloom for number in range(1000, 11000))
+    assert positives < 300
+
+
+def test_key_index():
+    resource = object()
+    index = KeyIndex(limit=1024 * 1024)
+    keys = index.create()
+    keys.add((1,))
+    index.set(resource, ("id",), keys)
+    assert index.get(resource, ("id",)) is keys
+    assert index.get(resource, ("name",)) is None
+    assert index.get(object(), ("id",)) is None
@@ -1,7 +1,9 @@
 import json
 from decimal import Decimal
 
+from frictionless import Schema, system
 from frictionless.resources import TableResource
+from frictionless.table import CompactRow
 
 # General
 
@@ -19,6 +21,56 @@ def test_basic():
     assert row.to_dict() == {"field1": 1, "field2": 2, "field3": 3}
 
 
+# Compact
+
+
+def test_compact():
+    resource = TableResource(data=[["field1", "field2", "field3"], ["1", "2", "3"]])
+    row = resource.read_rows(compact=True)[0]
+    assert isinstance(row, CompactRow)
+    assert not hasattr(row, "__dict__")
+    assert row == {"field1": 1, "field2": 2, "field3": 3}
+    assert row["field2"] == 2
+    assert list(row) == ["field1", "field2", "field3"]
+    assert row.field_numbers == [1, 2, 3]
+    assert row.row_number == 2
+    assert row.blank_cells == {}
+    assert row.error_cells == {}
+    assert row.errors == []
+    assert row.valid is True
+    assert row.to_list() == [1, 2, 3]
+    assert row.to_dict() == {"field1": 1, "field2": 2, "field3": 3}
+
+
+def test_compact_errors():
+    data = [["id", "name"], ["1", "english"], ["bad", "german", "extra"], []]
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "name", "type": "string"},
+            ]
+        }
+    )
+    resource = TableResource(data=data, schema=schema)
+    rows = resource.read_rows(compact=True)
+    assert rows[0].valid is True
+    assert rows[1].error_cells == {"id": "bad"}
+    assert [error.type for error in rows[1].errors] == ["type-error", "extra-cell"]
+    assert rows[1].errors[0].cells == ["bad", "german", "extra"]
+    assert [error.type for error in rows[2].errors] == ["blank-row"]
+    assert rows[2].blank_cells == {"id": None, "name": None}
+
+
+def test_compact_system():
+    with system.use_context(compact_rows=True):
+        with TableResource(path="data/table.csv") as resource:
+            row = next(resource.row_stream)
+            assert isinstance(row, CompactRow)
+            assert row == {"id": 1, "name": "english"}
+    assert system.compact_rows is False
+
+
 # Convert
 
 
@@ -0,0 +1,57 @@
+import datetime
+from decimal import Decimal
+
+from frictionless import Schema
+from frictionless.table.sorter import RowSorter
+
+# General
+
+
+def test_row_sorter():
+    schema = Schema.from_descriptor(
+        {"fields": [{"name": "id", "type": "integer"}, {"name": "name"}]}
+    )
+    sorter = RowSorter(schema=schema, field_names=["id"], limit=1024 * 1024)
+    rows = [[2, "a"], [None, "b"], [1, "c"], [2, "d"], [1, "e"]]
+    assert list(sorter.sort(rows)) == [
+        [None, "b"],
+        [1, "c"],
+        [1, "e"],
+        [2, "a"],
+        [2, "d"],
+    ]
+
+
+def test_row_sorter_spilled_stable_with_mixed_directions():
+    messages = []
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "key", "type": "integer"},
+                {"name": "date", "type": "date"},
+                {"name": "number", "type": "number"},
+                {"name": "position", "type": "integer"},
+            ]
+        }
+    )
+    sorter = RowSorter(
+        schema=schema,
+        field_names=["key", "date"],
+        reverse=[False, True],
+        limit=0,
+        on_progress=messages.append,
+    )
+    rows = [
+        [index % 3, datetime.date(2000, 1, 1 + index % 2), Decimal(index), index]
+        for index in range(100)
+    ]
+    expected = sorted(rows, key=lambda row: (row[0], -row[1].toordinal()))
+    assert list(sorter.sort([list(row) for row in rows])) == expected
+    assert len([message for message in messages if message.startswith("merging")]) > 1
+
+
+def test_row_sorter_mixed_types():
+    schema = Schema.from_descriptor({"fields": [{"name": "value"}]})
+    sorter = RowSorter(schema=schema, field_names=["value"], limit=1024 * 1024)
+    rows = [["b"], [2], [None], ["a"], [Decimal("1.5")]]
+    assert list(sorter.sort(rows)) == [[None], [Decimal("1.5")], [2], ["a"], ["b"]]
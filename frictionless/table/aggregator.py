@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+import math
+import sys
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .. import errors
+from ..exception import FrictionlessException
+from ..schema import Field, Schema
+from .sorter import RowSorter
+from .spill import SpillFile
+
+AGGREGATE_PARTITIONS = 64
+AGGREGATE_MAX_DEPTH = 3
+# Approximate cost of a group entry and of a value collected for a function
+GROUP_ENTRY_SIZE = 200
+VALUE_ENTRY_SIZE = 50
+GROUP_SAMPLE_SIZE = 1000
+DISTINCT_PRECISION = 10
+
+
+class RowAggregator:
+    """Aggregate rows by groups with bounded memory
+
+    Rows are streamed through a hash table of aggregation states having an
+    entry for every group. If the table doesn't fit the memory budget, rows of
+    the groups not yet in the table are partitioned to temporary files
+    (see SpillFile) and aggregated partition by partition afterwards.
+    The groups are yielded in the order of the group key (see RowSorter).
+
+    An aggregate is a pair of a field name and either a name of a built-in
+    aggregate or a function receiving a list of the group values.
+    The built-in aggregates are incremental and ignore null values:
+
+    - count: number of values
+    - sum, min, max, mean: as it says
+    - variance, stdev: sample variance and standard deviation
+    - approx-distinct: approximate number of distinct values (HyperLogLog)
+
+    Parameters:
+        schema (Schema): schema of the rows
+        group_names (str[]): names of the fields to group by
+        aggregation (dict): mapping of result names to aggregates
+        limit (int): memory limit in bytes
+    """
+
+    def __init__(
+        self,
+        *,
+        schema: Schema,
+        group_names: List[str],
+        aggregation: Dict[str, Tuple[str, Union[str, Callable[[List[Any]], Any]]]],
+        limit: int,
+    ):
+        for name in group_names:
+            if not schema.has_field(name):
+                note = f'field "{name}" does not exist'
+                raise FrictionlessException(errors.StepError(note=note))
+        self.__schema = schema
+        self.__group_names = group_names
+        self.__group_indexes = [schema.field_names.index(name) for name in group_names]
+        self.__limit = limit
+        self.__aggregates: List[Tuple[int, Aggregate]] = []
+        for name, spec in aggregation.items():
+            field_name, function = spec
+            if not schema.has_field(field_name):
+                note = f'field "{field_name}" does not exist'
+                raise FrictionlessException(errors.StepError(note=note))
+            field = schema.get_field(field_name)
+            aggregate = create_aggregate(function, field=field)
+            self.__aggregates.append((schema.field_names.index(field_name), aggregate))
+        self.__names = list(aggregation.keys())
+
+    @property
+    def fields(self) -> List[Field]:
+        """Fields of the aggregated rows"""
+        fields = [self.__schema.get_field(name).to_copy() for name in self.__group_names]
+        for name, (index, aggregate) in zip(self.__names, self.__aggregates):
+            type = aggregate.type or self.__schema.fields[index].type
+            fields.append(Field.from_descriptor({"name": name, "type": type}))
+        return fields
+
+    def aggregate(self, rows: Iterable[List[Any]]) -> Iterator[List[Any]]:
+        """Aggregate rows
+
+        Parameters:
+            rows (any[][]): rows as lists of typed cells
+
+        Returns:
+            any[][]: rows having group cells followed by aggregated cells
+        """
+        # Groups are sorted using the other half of the memory budget
+        schema = Schema(fields=self.fields)
+        sorter = RowSorter(
+            schema=schema, field_names=self.__group_names, limit=self.__limit // 2
+        )
+        return sorter.sort(self.__aggregate(rows))
+
+    # Internal
+
+    def __aggregate(self, rows: Iterable[List[Any]], *, depth: int = 0):
+        table: Dict[Any, List[Any]] = {}
+        partitions: Optional[List[SpillFile]] = None
+        collecting = sum(1 for _, aggregate in self.__aggregates if aggregate.collecting)
+        limit = self.__limit // 2
+        size = 0
+        group_size = 0
+        for row in rows:
+            key = tuple(row[index] for index in self.__group_indexes)
+            states = table.get(key)
+            if states is None:
+                if partitions is not None:
+                    partitions[hash((depth, key)) % AGGREGATE_PARTITIONS].append(row)
+                    continue
+                states = [aggregate.create() for _, aggregate in self.__aggregates]
+                table[key] = states
+                # Group sizes are sampled as estimating every group is costly
+                if not len(table) % GROUP_SAMPLE_SIZE or not group_size:
+                    group_size = estimate_group_size(key, states)
+                size += group_size
+            for position, (index, aggregate) in enumerate(self.__aggregates):
+                states[position] = aggregate.update(states[position], row[index])
+            size += VALUE_ENTRY_SIZE * collecting
+            # Groups already in the table are still aggregated in memory
+            if partitions is None and size > limit and depth < AGGREGATE_MAX_DEPTH:
+                partitions = [
+                    SpillFile(schema=self.__schema) for _ in range(AGGREGATE_PARTITIONS)
+                ]
+
+        # Table
+        for key, states in table.items():
+            cells = list(key)
+            for position, (_, aggregate) in enumerate(self.__aggregates):
+                cells.append(aggregate.result(states[position]))
+            yield cells
+        table = {}
+
+        # Partitions
+        if partitions is not None:
+            try:
+                for partition in partitions:
+                    yield from self.__aggregate(partition.read(), depth=depth + 1)
+                    partition.close()
+            finally:
+                for partition in partitions:
+                    partition.close()
+
+
+# Internal
+
+
+class Aggregate:
+    type: Optional[str] = None
+    collecting: bool = False
+
+    def create(self) -> Any:
+        return None
+
+    def update(self, state: Any, value: Any) -> Any:
+        raise NotImplementedError()
+
+    def result(self, state: Any) -> Any:
+        return state
+
+
+class CountAggregate(Aggregate):
+    type = "integer"
+
+    def create(self):
+        return 0
+
+    def update(self, state: int, value: Any):
+        return state + 1 if value is not None else state
+
+
+class SumAggregate(Aggregate):
+    def __init__(self, *, field: Field):
+        self.type = "integer" if field.type == "integer" else "number"
+
+    def update(self, state: Any, value: Any):
+        if value is None:
+            return state
+        return value if state is None else state + value
+
+
+class MinAggregate(Aggregate):
+    def update(self, state: Any, value: Any):
+        if value is None:
+            return state
+        return value if state is None or value < state else state
+
+
+class MaxAggregate(Aggregate):
+    def update(self, state: Any, value: Any):
+        if value is None:
+            return state
+        return value if state is None or value > state else state
+
+
+class MeanAggregate(Aggregate):
+    type = "number"
+
+    def create(self):
+        return [0, 0]
+
+    def update(self, state: List[Any], value: Any):
+        if value is not None:
+            state[0] += 1
+            state[1] += value
+        return state
+
+    def result(self, state: List[Any]):
+        return state[1] / state[0] if state[0] else None
+
+
+# Welford's algorithm is used to be numerically stable
+class VarianceAggregate(Aggregate):
+    type = "number"
+
+    def __init__(self, *, stdev: bool = False):
+        self.stdev = stdev
+
+    def create(self):
+        return [0, 0, 0]
+
+    def update(self, state: List[Any], value: Any):
+        if value is not None:
+            state[0] += 1
+            delta = value - state[1]
+            state[1] += delta / state[0]
+            state[2] += delta * (value - state[1])
+        return state
+
+    def result(self, state: List[Any]):
+        if state[0] < 2:
+            return None
+        variance = state[2] / (state[0] - 1)
+        if not self.stdev:
+            return variance
+        return variance.sqrt() if isinstance(variance, Decimal) else math.sqrt(variance)
+
+
+# HyperLogLog sketch with 2^DISTINCT_PRECISION registers (~3% error)
+class DistinctAggregate(Aggregate):
+    type = "integer"
+
+    def create(self):
+        return bytearray(1 << DISTINCT_PRECISION)
+
+    def update(self, state: bytearray, value: Any):
+        if value is not None:
+            value_hash = mix_hash(value)
+            index = value_hash >> (64 - DISTINCT_PRECISION)
+            bits = (value_hash << DISTINCT_PRECISION) & HASH_MASK
+            rank = min(65 - bits.bit_length(), 65 - DISTINCT_PRECISION)
+            if rank > state[index]:
+                state[index] = rank
+        return state
+
+    def result(self, state: bytearray):
+        count = len(state)
+        alpha = 0.7213 / (1 + 1.079 / count)
+        estimate = alpha * count * count / sum(2.0**-rank for rank in state)
+        zeros = state.count(0)
+        if estimate <= 2.5 * count and zeros:
+            estimate = count * math.log(count / zeros)
+        return round(estimate)
+
+
+class FunctionAggregate(Aggregate):
+    type = "any"
+    collecting = True
+
+    def __init__(self, function: Callable[[List[Any]], Any]):
+        self.function = function
+
+    def create(self):
+        return []
+
+    def update(self, state: List[Any], value: Any):
+        state.append(value)
+        return state
+
+    def result(self, state: List[Any]):
+        return self.function(state)
+
+
+def create_aggregate(function: Any, *, field: Field) -> Aggregate:
+    if callable(function):
+        return FunctionAggregate(function)
+    if function == "count":
+        return CountAggregate()
+    if function == "sum":
+        return SumAggregate(field=field)
+    if function == "min":
+        return MinAggregate()
+    if function == "max":
+        return MaxAggregate()
+    if function == "mean":
+        return MeanAggregate()
+    if function == "variance":
+        return VarianceAggregate()
+    if function == "stdev":
+        return VarianceAggregate(stdev=True)
+    if function == "approx-distinct":
+        return DistinctAggregate()
+    note = f'aggregate "{function}" is not supported'
+    raise FrictionlessException(errors.StepError(note=note))
+
+
+def estimate_group_size(key: Tuple[Any, ...], states: List[Any]) -> int:
+    size = GROUP_ENTRY_SIZE + sys.getsizeof(key) + sum(map(sys.getsizeof, key))
+    return size + sys.getsizeof(states) + sum(map(sys.getsizeof, states))
+
+
+# Python hashes of numbers are not distributed so they are mixed (SplitMix64)
+def mix_hash(value: Any) -> int:
+    hash_ = (hash(value) + 0x9E3779B97F4A7C15) & HASH_MASK
+    hash_ = ((hash_ ^ (hash_ >> 30)) * 0xBF58476D1CE4E5B9) & HASH_MASK
+    hash_ = ((hash_ ^ (hash_ >> 27)) * 0x94D049BB133111EB) & HASH_MASK
+    return hash_ ^ (hash_ >> 31)
+
+
+HASH_MASK = (1 << 64) - 1
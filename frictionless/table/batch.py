@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Set
+
+from .row import Row
+
+if TYPE_CHECKING:
+    from ..error import Error
+    from ..schema import Field
+
+
+class Batch:
+    """Batch representation
+
+    > Constructor of this object is not Public API
+
+    This object is returned by `resource.batch_stream`. It holds a chunk
+    of consecutive table rows in a column-oriented form. Cells are read
+    column by column using field column readers and `Row` objects
+    are only created for rows having errors or on explicit access.
+
+    ```python
+    with TableResource(path="data/table.csv") as resource:
+        for batch in resource.batch_stream(size=1000):
+            # work with the Batch
+    ```
+
+    Parameters:
+        cell_lists (any[][]): list of row cells
+        field_info (dict): special field info structure
+        row_numbers (int[]): row numbers from 1
+    """
+
+    def __init__(
+        self,
+        cell_lists: List[List[Any]],
+        *,
+        field_info: Dict[str, Any],
+        row_numbers: List[int],
+    ):
+        self.__cell_lists = cell_lists
+        self.__field_info = field_info
+        self.__row_numbers = row_numbers
+        self.__columns: Dict[str, List[Any]] = {}
+        self.__invalid: Set[int] = set()
+        self.__rows: Dict[int, Row] = {}
+        self.__process()
+
+    def __len__(self):
+        return len(self.__row_numbers)
+
+    @cached_property
+    def fields(self) -> List[Field]:
+        """
+        Returns:
+            Field[]: table schema fields
+        """
+        return self.__field_info["objects"]
+
+    @cached_property
+    def field_names(self) -> List[str]:
+        """
+        Returns:
+            str[]: field names
+        """
+        return self.__field_info["names"]
+
+    @cached_property
+    def row_numbers(self) -> List[int]:
+        """
+        Returns:
+            int[]: row numbers from 1
+        """
+        return self.__row_numbers
+
+    @cached_property
+    def cell_lists(self) -> List[List[Any]]:
+        """
+        Returns:
+            any[][]: row cells before parsing
+        """
+        return self.__cell_lists
+
+    @cached_property
+    def columns(self) -> Dict[str, List[Any]]:
+        """A mapping indexed by a field name with parsed column values
+
+        Values of cells having type errors are set to `None`
+        as it happens for `Row` objects.
+
+        Returns:
+            dict: batch columns
+        """
+        return self.__columns
+
+    @property
+    def rows(self) -> Iterator[Row]:
+        """All the rows of the batch (they are created on demand)
+
+        Yields:
+            Row: batch rows
+        """
+        for index in range(len(self.__row_numbers)):
+            yield self.get_row(index)
+
+    @property
+    def error_rows(self) -> Iterator[Row]:
+        """Only the rows of the batch having errors
+
+        Yields:
+            Row: batch rows with errors
+        """
+        indexes = self.__invalid.union(self.__rows)
+        for index in sorted(indexes):
+            row = self.get_row(index)
+            if row.errors:
+                yield row
+
+    @property
+    def errors(self) -> List[Error]:
+        """
+        Returns:
+            Error[]: batch errors
+        """
+        return [error for row in self.error_rows for error in row.errors]
+
+    @property
+    def valid(self) -> bool:
+        """
+        Returns:
+            bool: if batch valid
+        """
+        return not self.errors
+
+    def get_row(self, index: int) -> Row:
+        """Get a row by its index in the batch
+
+        Parameters:
+            index (int): row index from 0
+
+        Returns:
+            Row: table row
+        """
+        row = self.__rows.get(index)
+        if row is None:
+            row = Row(
+                self.__cell_lists[index],
+                field_info=self.__field_info,
+                row_number=self.__row_numbers[index],
+            )
+            # Invalid rows are processed by the row itself to get
+            # exactly the same errors as in the row stream mode
+            if index not in self.__invalid:
+                values = (self.__columns[name][index] for name in self.field_names)
+                dict.update(row, zip(self.field_names, values))
+            self.__rows[index] = row
+        return row
+
+    # Convert
+
+    def to_lists(self) -> List[List[Any]]:
+        """
+        Returns:
+            any[][]: batch as a list of row lists
+        """
+        columns = [self.__columns[name] for name in self.field_names]
+        return [list(values) for values in zip(*columns)]
+
+    # Process
+
+    def __process(self):
+        cell_lists = self.__cell_lists
+        field_mapping = self.__field_info["mapping"]
+        column_readers = self.__field_info["column_readers"]
+        field_count = len(field_mapping)
+        blank_counts = [0] * len(cell_lists)
+
+        # Read columns
+        for position, name in enumerate(field_mapping):
+            column = [
+                cells[position] if len(cells) > position else None for cells in cell_lists
+            ]
+            values, notes = column_readers[name](column)
+            for index, value in enumerate(values):
+                if notes[index]:
+                    self.__invalid.add(index)
+                    if "type" in notes[index]:  # type: ignore
+                        continue
+                if value is None:
+                    blank_counts[index] += 1
+            self.__columns[name] = values
+
+        # Shape/blank errors
+        for index, cells in enumerate(cell_lists):
+            if len(cells) != field_count or blank_counts[index] == field_count:
+                self.__invalid.add(index)
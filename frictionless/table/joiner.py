@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from .. import errors
+from ..exception import FrictionlessException
+from .sorter import RowSorter, create_sort_key, estimate_row_size
+from .spill import SpillFile
+
+if TYPE_CHECKING:
+    from ..schema import Schema
+
+JOIN_MODES = ["inner", "left", "right", "outer", "cross", "negate"]
+JOIN_PARTITIONS = 64
+JOIN_MAX_DEPTH = 3
+ROW_SAMPLE_SIZE = 1000
+
+
+class RowJoiner:
+    """Join rows with bounded memory
+
+    By default, both sides are sorted (see RowSorter) and merged, so the rows
+    are joined in the order of the key. A hash join builds a hash table of one
+    side and streams the other side through it. If the build side doesn't fit
+    the memory budget, both sides are partitioned by the key to temporary
+    files (see SpillFile) and the partitions are joined one by one.
+
+    Keys are compared by their typed values (e.g. `1` doesn't match `"1"`).
+
+    Parameters:
+        left_schema (Schema): schema of the left rows
+        right_schema (Schema): schema of the right rows
+        field_names (str[]): names of the key fields present in both schemas
+        mode (str): one of "inner", "left", "right", "outer", "cross" and "negate"
+        use_hash (bool): use hash join
+        build_side (str): side to build a hash table for: "left" or "right"
+        limit (int): memory limit in bytes
+    """
+
+    def __init__(
+        self,
+        *,
+        left_schema: Schema,
+        right_schema: Schema,
+        field_names: List[str],
+        mode: str = "inner",
+        use_hash: bool = False,
+        build_side: str = "right",
+        limit: int,
+    ):
+        if mode not in JOIN_MODES:
+            note = f'join mode "{mode}" is not supported'
+            raise FrictionlessException(errors.StepError(note=note))
+        if mode != "cross" and not field_names:
+            note = "join requires key fields present in both tables"
+            raise FrictionlessException(errors.StepError(note=note))
+        for name in field_names:
+            for schema in [left_schema, right_schema]:
+                if not schema.has_field(name):
+                    note = f'field "{name}" does not exist'
+                    raise FrictionlessException(errors.StepError(note=note))
+        if mode == "cross":
+            field_names = []
+        self.__left_schema = left_schema
+        self.__right_schema = right_schema
+        self.__field_names = field_names
+        self.__mode = mode
+        self.__use_hash = use_hash
+        self.__build_left = build_side == "left"
+        self.__limit = limit
+        self.__left_keys = [left_schema.field_names.index(name) for name in field_names]
+        self.__right_keys = [right_schema.field_names.index(name) for name in field_names]
+        self.__left_width = len(left_schema.fields)
+        self.__right_values = [
+            index
+            for index in range(len(right_schema.fields))
+            if index not in self.__right_keys
+        ]
+        self.__keep_left = mode in ["left", "outer", "negate"]
+        self.__keep_right = mode in ["right", "outer"]
+
+    @property
+    def field_names(self) -> List[str]:
+        """Names of the joined fields"""
+        names = self.__left_schema.field_names
+        if self.__mode != "negate":
+            right_names = self.__right_schema.field_names
+            names = names + [right_names[index] for index in self.__right_values]
+        return names
+
+    def join(
+        self, left: Iterable[List[Any]], right: Iterable[List[Any]]
+    ) -> Iterator[List[Any]]:
+        """Join rows
+
+        Parameters:
+            left (any[][]): left rows as lists of typed cells
+            right (any[][]): right rows as lists of typed cells
+
+        Returns:
+            any[][]: joined rows
+        """
+        if self.__mode == "cross":
+            return self.__cross_join(left, right)
+        if self.__use_hash:
+            if self.__build_left:
+                return self.__hash_join(left, right, build_left=True)
+            return self.__hash_join(right, left, build_left=False)
+        return self.__merge_join(left, right)
+
+    # Cross
+
+    def __cross_join(self, left: Iterable[List[Any]], right: Iterable[List[Any]]):
+        file = SpillFile(schema=self.__right_schema)
+        try:
+            file.write(right)
+            for left_row in left:
+                for right_row in file.read():
+                    yield left_row + right_row
+        finally:
+            file.close()
+
+    # Merge
+
+    def __merge_join(self, left: Iterable[List[Any]], right: Iterable[List[Any]]):
+        # Both sorts hold their last run in memory while merging
+        options = dict(field_names=self.__field_names, limit=self.__limit // 2)
+        left_sorter = RowSorter(schema=self.__left_schema, **options)  # type: ignore
+        right_sorter = RowSorter(schema=self.__right_schema, **options)  # type: ignore
+        left_key = create_sort_key(self.__left_keys, [False] * len(self.__left_keys))[0]
+        right_key = create_sort_key(self.__right_keys, [False] * len(self.__left_keys))[0]
+        left_groups = itertools.groupby(left_sorter.sort(left), left_key)
+        right_groups = itertools.groupby(right_sorter.sort(right), right_key)
+        left_group = next(left_groups, None)
+        right_group = next(right_groups, None)
+        while left_group or right_group:
+            if right_group is None or (left_group and left_group[0] < right_group[0]):
+                if right_group is None and not self.__keep_left:
+                    break
+                if self.__keep_left:
+                    for left_row in left_group[1]:  # type: ignore
+                        yield self.__combine(left_row, None)
+                left_group = next(left_groups, None)
+            elif left_group is None or right_group[0] < left_group[0]:
+                if left_group is None and not self.__keep_right:
+                    break
+                if self.__keep_right:
+                    for right_row in right_group[1]:
+                        yield self.__combine(None, right_row)
+                right_group = next(right_groups, None)
+            else:
+                if self.__mode != "negate":
+                    right_rows = list(right_group[1])
+                    for left_row in left_group[1]:
+                        for right_row in right_rows:
+                            yield self.__combine(left_row, right_row)
+                left_group = next(left_groups, None)
+                right_group = next(right_groups, None)
+
+    # Hash
+
+    def __hash_join(
+        self,
+        build: Iterable[List[Any]],
+        probe: Iterable[List[Any]],
+        *,
+        build_left: bool,
+        depth: int = 0,
+    ) -> Iterator[List[Any]]:
+        build_keys = self.__left_keys if build_left else self.__right_keys
+        probe_keys = self.__right_keys if build_left else self.__left_keys
+        build_schema = self.__left_schema if build_left else self.__right_schema
+        probe_schema = self.__right_schema if build_left else self.__left_schema
+
+        # Build
+        table: Dict[Any, List[List[Any]]] = {}
+        partitions: Optional[List[SpillFile]] = None
+        count = 0
+        size = 0
+        row_size = 0
+        for row in build:
+            key = tuple(row[index] for index in build_keys)
+            if partitions is not None:
+                partitions[hash((depth, key)) % JOIN_PARTITIONS].append(row)
+                continue
+            table.setdefault(key, []).append(row)
+            count += 1
+            # Row sizes are sampled as estimating every row is costly
+            if not count % ROW_SAMPLE_SIZE or not row_size:
+                row_size = estimate_row_size(row)
+            size += row_size
+            # A partition having too many equal keys can't be split anymore
+            if size > self.__limit and depth < JOIN_MAX_DEPTH:
+                partitions = create_partitions(build_schema)
+                for key, rows in table.items():
+                    partition = partitions[hash((depth, key)) % JOIN_PARTITIONS]
+                    partition.write(rows)
+                table = {}
+
+        # Probe
+        if partitions is None:
+            yield from self.__probe(table, probe, probe_keys, build_left=build_left)
+            return
+
+        # Partitions
+        probe_partitions = create_partitions(probe_schema)
+        try:
+            for row in probe:
+                key = tuple(row[index] for index in probe_keys)
+                probe_partitions[hash((depth, key)) % JOIN_PARTITIONS].append(row)
+            for build_partition, probe_partition in zip(partitions, probe_partitions):
+                yield from self.__hash_join(
+                    build_partition.read(),
+                    probe_partition.read(),
+                    build_left=build_left,
+                    depth=depth + 1,
+                )
+                build_partition.close()
+                probe_partition.close()
+        finally:
+            for partition in partitions + probe_partitions:
+                partition.close()
+
+    def __probe(
+        self,
+        table: Dict[Any, List[List[Any]]],
+        probe: Iterable[List[Any]],
+        probe_keys: List[int],
+        *,
+        build_left: bool,
+    ) -> Iterator[List[Any]]:
+        keep_build = self.__keep_left if build_left else self.__keep_right
+        keep_probe = self.__keep_right if build_left else self.__keep_left
+
+        def combine(build_row: Optional[List[Any]], probe_row: Optional[List[Any]]):
+            if build_left:
+                return self.__combine(build_row, probe_row)
+            return self.__combine(probe_row, build_row)
+
+        matched: Set[Any] = set()
+        for row in probe:
+            key = tuple(row[index] for index in probe_keys)
+            rows = table.get(key)
+            if rows is None:
+                if keep_probe:
+                    yield combine(None, row)
+                continue
+            if keep_build:
+                matched.add(key)
+            if self.__mode != "negate":
+                for build_row in rows:
+                    yield combine(build_row, row)
+        if keep_build:
+            for key, rows in table.items():
+                if key not in matched:
+                    for build_row in rows:
+                        yield combine(build_row, None)
+
+    # Combine
+
+    def __combine(
+        self, left_row: Optional[List[Any]], right_row: Optional[List[Any]]
+    ) -> List[Any]:
+        if self.__mode == "negate":
+            return left_row  # type: ignore
+        if left_row is None:
+            left_row = [None] * self.__left_width
+            for left_index, right_index in zip(self.__left_keys, self.__right_keys):
+                left_row[left_index] = right_row[right_index]  # type: ignore
+        if right_row is None:
+            return left_row + [None] * len(self.__right_values)
+        return left_row + [right_row[index] for index in self.__right_values]
+
+
+# Internal
+
+
+def create_partitions(schema: Schema) -> List[SpillFile]:
+    return [SpillFile(schema=schema) for _ in range(JOIN_PARTITIONS)]
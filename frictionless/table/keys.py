@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import sqlite3
+import sys
+import threading
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from .. import errors
+from ..exception import FrictionlessException
+
+# Approximate cost of a dict entry with a row number
+KEY_ENTRY_SIZE = 100
+KEY_SAMPLE_SIZE = 1000
+BLOOM_ERROR_RATE = 0.01
+BLOOM_MIN_CAPACITY = 1000
+
+
+class KeyMemory:
+    """Memory budget shared by key stores
+
+    Parameters:
+        limit (int): memory limit in bytes
+    """
+
+    def __init__(self, *, limit: int):
+        self.limit = limit
+        self.usage = 0
+
+
+class KeyMap:
+    """Mapping of keys to row numbers with bounded memory
+
+    Keys are kept in memory until the memory budget is exhausted.
+    After that they are moved to a temporary on-disk SQLite database.
+
+    Parameters:
+        memory (KeyMemory): memory budget
+    """
+
+    def __init__(self, *, memory: KeyMemory):
+        self.__memory = memory
+        self.__items: Dict[Any, int] = {}
+        self.__count = 0
+        self.__size = 0
+        self.__key_size = 0
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.Lock()
+
+    def __len__(self):
+        return self.__count
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the keys are moved to disk"""
+        return self.__connection is not None
+
+    def get(self, key: Any) -> Optional[int]:
+        """Get a row number for the key"""
+        if self.__connection is None:
+            return self.__items.get(key)
+        query = "SELECT value FROM keys WHERE key = ?"
+        record = self.__execute(query, (serialize_key(key),), one=True)
+        return record[0] if record else None
+
+    def set(self, key: Any, value: int) -> None:
+        """Set a row number for the key"""
+        self.replace(key, value)
+
+    def replace(self, key: Any, value: int) -> Optional[int]:
+        """Set a row number for the key returning the previous one"""
+        if self.__connection is not None:
+            previous = self.get(key)
+            query = "INSERT OR REPLACE INTO keys VALUES (?, ?)"
+            self.__execute(query, (serialize_key(key), value))
+            if previous is None:
+                self.__count += 1
+            return previous
+        previous = self.__items.get(key)
+        self.__items[key] = value
+        if previous is None:
+            self.__count += 1
+            # Key sizes are sampled as estimating every key is costly
+            if not len(self.__items) % KEY_SAMPLE_SIZE or not self.__key_size:
+                self.__key_size = estimate_key_size(key)
+            self.__size += self.__key_size
+            self.__memory.usage += self.__key_size
+            if self.__memory.usage > self.__memory.limit:
+                self.__spill()
+        return previous
+
+    def serialized_keys(self) -> Iterator[str]:
+        """Iterate over the serialized keys"""
+        if self.__connection is None:
+            yield from map(serialize_key, self.__items)
+            return
+        for record in self.__execute("SELECT key FROM keys"):
+            yield record[0]
+
+    # Spill
+
+    def __spill(self):
+        # An empty path creates a temporary database deleted on close
+        # Shared lookups can be used from different threads (see KeyIndex)
+        self.__connection = sqlite3.connect("", check_same_thread=False)
+        self.__execute("PRAGMA journal_mode = OFF")
+        self.__execute("PRAGMA synchronous = OFF")
+        query = "CREATE TABLE keys (key TEXT PRIMARY KEY, value INTEGER) WITHOUT ROWID"
+        self.__execute(query)
+        items = ((serialize_key(key), value) for key, value in self.__items.items())
+        self.__execute("INSERT OR REPLACE INTO keys VALUES (?, ?)", items, many=True)
+        self.__memory.usage -= self.__size
+        self.__items = {}
+        self.__size = 0
+
+    def __execute(
+        self,
+        query: str,
+        params: Any = (),
+        *,
+        many: bool = False,
+        one: bool = False,
+    ):
+        assert self.__connection
+        try:
+            with self.__lock:
+                if many:
+                    return self.__connection.executemany(query, params)
+                cursor = self.__connection.execute(query, params)
+                return cursor.fetchone() if one else cursor
+        except sqlite3.Error as exception:
+            note = f'cannot store integrity keys on disk: "{exception}"'
+            raise FrictionlessException(errors.ResourceError(note=note))
+
+
+class KeySet:
+    """Set of keys with bounded memory
+
+    Parameters:
+        memory (KeyMemory): memory budget
+        bloom (bool): put a Bloom filter in front of the keys moved to disk
+            so checking missing keys doesn't query the disk
+    """
+
+    def __init__(self, *, memory: KeyMemory, bloom: bool = False):
+        self.__map = KeyMap(memory=memory)
+        self.__bloom_enabled = bloom
+        self.__bloom: Optional[KeyBloom] = None
+
+    def __contains__(self, key: Any):
+        if self.__bloom is not None and serialize_key(key) not in self.__bloom:
+            return False
+        return self.__map.get(key) is not None
+
+    def __len__(self):
+        return len(self.__map)
+
+    @property
+    def spilled(self) -> bool:
+        """Whether the keys are moved to disk"""
+        return self.__map.spilled
+
+    def add(self, key: Any) -> None:
+        """Add a key to the set"""
+        self.__map.set(key, 0)
+        if self.__bloom_enabled and self.__map.spilled:
+            # The filter is rebuilt with a doubled capacity to keep the error rate
+            if self.__bloom is None or self.__bloom.full:
+                self.__bloom = KeyBloom(capacity=len(self.__map) * 2)
+                for text in self.__map.serialized_keys():
+                    self.__bloom.add(text)
+            else:
+                self.__bloom.add(serialize_key(key))
+
+
+class KeyBloom:
+    """Bloom filter for serialized keys
+
+    Parameters:
+        capacity (int): expected number of keys
+        error_rate (float): false positive rate for the expected number of keys
+    """
+
+    def __init__(self, *, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        self.capacity = max(capacity, BLOOM_MIN_CAPACITY)
+        self.count = 0
+        self.__size = math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.__hashes = max(round(self.__size / self.capacity * math.log(2)), 1)
+        self.__bits = bytearray((self.__size + 7) // 8)
+
+    def __contains__(self, text: str):
+        for position in self.__positions(text):
+            if not self.__bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def full(self) -> bool:
+        """Whether the expected number of keys is reached"""
+        return self.count >= self.capacity
+
+    def add(self, text: str) -> None:
+        """Add a serialized key to the filter"""
+        for position in self.__positions(text):
+            self.__bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __positions(self, text: str):
+        # Double hashing derives all the positions from a single digest
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for number in range(self.__hashes):
+            yield (first + number * second) % self.__size
+
+
+class KeyIndex:
+    """Index of referenced keys shared between resources
+
+    It's used to build foreign key lookups of a referenced resource only once
+    when validating many resources referencing it (e.g. within a package).
+
+    Parameters:
+        limit (int): memory limit in bytes for the indexed keys
+        bloom (bool): put Bloom filters in front of the keys moved to disk
+    """
+
+    def __init__(self, *, limit: int, bloom: bool = True):
+        self.__memory = KeyMemory(limit=limit)
+        self.__bloom = bloom
+        self.__items: Dict[Tuple[int, Tuple[str, ...]], Tuple[Any, KeySet]] = {}
+        self.__locks: Dict[Tuple[int, Tuple[str, ...]], threading.Lock] = {}
+        self.__lock = threading.Lock()
+
+    def get(self, resource: Any, fields: Tuple[str, ...]) -> Optional[KeySet]:
+        """Get keys of the resource's fields if they are indexed"""
+        item = self.__items.get((id(resource), fields))
+        return item[1] if item else None
+
+    def create(self) -> KeySet:
+        """Create a key set sharing the index's memory budget"""
+        return KeySet(memory=self.__memory, bloom=self.__bloom)
+
+    def set(self, resource: Any, fields: Tuple[str, ...], keys: KeySet) -> None:
+        """Index keys of the resource's fields"""
+        # The resource is kept to not reuse its identifier while indexed
+        self.__items[(id(resource), fields)] = (resource, keys)
+
+    def build(
+        self,
+        resource: Any,
+        fields: Tuple[str, ...],
+        read: Callable[[KeySet], None],
+    ) -> KeySet:
+        """Get keys of the resource's fields reading them if they are not indexed
+
+        It's safe to call from different threads as keys are read only once.
+        """
+        with self.__lock:
+            lock = self.__locks.setdefault((id(resource), fields), threading.Lock())
+        with lock:
+            keys = self.get(resource, fields)
+            if keys is None:
+                keys = self.create()
+                read(keys)
+                self.set(resource, fields, keys)
+            return keys
+
+
+# Internal
+
+
+def estimate_key_size(key: Any) -> int:
+    size = KEY_ENTRY_SIZE + sys.getsizeof(key)
+    if isinstance(key, tuple):
+        size += sum(map(sys.getsizeof, key))  # type: ignore
+    return size
+
+
+def serialize_key(key: Any) -> str:
+    # Equal numbers of different types are equal keys as for Python dicts
+    if isinstance(key, tuple):
+        return "t" + json.dumps([serialize_key(item) for item in key])  # type: ignore
+    if isinstance(key, str):
+        return "s" + key
+    if isinstance(key, (int, float, Decimal)):
+        try:
+            return "n" + str(Decimal(key).normalize())
+        except (InvalidOperation, ValueError):
+            pass
+    return "r%s:%r" % (type(key).__name__, key)
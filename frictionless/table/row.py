@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from functools import cached_property
 from itertools import zip_longest
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 from .. import errors, helpers
 from ..platform import platform
@@ -207,17 +207,7 @@ class Row(Dict[str, Any]):
 
         # Convert
         if types is not None:
-            for index, field_mapping in enumerate(self.__field_info["mapping"].values()):
-                field, _, _, cell_writer = field_mapping
-                # Here we can optimize performance if we use a types mapping
-                if field.type in types:
-                    continue
-                # NOTE: Move somehow to be in the json plugin
-                if json is True and field.type == "number" and field.float_number:
-                    continue
-                cell = result[index]
-                cell, _ = cell_writer(cell, ignore_missing=True)
-                result[index] = cell
+            write_cells(result, self.__field_info, types=types, json=json)
 
         # Return
         return result
@@ -375,3 +365,372 @@ class Row(Dict[str, Any]):
 
         # Set processed
         self.__processed = True
+
+
+class CompactRow(Mapping[str, Any]):
+    """Compact row representation
+
+    > Constructor of this object is not Public API
+
+    It's a memory efficient alternative to `Row` with the same API. It's returned
+    by `resource.read_rows(compact=True)` or by any row stream if `system.compact_rows`
+    is set. The cells are processed at once on the first access and the errors
+    and other details are only allocated if they are present.
+
+    Parameters:
+        cells (any[]): array of cells
+        field_info (dict): special field info structure
+        row_number (int): row number from 1
+    """
+
+    __slots__ = (
+        "__cells",
+        "__field_info",
+        "__row_number",
+        "__values",
+        "__errors",
+        "__blank_cells",
+        "__error_cells",
+    )
+
+    def __init__(
+        self,
+        cells: List[Any],
+        *,
+        field_info: Dict[str, Any],
+        row_number: int,
+    ):
+        self.__cells = cells
+        self.__field_info = field_info
+        self.__row_number = row_number
+        self.__values: Optional[List[Any]] = None
+        self.__errors: Optional[List[errors.RowError]] = None
+        self.__blank_cells: Optional[Dict[str, Any]] = None
+        self.__error_cells: Optional[Dict[str, Any]] = None
+
+    __hash__ = None  # type: ignore
+
+    def __eq__(self, other: object):
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other.items())  # type: ignore
+        return NotImplemented
+
+    def __str__(self):
+        return str(self.to_dict())
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def __getitem__(self, key: str):
+        values = self.__process()
+        try:
+            _, field_number, _, _ = self.__field_info["mapping"][key]
+        except KeyError:
+            raise KeyError(f"Row does not have a field {key}")
+        return values[field_number - 1]
+
+    def __setitem__(self, key: str, value: Any):
+        values = self.__process()
+        try:
+            _, field_number, _, _ = self.__field_info["mapping"][key]
+        except KeyError:
+            raise KeyError(f"Row does not have a field {key}")
+        if len(self.__cells) < field_number:
+            self.__cells.extend([None] * (field_number - len(self.__cells)))
+        self.__cells[field_number - 1] = value
+        values[field_number - 1] = value
+
+    def __iter__(self):
+        return iter(self.__field_info["names"])
+
+    def __len__(self):
+        return len(self.__field_info["names"])
+
+    def __contains__(self, key: object):
+        return key in self.__field_info["mapping"]
+
+    def __reversed__(self):
+        return reversed(self.__field_info["names"])
+
+    def keys(self):  # type: ignore
+        return iter(self.__field_info["names"])
+
+    def values(self):  # type: ignore
+        return iter(self.__process())
+
+    def items(self):  # type: ignore
+        return zip(self.__field_info["names"], self.__process())
+
+    def get(self, key: str, default: Optional[Any] = None):
+        if key not in self.__field_info["mapping"]:
+            return default
+        return self[key]
+
+    @property
+    def cells(self):
+        """
+        Returns:
+            any[]: row cells
+        """
+        return self.__cells
+
+    @property
+    def fields(self):
+        """
+        Returns:
+            Field[]: table schema fields
+        """
+        return self.__field_info["objects"]
+
+    @property
+    def field_names(self) -> List[str]:
+        """
+        Returns:
+            str[]: field names
+        """
+        return self.__field_info["names"]
+
+    @property
+    def field_numbers(self):
+        """
+        Returns:
+            str[]: field numbers
+        """
+        return list(range(1, len(self.__field_info["names"]) + 1))
+
+    @property
+    def row_number(self) -> int:
+        """
+        Returns:
+            int: row number from 1
+        """
+        return self.__row_number
+
+    @property
+    def blank_cells(self):
+        """A mapping indexed by a field name with blank cells before parsing
+
+        Returns:
+            dict: row blank cells
+        """
+        self.__process()
+        if self.__blank_cells is None:
+            self.__blank_cells = {}
+        return self.__blank_cells
+
+    @property
+    def error_cells(self):
+        """A mapping indexed by a field name with error cells before parsing
+
+        Returns:
+            dict: row error cells
+        """
+        self.__process()
+        if self.__error_cells is None:
+            self.__error_cells = {}
+        return self.__error_cells
+
+    @property
+    def errors(self):
+        """
+        Returns:
+            Error[]: row errors
+        """
+        self.__process()
+        if self.__errors is None:
+            self.__errors = []
+        return self.__errors
+
+    @property
+    def valid(self):
+        """
+        Returns:
+            bool: if row valid
+        """
+        self.__process()
+        return not self.__errors
+
+    # Convert
+
+    def to_str(self, **options: Any):
+        """
+        Returns:
+            str: a row as a CSV string
+        """
+        types = platform.frictionless_formats.CsvParser.supported_types
+        cells = self.to_list(types=types)
+        return helpers.stringify_csv_string(cells, **options)
+
+    def to_list(self, *, json: bool = False, types: Optional[List[str]] = None):
+        """
+        Parameters:
+            json (bool): make data types compatible with JSON format
+            types (str[]): list of supported types
+
+        Returns:
+            dict: a row as a list
+        """
+        result = list(self.__process())
+        if types is None and json:
+            types = platform.frictionless_formats.JsonParser.supported_types
+        if types is not None:
+            write_cells(result, self.__field_info, types=types, json=json)
+        return result
+
+    def to_dict(
+        self, *, csv: bool = False, json: bool = False, types: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Parameters:
+            json (bool): make data types compatible with JSON format
+
+        Returns:
+            dict: a row as a dictionary
+        """
+        result = list(self.__process())
+        if types is None and json:
+            types = platform.frictionless_formats.JsonParser.supported_types
+        if types is None and csv:
+            types = platform.frictionless_formats.CsvParser.supported_types
+        if types is not None:
+            write_cells(result, self.__field_info, types=types)
+        return dict(zip(self.__field_info["names"], result))
+
+    # Process
+
+    def __process(self) -> List[Any]:
+        if self.__values is not None:
+            return self.__values
+
+        # Prepare context
+        cells = self.__cells
+        fields = self.__field_info["objects"]
+        field_mappings = list(self.__field_info["mapping"].values())
+        values: List[Any] = [None] * len(field_mappings)
+        row_errors: List[errors.RowError] = []
+        blank_cells: Dict[str, Any] = {}
+        error_cells: Dict[str, Any] = {}
+
+        # Stringify cells
+        # All the row errors share the same stringified cells
+        str_cells: Optional[List[str]] = None
+
+        def get_str_cells() -> List[str]:
+            nonlocal str_cells
+            if str_cells is None:
+                to_str = lambda v: str(v) if v is not None else ""  # type: ignore
+                str_cells = list(map(to_str, cells))  # type: ignore
+            return str_cells
+
+        # Iterate cells
+        for index, field_mapping in enumerate(field_mappings):
+            field, field_number, cell_reader, _ = field_mapping
+            source = cells[index] if len(cells) > index else None
+
+            # Read cell
+            target, notes = cell_reader(source)
+            type_note = notes.pop("type", None) if notes else None
+            if target is None and not type_note:
+                blank_cells[field.name] = source
+
+            # Type error
+            if type_note:
+                error_cells[field.name] = source
+                row_errors.append(
+                    errors.TypeError(
+                        note=type_note,
+                        cells=get_str_cells(),
+                        row_number=self.__row_number,
+                        cell=str(source),
+                        field_name=field.name,
+                        field_number=field_number,
+                    )
+                )
+
+            # Constraint errors
+            if notes:
+                for note in notes.values():
+                    row_errors.append(
+                        errors.ConstraintError(
+                            note=note,
+                            cells=get_str_cells(),
+                            row_number=self.__row_number,
+                            cell=str(source),
+                            field_name=field.name,
+                            field_number=field_number,
+                        )
+                    )
+
+            # Set value
+            values[index] = target
+
+        # Extra cells
+        if len(fields) < len(cells):
+            start = len(fields) + 1
+            iterator = cells[len(fields) :]
+            for field_number, cell in enumerate(iterator, start=start):
+                row_errors.append(
+                    errors.ExtraCellError(
+                        note="",
+                        cells=get_str_cells(),
+                        row_number=self.__row_number,
+                        cell=str(cell),
+                        field_name="",
+                        field_number=field_number,
+                    )
+                )
+
+        # Missing cells
+        if len(fields) > len(cells):
+            start = len(cells) + 1
+            iterator = fields[len(cells) :]
+            for field_number, field in enumerate(iterator, start=start):
+                if field is not None:
+                    row_errors.append(
+                        errors.MissingCellError(
+                            note="",
+                            cells=get_str_cells(),
+                            row_number=self.__row_number,
+                            cell="",
+                            field_name=field.name,
+                            field_number=field_number,
+                        )
+                    )
+
+        # Blank row
+        if len(fields) == len(blank_cells):
+            row_errors = [
+                errors.BlankRowError(
+                    note="",
+                    cells=get_str_cells(),
+                    row_number=self.__row_number,
+                )
+            ]
+
+        # Set processed
+        self.__values = values
+        self.__errors = row_errors or None
+        self.__blank_cells = blank_cells or None
+        self.__error_cells = error_cells or None
+        return values
+
+
+# Internal
+
+
+def write_cells(
+    cells: List[Any],
+    field_info: Dict[str, Any],
+    *,
+    types: List[str],
+    json: bool = False,
+):
+    for index, field_mapping in enumerate(field_info["mapping"].values()):
+        field, _, _, cell_writer = field_mapping
+        if field.type in types:
+            continue
+        # NOTE: Move somehow to be in the json plugin
+        if json is True and field.type == "number" and field.float_number:
+            continue
+        cell, _ = cell_writer(cells[index], ignore_missing=True)
+        cells[index] = cell
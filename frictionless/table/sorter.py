@@ -0,0 +1,198 @@
+from __future__ import annotations
+
+import heapq
+import sys
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Union,
+)
+
+from .. import errors
+from ..exception import FrictionlessException
+from .spill import SpillFile
+
+if TYPE_CHECKING:
+    from ..schema import Schema
+
+# Approximate cost of a row in a run including its sort key
+ROW_ENTRY_SIZE = 200
+ROW_SAMPLE_SIZE = 1000
+MERGE_WIDTH = 64
+
+
+class RowSorter:
+    """Sort rows with bounded memory
+
+    Rows are collected into a run until the memory budget is exhausted.
+    After that the run is sorted and moved to a temporary file (see SpillFile).
+    Finally, the runs are merged. The sort is stable and values of
+    different types are ordered by type (nulls go first).
+
+    Parameters:
+        schema (Schema): schema of the rows
+        field_names (str[]): names of the fields to sort by
+        reverse (bool|bool[]): descending order for all or for every field
+        limit (int): memory limit in bytes
+        on_progress (func?): callback receiving progress messages
+    """
+
+    def __init__(
+        self,
+        *,
+        schema: Schema,
+        field_names: List[str],
+        reverse: Union[bool, List[bool]] = False,
+        limit: int,
+        on_progress: Optional[Callable[[str], None]] = None,
+    ):
+        if isinstance(reverse, list) and len(reverse) != len(field_names):
+            note = "reverse must be a boolean or have a value for every field name"
+            raise FrictionlessException(errors.StepError(note=note))
+        for name in field_names:
+            if not schema.has_field(name):
+                note = f'field "{name}" does not exist'
+                raise FrictionlessException(errors.StepError(note=note))
+        self.__schema = schema
+        self.__limit = limit
+        self.__on_progress = on_progress
+        self.__key, self.__reverse = create_sort_key(
+            [schema.field_names.index(name) for name in field_names],
+            reverse if isinstance(reverse, list) else [reverse] * len(field_names),
+        )
+        self.__files: List[SpillFile] = []
+
+    def sort(self, rows: Iterable[List[Any]]) -> Iterator[List[Any]]:
+        """Sort rows
+
+        Parameters:
+            rows (any[][]): rows as lists of typed cells
+
+        Returns:
+            any[][]: sorted rows
+        """
+        try:
+            yield from self.__sort(rows)
+        finally:
+            for file in self.__files:
+                file.close()
+            self.__files = []
+
+    # Internal
+
+    def __sort(self, rows: Iterable[List[Any]]) -> Iterator[List[Any]]:
+        run: List[List[Any]] = []
+        count = 0
+        size = 0
+        row_size = 0
+        for row in rows:
+            run.append(row)
+            count += 1
+            # Row sizes are sampled as estimating every row is costly
+            if not count % ROW_SAMPLE_SIZE or not row_size:
+                row_size = estimate_row_size(row)
+            size += row_size
+            if size > self.__limit:
+                self.__spill(run)
+                run = []
+                size = 0
+        run.sort(key=self.__key, reverse=self.__reverse)
+        if not self.__files:
+            self.__progress(f"sorted {count} rows in memory")
+            yield from run
+            return
+
+        # Runs are merged by groups of consecutive runs to limit the number of open files
+        while len(self.__files) + 1 > MERGE_WIDTH:
+            groups: List[List[SpillFile]] = []
+            for index in range(0, len(self.__files), MERGE_WIDTH):
+                groups.append(self.__files[index : index + MERGE_WIDTH])
+            self.__progress(f"merging {len(self.__files)} runs into {len(groups)}")
+            self.__files = []
+            for files in groups:
+                target = SpillFile(schema=self.__schema)
+                self.__files.append(target)
+                target.write(self.__merge([file.read() for file in files]))
+                for file in files:
+                    file.close()
+        self.__progress(f"merging {len(self.__files) + 1} runs of {count} rows")
+        yield from self.__merge([file.read() for file in self.__files] + [iter(run)])
+
+    def __spill(self, run: List[List[Any]]):
+        run.sort(key=self.__key, reverse=self.__reverse)
+        file = SpillFile(schema=self.__schema)
+        file.write(run)
+        self.__files.append(file)
+        self.__progress(f"spilled run {len(self.__files)} of {len(run)} rows")
+
+    # The runs are ordered by rows' positions so the merge is stable
+    def __merge(self, runs: List[Iterator[List[Any]]]) -> Iterator[List[Any]]:
+        return heapq.merge(*runs, key=self.__key, reverse=self.__reverse)
+
+    def __progress(self, message: str):
+        if self.__on_progress:
+            self.__on_progress(message)
+
+
+# Internal
+
+
+class Descending:
+    __slots__ = ["value"]
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __lt__(self, other: Descending):
+        return other.value < self.value
+
+    def __eq__(self, other: Any):
+        return self.value == other.value
+
+
+def create_sort_key(indexes: List[int], reverse: List[bool]):
+    # A single direction is handled by the sort itself keeping it stable
+    if all(reverse) or not any(reverse):
+        if len(indexes) == 1:
+            index = indexes[0]
+            key = lambda row: rank_value(row[index])  # type: ignore
+        else:
+            key = lambda row: tuple(rank_value(row[index]) for index in indexes)  # type: ignore
+        return key, bool(reverse and reverse[0])
+
+    # Mixed directions are handled by inverting the descending items
+    def key(row: List[Any]):
+        return tuple(
+            Descending(rank_value(row[index])) if desc else rank_value(row[index])
+            for index, desc in zip(indexes, reverse)
+        )
+
+    return key, False
+
+
+def rank_value(value: Any):
+    # Values are prefixed by a type rank to make them always comparable
+    rank = TYPE_RANKS.get(type(value))
+    if rank is None:
+        rank = "3" + type(value).__name__
+    return (rank, value)
+
+
+def estimate_row_size(row: List[Any]) -> int:
+    return ROW_ENTRY_SIZE + sys.getsizeof(row) + 2 * sum(map(sys.getsizeof, row))
+
+
+TYPE_RANKS = {
+    type(None): "0",
+    bool: "1",
+    int: "1",
+    float: "1",
+    Decimal: "1",
+    str: "2",
+}
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import datetime
+import marshal
+import pickle
+import struct
+import tempfile
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from .. import errors
+from ..exception import FrictionlessException
+
+if TYPE_CHECKING:
+    from ..schema import Schema
+
+# Rows written as a single marshal/pickle block
+SPILL_BLOCK_SIZE = 1000
+SPILL_BLOCK_HEADER = struct.Struct("<cI")
+
+
+class SpillFile:
+    """Temporary file of rows moved to disk
+
+    Rows are written in blocks serialized by `marshal` which is compact and
+    fast for builtin types. Values of number and temporal fields are encoded
+    as builtin types and decoded back on reading. A block having values
+    that can't be marshalled is pickled.
+
+    Parameters:
+        schema (Schema): schema of the rows
+    """
+
+    def __init__(self, *, schema: Schema):
+        self.__file = tempfile.TemporaryFile()
+        self.__codecs = create_codecs(schema)
+        self.__block: List[List[Any]] = []
+        self.__count = 0
+
+    def __len__(self):
+        return self.__count
+
+    def append(self, row: List[Any]) -> None:
+        """Write a row to the file"""
+        self.__block.append(row)
+        if len(self.__block) >= SPILL_BLOCK_SIZE:
+            self.__write_block()
+
+    def write(self, rows: Iterable[List[Any]]) -> None:
+        """Write rows to the file"""
+        for row in rows:
+            self.append(row)
+
+    def read(self) -> Iterator[List[Any]]:
+        """Read rows from the file in the writing order"""
+        self.__write_block()
+        self.__file.seek(0)
+        while True:
+            header = self.__file.read(SPILL_BLOCK_HEADER.size)
+            if not header:
+                break
+            tag, size = SPILL_BLOCK_HEADER.unpack(header)
+            data = self.__file.read(size)
+            rows = marshal.loads(data) if tag == b"m" else pickle.loads(data)
+            for row in rows:
+                for index, _, decode in self.__codecs:
+                    row[index] = decode(row[index])
+                yield row
+
+    def close(self) -> None:
+        """Close and delete the file"""
+        self.__file.close()
+
+    # Internal
+
+    def __write_block(self):
+        if not self.__block:
+            return
+        for row in self.__block:
+            for index, encode, _ in self.__codecs:
+                row[index] = encode(row[index])
+        try:
+            tag, data = b"m", marshal.dumps(self.__block)
+        except ValueError:
+            tag, data = b"p", pickle.dumps(self.__block, pickle.HIGHEST_PROTOCOL)
+        try:
+            self.__file.write(SPILL_BLOCK_HEADER.pack(tag, len(data)))
+            self.__file.write(data)
+        except OSError as exception:
+            note = f'cannot spill rows to disk: "{exception}"'
+            raise FrictionlessException(errors.ResourceError(note=note))
+        self.__count += len(self.__block)
+        self.__block = []
+
+
+# Internal
+
+ICodec = Tuple[int, Callable[[Any], Any], Callable[[Any], Any]]
+
+
+def create_codecs(schema: Schema) -> List[ICodec]:
+    codecs: List[ICodec] = []
+    for index, field in enumerate(schema.fields):
+        codec = CODECS.get(field.type)
+        if codec:
+            codecs.append((index, *codec))
+    return codecs
+
+
+# Encoded values are wrapped into a tuple so values of other types
+# (e.g. invalid cells kept as-is) are written unchanged
+def create_codec(type: Any, encode: Callable[[Any], Any], decode: Callable[[Any], Any]):
+    return (
+        lambda value: (encode(value),) if isinstance(value, type) else value,
+        lambda value: decode(value[0]) if isinstance(value, tuple) else value,
+    )
+
+
+CODECS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+    "number": create_codec(Decimal, str, Decimal),
+    "date": create_codec(
+        datetime.date, datetime.date.toordinal, datetime.date.fromordinal
+    ),
+    "datetime": create_codec(
+        datetime.datetime,
+        datetime.datetime.isoformat,
+        datetime.datetime.fromisoformat,
+    ),
+    "time": create_codec(
+        datetime.time, datetime.time.isoformat, datetime.time.fromisoformat
+    ),
+}
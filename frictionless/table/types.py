@@ -1,5 +1,7 @@
 from typing import Iterator
 
+from .batch import Batch
 from .row import Row
 
 IRowStream = Iterator[Row]
+IBatchStream = Iterator[Batch]
@@ -0,0 +1,137 @@
+import pytest
+
+from frictionless import FrictionlessException, Pipeline, Schema, steps
+from frictionless.resources import TableResource
+
+# General
+
+PIPELINE_STEPS = [
+    [steps.table_normalize()],
+    [steps.cell_set(field_name="population", value=100)],
+    [steps.cell_convert(field_name="name", function=str.upper)],
+    [steps.cell_convert(field_name="name", mapping={"france": "FRANCE"})],
+    [steps.cell_convert(value="n/a")],
+    [steps.cell_format(template="Prefix: {0}", field_name="name")],
+    [steps.cell_replace(pattern="france", replace="FRANCE")],
+    [steps.cell_replace(pattern="<regex>[a-z]", replace="x", field_name="name")],
+    [steps.field_add(name="note", value="eu", descriptor={"type": "string"})],
+    [steps.field_add(name="calc", formula="id * 100 + population", position=1)],
+    [steps.field_add(name="number", incremental=True)],
+    [steps.field_filter(names=["id", "name"])],
+    [steps.field_move(name="id", position=3)],
+    [steps.field_remove(names=["id"])],
+    [steps.row_filter(formula="id > 1")],
+    [steps.row_filter(function=lambda row: row["name"] != "france")],
+    [
+        steps.field_add(name="calc", formula="population * 2"),
+        steps.row_filter(formula="calc > 100"),
+        steps.row_sort(field_names=["calc"]),
+        steps.cell_set(field_name="name", value="sorted"),
+        steps.field_remove(names=["population"]),
+    ],
+]
+
+
+@pytest.mark.parametrize("pipeline_steps", PIPELINE_STEPS)
+def test_resource_transform_streaming(pipeline_steps):
+    results = []
+    for streaming in [False, True]:
+        source = TableResource(path="data/transform.csv")
+        pipeline = Pipeline(steps=[steps.table_normalize(), *pipeline_steps])
+        target = source.transform(pipeline, streaming=streaming)
+        rows = [row.to_dict() for row in target.read_rows()]
+        results.append((target.schema.to_descriptor(), rows))
+    assert results[0] == results[1]
+
+
+@pytest.mark.parametrize("pipeline_steps", PIPELINE_STEPS)
+@pytest.mark.parametrize("source", ["data/transform.csv", "invalid"])
+def test_resource_transform_streaming_typed_cells(pipeline_steps, source):
+    results = []
+    for streaming in [False, True]:
+        resource = create_resource(source)
+        # Only the default mode needs the source to be normalized
+        normalize = [] if streaming else [steps.table_normalize()]
+        pipeline = Pipeline(steps=[*normalize, *pipeline_steps])
+        try:
+            target = resource.transform(pipeline, streaming=streaming)
+            rows = [row.to_dict() for row in target.read_rows()]
+            results.append((target.schema.to_descriptor(), rows))
+        except FrictionlessException as exception:
+            results.append(exception.error.note)
+    assert results[0] == results[1]
+
+
+def test_resource_transform_streaming_typed_cells_semantics():
+    pipeline_steps = [
+        steps.cell_convert(field_name="population", mapping={83: 1}),
+        steps.cell_convert(field_name="id", function=lambda value: value * 10),
+        steps.cell_format(template="<{0}>", field_name="name"),
+    ]
+    data = [["id", "name", "population"], ["1", "", "83"], ["2", "france", "66"]]
+    source = TableResource(data=data)
+    target = source.transform(Pipeline(steps=pipeline_steps), streaming=True)
+    assert target.read_cells() == [
+        ["id", "name", "population"],
+        [10, "<None>", 1],
+        [20, "<france>", 66],
+    ]
+
+
+def test_resource_transform_streaming_fused_steps():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.field_add(name="calc", formula="id * 10"),
+            steps.row_filter(formula="calc > 10"),
+            steps.field_remove(names=["id"]),
+        ]
+    )
+    target = source.transform(pipeline, streaming=True)
+    assert target.data.data.steps == pipeline.steps
+    assert target.read_rows() == [
+        {"name": "france", "population": 66, "calc": 20},
+        {"name": "spain", "population": 47, "calc": 30},
+    ]
+    # The data can be read again
+    assert len(target.read_rows()) == 2
+
+
+def test_resource_transform_streaming_step_error():
+    source = TableResource(path="data/transform.csv")
+    pipeline = Pipeline(
+        steps=[
+            steps.cell_set(field_name="population", value=100),
+            steps.row_filter(function=lambda row: row["missing"]),
+        ]
+    )
+    target = source.transform(pipeline, streaming=True)
+    with pytest.raises(FrictionlessException) as excinfo:
+        target.read_rows()
+    error = excinfo.value.error
+    assert error.type == "step-error"
+    assert error.note.count('"row_filter" raises')
+
+
+# Internal
+
+
+def create_resource(source: str) -> TableResource:
+    if source == "invalid":
+        data = [
+            ["id", "name", "population"],
+            ["1", "germany", "83"],
+            ["bad", "", "66"],
+            ["3", "spain", ""],
+        ]
+        schema = Schema.from_descriptor(
+            {
+                "fields": [
+                    {"name": "id", "type": "integer"},
+                    {"name": "name", "type": "string"},
+                    {"name": "population", "type": "integer"},
+                ]
+            }
+        )
+        return TableResource(data=data, schema=schema)
+    return TableResource(path=source)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
 
 from .. import errors
 from ..dialect import Dialect
@@ -9,9 +9,11 @@ from ..helpers import get_name
 from ..pipeline import Pipeline
 
 if TYPE_CHECKING:
+    from .. import types
     from ..package import Package
     from ..pipeline import Step
     from ..resources import TableResource
+    from ..schema import Schema
 
 
 class Transformer:
@@ -29,7 +31,9 @@ class Transformer:
     # Resource
 
     # TODO: save transform info into resource.stats?
-    def transform_table_resource(self, resource: TableResource, pipeline: Pipeline):
+    def transform_table_resource(
+        self, resource: TableResource, pipeline: Pipeline, *, streaming: bool = False
+    ):
         # Prepare resource
         resource.infer()
 
@@ -37,10 +41,22 @@ class Transformer:
         pipeline = pipeline or Pipeline()
 
         # Run transforms
-        for step in pipeline.steps:
-            data = resource.data
+        steps = list(pipeline.steps)
+        while steps:
+            # Fuse row transforms
+            # In the streaming mode consecutive steps supporting it are applied
+            # to typed rows in a single pass instead of being chained using petl
+            if streaming:
+                fused = self.__fuse_row_transforms(resource, steps)
+                if fused:
+                    steps = steps[len(fused.steps) :]
+                    reset_table_resource(resource, fused, step=fused.steps[0])
+                    resource.schema = fused.schema
+                    continue
 
             # Transform
+            step = steps.pop(0)
+            data = resource.data
             try:
                 step.transform_resource(resource)
             except Exception as exception:
@@ -51,27 +67,108 @@ class Transformer:
             # TODO: review this code
             # https://github.com/frictionlessdata/frictionless-py/issues/722
             if resource.data is not data:
-                resource.path = None
-                resource.data = DataWithErrorHandling(resource.data, step=step)
-                resource.scheme = ""
-                resource.format = "inline"
-                resource.encoding = None
-                resource.compression = None
-                resource.extrapaths = []
-                resource.innerpath = None
-                resource.dialect = Dialect()
-                resource.stats.md5 = None
-                resource.stats.sha256 = None
-                resource.stats.bytes = None
-                resource.stats.fields = None
-                resource.stats.rows = None
+                reset_table_resource(resource, resource.data, step=step)
 
         return resource
 
+    def __fuse_row_transforms(self, resource: TableResource, steps: List[Step]):
+        schema = resource.schema
+        fused_steps: List[Step] = []
+        for step in steps:
+            target = schema.to_copy()
+            if not create_row_transform(step, target):
+                break
+            schema = target
+            fused_steps.append(step)
+        if fused_steps:
+            return FusedRowStream(resource.to_copy(), schema=schema, steps=fused_steps)
+
 
 # Internal
 
 
+def reset_table_resource(resource: TableResource, data: Any, *, step: Step):
+    resource.path = None
+    resource.data = DataWithErrorHandling(data, step=step)
+    resource.scheme = ""
+    resource.format = "inline"
+    resource.encoding = None
+    resource.compression = None
+    resource.extrapaths = []
+    resource.innerpath = None
+    resource.dialect = Dialect()
+    resource.stats.md5 = None
+    resource.stats.sha256 = None
+    resource.stats.bytes = None
+    resource.stats.fields = None
+    resource.stats.rows = None
+
+
+class FusedRowStream:
+    """Typed rows of a resource transformed by fused row transforms
+
+    The source is read once and every row is passed through the transforms
+    of all the steps. Steps receive typed cells as if the pipeline started
+    with "table_normalize" (invalid cells are None).
+    """
+
+    def __init__(self, resource: TableResource, *, schema: Schema, steps: List[Step]):
+        self.resource = resource
+        self.schema = schema
+        self.steps = steps
+
+    def __repr__(self):
+        return "<transformed-data>"
+
+    def __iter__(self):  # type: ignore
+        # Transforms are created for every iteration as they can be stateful
+        schema = self.resource.schema.to_copy()
+        transforms: List[types.IRowTransformFunction] = []
+        for step in self.steps:
+            transforms.append(create_row_transform(step, schema))  # type: ignore
+        position = 0
+        with self.resource as resource:
+            yield self.schema.field_names
+            for row in resource.row_stream:
+                cells = row.to_list()
+                try:
+                    for position, transform in enumerate(transforms):
+                        cells = transform(cells)  # type: ignore
+                        if cells is None:
+                            break
+                except Exception as exception:
+                    step = self.steps[position]
+                    error = errors.StepError(
+                        note=f'"{get_name(step)}" raises "{exception}"'
+                    )
+                    raise FrictionlessException(error) from exception
+                if cells is not None:
+                    yield cells
+
+
+# Invalid cells are kept as-is to be reported later
+def read_cells(resource: TableResource) -> Iterator[List[Any]]:
+    indexes: Dict[str, int] = {
+        name: index for index, name in enumerate(resource.schema.field_names)
+    }
+    for row in resource.row_stream:
+        cells = row.to_list()
+        for name, cell in row.error_cells.items():
+            if name in indexes:
+                cells[indexes[name]] = cell
+        yield cells
+
+
+def create_row_transform(
+    step: Step, schema: Schema
+) -> Optional[types.IRowTransformFunction]:
+    try:
+        return step.create_row_transform(schema)
+    except Exception as exception:
+        error = errors.StepError(note=f'"{get_name(step)}" raises "{exception}"')
+        raise FrictionlessException(error) from exception
+
+
 # TODO: do we need error handling here?
 class DataWithErrorHandling:
     def __init__(self, data: Any, *, step: Step):
@@ -8,6 +8,7 @@ from typing import (
     Iterable,
     List,
     Literal,
+    Optional,
     Protocol,
     TextIO,
     Union,
@@ -34,6 +35,7 @@ ISample = List[List[Any]]
 IFragment = List[List[Any]]
 ILabels = List[str]
 IOnerror = Literal["ignore", "warn", "raise"]
+IHashing = Literal["auto", "none", "md5", "sha256", "both"]
 ITabularData = Dict[str, List[Dict[str, Any]]]
 
 
@@ -62,3 +64,7 @@ class ICallbackFunction(Protocol):
 
 class IStepFunction(Protocol):
     def __call__(self, source: Union[Resource, Package]) -> None: ...
+
+
+class IRowTransformFunction(Protocol):
+    def __call__(self, cells: List[Any]) -> Optional[List[Any]]: ...
@@ -1,8 +1,10 @@
+import asyncio
 import json
+import time
 
 import pytest
 
-from frictionless import Package
+from frictionless import Check, Checklist, Package, checks, errors, system
 
 # General
 
@@ -36,3 +38,65 @@ def test_package_validate_with_parallel():
         [1, 3, None, "primary-key"],
         [2, 4, None, "blank-row"],
     ]
+
+
+# Async
+
+
+def test_package_avalidate():
+    package = Package("data/invalid/datapackage.json")
+    report = asyncio.run(package.avalidate(concurrency=2))
+    assert report.flatten(["taskNumber", "rowNumber", "fieldNumber", "type"]) == [
+        [1, 3, None, "blank-row"],
+        [1, 3, None, "primary-key"],
+        [2, 4, None, "blank-row"],
+    ]
+
+
+def test_package_avalidate_remote(http_server):
+    resources = [
+        {"name": f"table{number}", "path": http_server % "table.csv"}
+        for number in range(10)
+    ]
+    package = Package({"resources": resources})
+    report = asyncio.run(package.avalidate(concurrency=4))
+    assert report.valid
+    assert report.stats["tasks"] == 10
+
+
+def test_package_avalidate_stateful_checks():
+    resources = []
+    for number in range(8):
+        data = [["id", "value"]] + [[index, 100 + index % 2] for index in range(1, 501)]
+        resources.append({"name": f"table{number}", "data": data})
+    package = Package({"resources": resources})
+    checklist = Checklist(
+        checks=[
+            checks.sequential_value(field_name="id"),
+            checks.deviated_value(field_name="value"),
+        ]
+    )
+    report = asyncio.run(package.avalidate(checklist=checklist, concurrency=8))
+    assert report.valid
+    assert report.stats["tasks"] == 8
+
+
+def test_package_avalidate_nested_context():
+    class context_check(Check):
+        type = "context-check"
+        Errors = [errors.CheckError]
+
+        def validate_start(self):
+            name = self.resource.name
+            with system.use_context(inference_cache=name):
+                time.sleep(0.05)
+                if system.inference_cache != name:
+                    yield errors.CheckError(note="context is shared")
+
+    resources = [{"name": f"table{number}", "data": [["id"], [1]]} for number in range(4)]
+    package = Package({"resources": resources})
+    checklist = Checklist(checks=[context_check()])
+    report = asyncio.run(package.avalidate(checklist=checklist, concurrency=4))
+    assert report.valid
+    assert system.inference_cache is None
+    assert system.key_index is None
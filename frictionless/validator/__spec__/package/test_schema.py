@@ -1,6 +1,7 @@
 from copy import deepcopy
 
-from frictionless import Detector, Package, Resource, Schema, fields
+from frictionless import Detector, Package, Resource, Schema, fields, system
+from frictionless.table.keys import KeyIndex
 
 # General
 
@@ -82,6 +83,31 @@ def test_package_validate_schema_foreign_key_self_referenced_resource_violation(
     ]
 
 
+def test_package_validate_schema_foreign_key_self_referenced_resource_violation_limit_memory():
+    descriptor = deepcopy(DESCRIPTOR_FK)
+    del descriptor["resources"][0]["data"][4]
+    package = Package(descriptor)
+    with system.use_context(limit_memory=0):
+        report = package.validate()
+    assert report.flatten(["rowNumber", "fieldNumber", "type", "cells"]) == [
+        [4, None, "foreign-key", ["3", "rome", "4"]],
+    ]
+
+
+def test_package_validate_schema_foreign_key_key_index():
+    descriptor = deepcopy(DESCRIPTOR_FK)
+    descriptor["resources"].append(deepcopy(descriptor["resources"][0]))
+    descriptor["resources"][2]["name"] = "cities2"
+    package = Package(descriptor)
+    index = KeyIndex(limit=1024 * 1024)
+    with system.use_context(key_index=index):
+        report = package.validate()
+    assert report.valid
+    keys = index.get(package.get_resource("people"), ("label",))
+    assert keys is not None
+    assert (1,) in keys
+
+
 def test_package_validate_schema_foreign_key_internal_resource_violation():
     descriptor = deepcopy(DESCRIPTOR_FK)
     del descriptor["resources"][1]["data"][4]
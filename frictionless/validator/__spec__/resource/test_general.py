@@ -8,6 +8,8 @@ from frictionless import (
     Detector,
     FrictionlessException,
     Resource,
+    Schema,
+    checks,
     errors,
 )
 from frictionless.resources import TableResource
@@ -450,3 +452,172 @@ def test_resource_validate_resource_metadata_errors_with_fields_993():
     assert error.note == "descriptor is not valid"
     assert reasons[0].type == "resource-error"
     assert reasons[0].note == '"fields" should be set as "schema.fields"'
+
+
+# Batch
+
+
+def test_resource_validate_batch_size():
+    resource = TableResource(path="data/invalid.csv")
+    report = resource.validate(batch_size=2)
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [None, 3, "blank-label"],
+        [None, 4, "duplicate-label"],
+        [2, 3, "missing-cell"],
+        [2, 4, "missing-cell"],
+        [3, 3, "missing-cell"],
+        [3, 4, "missing-cell"],
+        [4, None, "blank-row"],
+        [5, 5, "extra-cell"],
+    ]
+
+
+def test_resource_validate_batch_size_limit_rows():
+    resource = TableResource(path="data/invalid.csv")
+    report = resource.validate(batch_size=2, limit_rows=3)
+    assert report.task.warnings == ["reached row limit: 3"]
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [None, 3, "blank-label"],
+        [None, 4, "duplicate-label"],
+        [2, 3, "missing-cell"],
+        [2, 4, "missing-cell"],
+        [3, 3, "missing-cell"],
+        [3, 4, "missing-cell"],
+        [4, None, "blank-row"],
+    ]
+
+
+def test_resource_validate_batch_size_with_row_checks():
+    checklist = Checklist(checks=[checks.duplicate_row()])
+    resource = TableResource(path="data/duplicate-rows.csv")
+    report = resource.validate(checklist, batch_size=2)
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [4, None, "duplicate-row"],
+    ]
+
+
+# Workers
+
+
+def test_resource_validate_workers(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n1,english\n2,german\n3,bad\n1,german\n4,\n5,multi\n")
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer", "constraints": {"unique": True}},
+                {"name": "name", "type": "string"},
+            ],
+            "primaryKey": ["name"],
+        }
+    )
+    resource = TableResource(path="table.csv", basepath=str(tmpdir), schema=schema)
+    report = resource.validate(workers=2)
+    assert report.flatten(["rowNumber", "fieldNumber", "type", "note"]) == [
+        [5, 1, "unique-error", "the same as in the row at position 2"],
+        [5, None, "primary-key", "the same as in the row at position 3"],
+        [6, None, "primary-key", 'cells composing the primary keys are all "None"'],
+    ]
+    assert report.task.stats["rows"] == 6
+
+
+def test_resource_validate_workers_with_cross_row_checks(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write('id,name\n1,a\n2,"b\nc"\n3,c\n4,a\n5,"b\nc"\n7,d\n8,e\n')
+    checklist = Checklist(
+        checks=[
+            checks.duplicate_row(),
+            checks.sequential_value(field_name="id"),
+            checks.required_value(field_name="name", values=["e", "f"]),
+        ]
+    )
+    resource = TableResource(path="table.csv", basepath=str(tmpdir))
+    report = resource.validate(checklist, workers=3)
+    assert report.flatten(["rowNumber", "type", "note"]) == [
+        [7, "sequential-value", "the value is not sequential"],
+        [
+            None,
+            "required-value",
+            'The value "f" is required to be present in field "name" in at least one row.',
+        ],
+    ]
+    assert report.task.stats["rows"] == 7
+
+
+def test_resource_validate_workers_same_as_sequential(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name,score\n")
+        for number in range(1, 101):
+            file.write(f"{number % 40},name{number % 30},{number % 7 or 'x'}\n")
+    checklist = Checklist(
+        checks=[
+            checks.duplicate_row(),
+            checks.deviated_value(field_name="id", interval=1),
+        ]
+    )
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer", "constraints": {"unique": True}},
+                {"name": "name", "type": "string"},
+                {"name": "score", "type": "integer"},
+            ],
+        }
+    )
+    report1 = TableResource(
+        path="table.csv", basepath=str(tmpdir), schema=schema.to_copy()
+    ).validate(checklist)
+    report2 = TableResource(
+        path="table.csv", basepath=str(tmpdir), schema=schema.to_copy()
+    ).validate(checklist, workers=4)
+    assert report1.flatten(["rowNumber", "type", "note", "cells"]) == report2.flatten(
+        ["rowNumber", "type", "note", "cells"]
+    )
+    assert report1.task.stats["rows"] == report2.task.stats["rows"]
+    assert report1.task.stats["md5"] == report2.task.stats["md5"]
+
+
+def test_resource_validate_workers_same_as_sequential_with_primary_key(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id,name\n")
+        for number in range(1, 101):
+            file.write(f"{number % 3},name{number % 11}\n")
+    checklist = Checklist(checks=[checks.duplicate_row()])
+    schema = Schema.from_descriptor(
+        {
+            "fields": [
+                {"name": "id", "type": "integer"},
+                {"name": "name", "type": "string"},
+            ],
+            "primaryKey": ["id", "name"],
+        }
+    )
+    report1 = TableResource(
+        path="table.csv", basepath=str(tmpdir), schema=schema.to_copy()
+    ).validate(checklist)
+    report2 = TableResource(
+        path="table.csv", basepath=str(tmpdir), schema=schema.to_copy()
+    ).validate(checklist, workers=3)
+    assert report1.flatten(["rowNumber", "type", "note"]) == report2.flatten(
+        ["rowNumber", "type", "note"]
+    )
+    assert len(report2.flatten()) == 134
+
+
+def test_resource_validate_workers_limit_errors(tmpdir):
+    path = str(tmpdir.join("table.csv"))
+    with open(path, "w") as file:
+        file.write("id\n" + "x\n1\n" * 50)
+    schema = Schema.from_descriptor({"fields": [{"name": "id", "type": "integer"}]})
+    resource = TableResource(path="table.csv", basepath=str(tmpdir), schema=schema)
+    report = resource.validate(workers=2, limit_errors=3)
+    assert report.task.warnings == ["reached error limit: 3"]
+    assert report.flatten(["rowNumber", "type"]) == [
+        [2, "type-error"],
+        [4, "type-error"],
+        [6, "type-error"],
+    ]
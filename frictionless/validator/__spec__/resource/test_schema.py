@@ -10,6 +10,7 @@ from frictionless import (
     FrictionlessException,
     Schema,
     fields,
+    system,
 )
 from frictionless.resources import TableResource
 
@@ -241,6 +242,19 @@ def test_resource_validate_schema_primary_key_and_unique_error():
     ]
 
 
+def test_resource_validate_schema_primary_key_and_unique_error_limit_memory():
+    resource = TableResource(
+        path="data/unique-field.csv",
+        schema="data/unique-field.json",
+    )
+    with system.use_context(limit_memory=0):
+        report = resource.validate()
+    assert report.flatten(["rowNumber", "fieldNumber", "type"]) == [
+        [10, 1, "unique-error"],
+        [10, None, "primary-key"],
+    ]
+
+
 def test_resource_validate_schema_primary_key_error_composite():
     source = [
         ["id", "name"],
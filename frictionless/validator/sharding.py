@@ -0,0 +1,666 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import os
+from multiprocessing import Pool
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
+
+from .. import errors, helpers, settings
+from ..checklist import Checklist
+from ..dialect import Dialect
+from ..platform import platform
+from ..schema import Schema
+from ..system import system
+
+if TYPE_CHECKING:
+    from .. import types
+    from ..checklist import Check
+    from ..error import Error
+    from ..resources import TableResource
+
+# NOTE:
+# Shards are found by counting quote chars from the beginning of the file
+# (a newline is a record boundary only if the amount of quotes before it
+# is even) so quote chars are expected to be used only for quoting fields
+# as it's defined by RFC 4180; files using an escape char are not sharded
+
+# Checks validated by workers as-is
+LOCAL_CHECK_TYPES = [
+    "baseline",
+    "ascii-value",
+    "forbidden-value",
+    "truncated-value",
+    "row-constraint",
+]
+
+# Checks having states collected by workers for the merge phase
+STATE_CHECK_TYPES = [
+    "duplicate-row",
+    "sequential-value",
+    "deviated-value",
+    "required-value",
+]
+
+# Checks validated by workers and completed by the merge phase
+MERGED_CHECK_TYPES = [*STATE_CHECK_TYPES, "table-dimensions"]
+
+# Checks validated only by the merge phase
+MAIN_CHECK_TYPES = [
+    "deviated-value",
+    "required-value",
+    "table-dimensions",
+]
+
+# Merges of the errors referencing a matching row by a key
+KEY_MERGE_ERRORS = {
+    "unique": errors.UniqueError,
+    "primary-key": errors.PrimaryKeyError,
+    "duplicate-row": errors.DuplicateRowError,
+}
+KEY_MERGE_TYPES = list(KEY_MERGE_ERRORS)
+
+# Merges of the errors found by the row stream instead of a check
+INTEGRITY_MERGE_TYPES = ["unique", "primary-key"]
+
+
+def is_shardable(resource: TableResource, *, checks: List[Check]) -> bool:
+    """Check whether an opened resource can be validated in shards"""
+    dialect = resource.dialect
+    control = platform.frictionless_formats.CsvControl.from_dialect(dialect)
+    encoding = resource.encoding or settings.DEFAULT_ENCODING
+
+    # Source
+    if resource.format not in ["csv", "tsv"] or resource.scheme != "file":
+        return False
+    if not resource.normpath or resource.multipart or resource.compression:
+        return False
+
+    # Dialect
+    if dialect.comment_rows or control.escape_char or not control.quote_char:
+        return False
+    for char in ["\n", control.quote_char]:
+        try:
+            if char.encode(encoding) != char.encode("ascii"):
+                return False
+        except (LookupError, UnicodeEncodeError):
+            return False
+    if b"\r" in resource.buffer.replace(b"\r\n", b""):
+        return False
+
+    # Schema
+    if resource.schema.foreign_keys or resource.detector.schema_sync:
+        return False
+    if not resource.header.valid:
+        return False
+
+    # Checks
+    for check in checks:
+        if check.type not in LOCAL_CHECK_TYPES + MERGED_CHECK_TYPES:
+            return False
+
+    return True
+
+
+def validate_shards(
+    resource: TableResource,
+    *,
+    checks: List[Check],
+    checklist: Checklist,
+    workers: int,
+    limit_errors: int,
+    batch_size: Optional[int],
+) -> List[Error]:
+    """Validate an opened resource in shards using a pool of workers
+
+    Rows are validated by worker processes and cross-row checks are
+    completed by a merge phase in the calling process. It returns
+    row errors in the row order and updates resource stats.
+    """
+    dialect = resource.dialect
+    control = platform.frictionless_formats.CsvControl.from_dialect(dialect)
+    path: str = resource.normpath  # type: ignore
+    first_record = dialect.create_first_content_row() - 1
+
+    # Prepare options
+    shard_dialect = Dialect.from_descriptor(dialect.to_descriptor())
+    shard_dialect.header = False
+    shard_control = platform.frictionless_formats.CsvControl.from_dialect(dialect)
+    for name in ["delimiter", "quote_char", "double_quote", "skip_initial_space"]:
+        setattr(shard_control, name, getattr(control, name))
+    shard_dialect.set_control(shard_control)
+    merges = create_merges(resource, checks=checks)
+    options: Dict[str, Any] = {}
+    options["path"] = path
+    options["quoteChar"] = control.quote_char.encode("ascii")
+    options["resource"] = {
+        "format": resource.format,
+        "encoding": resource.encoding,
+        "dialect": shard_dialect.to_descriptor(),
+        "schema": resource.schema.to_descriptor(),
+    }
+    options["checklist"] = Checklist(
+        checks=[
+            check for check in checks if check.type not in ["baseline", *MAIN_CHECK_TYPES]
+        ],
+        pick_errors=checklist.pick_errors,
+        skip_errors=checklist.skip_errors,
+    ).to_descriptor()
+    options["merges"] = merges
+    options["validate"] = {"limit_errors": limit_errors, "batch_size": batch_size}
+
+    # Validate shards
+    scanner = ShardScanner(
+        path,
+        count=workers,
+        first_record=first_record,
+        quote_char=options["quoteChar"],
+        algorithms=helpers.parse_hashing_algorithms(system.hashing, hash=resource.hash),
+    )
+    shards: List[Tuple[int, int]] = []
+    results: List[Dict[str, Any]] = []
+    with Pool(workers) as pool:
+        shard_options = (
+            dict(options, start=start, end=end) for start, end in scanner.read_shards()
+        )
+        for shard, result in pool.imap(validate_shard, shard_options):
+            shards.append(shard)
+            results.append(result)
+
+        # Merge shards
+        merger = ShardMerger(resource, checks=checks, merges=merges)
+        offset = first_record
+        for result in results:
+            merger.merge_shard(result, offset=offset)
+            offset += result["records"]
+
+        # Read cells
+        # Cross-shard errors are found only by the merge phase so cells
+        # of the rows having them are read here by the workers again
+        requests = merger.cell_requests
+        cell_options: List[Dict[str, Any]] = []
+        for index, row_numbers in sorted(requests.items()):
+            start, end = shards[index]
+            cell_options.append(
+                dict(options, start=start, end=end, rowNumbers=row_numbers)
+            )
+        for index, cells in zip(
+            sorted(requests), pool.map(read_shard_cells, cell_options)
+        ):
+            merger.merge_cells(index, cells)
+
+        # Stop workers
+        # Workers are closed gracefully instead of being terminated on exit
+        pool.close()
+        pool.join()
+
+    # Update stats
+    resource.stats.md5 = scanner.md5
+    resource.stats.sha256 = scanner.sha256
+    resource.stats.bytes = scanner.bytes
+    resource.stats.rows = sum(result["rows"] for result in results)
+
+    return [error for error in merger.errors if checklist.match(error)]
+
+
+# Internal
+
+
+def create_merges(
+    resource: TableResource, *, checks: List[Check]
+) -> List[Dict[str, Any]]:
+    merges: List[Dict[str, Any]] = []
+    for field in resource.schema.fields:
+        if field.constraints.get("unique"):
+            merges.append({"type": "unique", "fieldName": field.name})
+    if resource.schema.primary_key:
+        merges.append({"type": "primary-key"})
+    for index, check in enumerate(checks):
+        if check.type in STATE_CHECK_TYPES:
+            merge = {"type": check.type, "checkIndex": index}
+            merge["fieldName"] = getattr(check, "field_name", None)
+            if check.type == "required-value":
+                merge["values"] = getattr(check, "values")
+            merges.append(merge)
+    return merges
+
+
+def find_key_merge(
+    merges: List[Dict[str, Any]], descriptor: types.IDescriptor
+) -> Optional[int]:
+    for index, merge in enumerate(merges):
+        Error = KEY_MERGE_ERRORS.get(merge["type"])
+        if Error and Error.type == descriptor["type"]:
+            if merge.get("fieldName") == descriptor.get("fieldName"):
+                return index
+    return None
+
+
+def open_shard(options: types.IDescriptor) -> TableResource:
+    TableResource = platform.frictionless_resources.TableResource
+    stream = io.BufferedReader(
+        ShardByteStream(options["path"], start=options["start"], end=options["end"])
+    )
+    return TableResource(
+        data=stream,
+        format=options["resource"]["format"],
+        encoding=options["resource"]["encoding"],
+        dialect=Dialect.from_descriptor(options["resource"]["dialect"]),
+        schema=Schema.from_descriptor(options["resource"]["schema"]),
+    )
+
+
+def validate_shard(options: types.IDescriptor) -> Tuple[Tuple[int, int], Dict[str, Any]]:
+    shard = (options["start"], options["end"])
+    checklist = Checklist.from_descriptor(options["checklist"])
+    merges = options["merges"]
+    states: List[Any] = [None] * len(merges)
+    matches: List[Dict[int, int]] = [{} for _ in merges]
+
+    # Count records
+    with open(options["path"], "rb") as file:
+        records = count_records(
+            file,
+            start=options["start"],
+            end=options["end"],
+            quote_char=options["quoteChar"],
+        )
+
+    # Collect merge states
+    resource = open_shard(options)
+
+    def on_row(row: Any):
+        for index, merge in enumerate(merges):
+            type = merge["type"]
+            if type in KEY_MERGE_TYPES:
+                if type == "unique":
+                    key = row[merge["fieldName"]]
+                elif type == "primary-key":
+                    key = resource.primary_key_cells(row, case_sensitive=True)
+                    key = None if set(key) == {None} else key
+                else:
+                    text = ",".join(map(str, row.values()))
+                    key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+                if key is not None:
+                    state = states[index] = states[index] or {}
+                    numbers = state.setdefault(key, [row.row_number, row.row_number])
+                    if numbers[1] != row.row_number:
+                        matches[index][row.row_number] = numbers[1]
+                    numbers[1] = row.row_number
+            elif type == "sequential-value":
+                cell = row[merge["fieldName"]]
+                if states[index] is None:
+                    states[index] = [row.row_number, cell, cell]
+                states[index][2] = cell
+            elif type == "deviated-value":
+                cell = row[merge["fieldName"]]
+                if cell is not None:
+                    states[index] = states[index] or []
+                    states[index].append([row.row_number, cell])
+            elif type == "required-value":
+                cell = row[merge["fieldName"]]
+                if cell in merge["values"]:
+                    states[index] = states[index] or set()
+                    states[index].add(cell)
+
+    # Validate shard
+    # File digests are calculated by the scanner so shards are not hashed
+    with system.use_context(hashing="none"):
+        report = resource.validate(
+            checklist,
+            on_row=on_row if merges else None,
+            **options["validate"],
+        )
+    result: Dict[str, Any] = {}
+    result["records"] = records
+    result["rows"] = report.task.stats.get("rows", 0)
+    result["errors"] = [error.to_descriptor() for error in report.task.errors]
+    result["states"] = states
+
+    # Collect error matches
+    # Row numbers referenced by the errors are taken from the merge states
+    # to be offset by the merge phase instead of being parsed from notes
+    result["matches"] = []
+    for descriptor in result["errors"]:
+        match = None
+        index = find_key_merge(merges, descriptor)
+        if index is not None:
+            match = matches[index].get(descriptor.get("rowNumber"))  # type: ignore
+        result["matches"].append(match)
+    return shard, result
+
+
+def read_shard_cells(options: types.IDescriptor) -> Dict[int, List[Any]]:
+    cells: Dict[int, List[Any]] = {}
+    row_numbers = set(options["rowNumbers"])
+    last_row_number = max(row_numbers)
+    with system.use_context(hashing="none"), open_shard(options) as resource:
+        for row_number, row_cells in enumerate(resource.cell_stream, start=1):
+            if row_number in row_numbers:
+                cells[row_number] = row_cells
+            if row_number >= last_row_number:
+                break
+    return cells
+
+
+def count_records(
+    file: types.IByteStream, *, start: int, end: int, quote_char: bytes
+) -> int:
+    count = 0
+    quoted = False
+    last = b""
+    file.seek(start)
+    position = start
+    while position < end:
+        block = file.read(min(settings.DEFAULT_SHARD_BLOCK_SIZE, end - position))
+        if not block:
+            break
+        position += len(block)
+        last = block[-1:]
+        if quote_char not in block:
+            if not quoted:
+                count += block.count(b"\n")
+            continue
+        parts = block.split(quote_char)
+        for part in parts[int(quoted) :: 2]:
+            count += part.count(b"\n")
+        quoted = quoted != (len(parts) % 2 == 0)
+    if last and last != b"\n":
+        count += 1
+    return count
+
+
+class ShardByteStream(io.RawIOBase):
+    """Byte stream limited to a byte range of a file"""
+
+    def __init__(self, path: str, *, start: int, end: int):
+        self.name = path
+        self.__file = open(path, "rb")
+        self.__start = start
+        self.__end = end
+        self.__file.seek(start)
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, buffer: Any):
+        size = min(len(buffer), self.__end - self.__file.tell())
+        if size <= 0:
+            return 0
+        chunk = self.__file.read(size)
+        buffer[: len(chunk)] = chunk
+        return len(chunk)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET):
+        if whence == io.SEEK_SET:
+            offset = self.__start + offset
+        elif whence == io.SEEK_CUR:
+            offset = self.__file.tell() + offset
+        else:
+            offset = self.__end + offset
+        self.__file.seek(min(max(offset, self.__start), self.__end))
+        return self.tell()
+
+    def tell(self):
+        return self.__file.tell() - self.__start
+
+    def close(self):
+        self.__file.close()
+        super().close()
+
+
+class ShardScanner:
+    """Find shard boundaries and file stats reading a file only once"""
+
+    def __init__(
+        self,
+        path: str,
+        *,
+        count: int,
+        first_record: int,
+        quote_char: bytes,
+        algorithms: List[str],
+    ):
+        self.__path = path
+        self.__algorithms = algorithms
+        self.__count = count
+        self.__first_record = first_record
+        self.__quote_char = quote_char
+        self.md5: Optional[str] = None
+        self.sha256: Optional[str] = None
+        self.bytes = 0
+
+    def read_shards(self) -> Iterator[Tuple[int, int]]:
+        hashers = {algorithm: hashlib.new(algorithm) for algorithm in self.__algorithms}
+        size = os.path.getsize(self.__path)
+        quote_char = self.__quote_char
+        skip = self.__first_record
+        start: Optional[int] = None
+        target = 0
+        quoted = False
+        position = 0
+
+        # Start shards
+        def start_shards(offset: int):
+            nonlocal start, target, shard_size
+            start = offset
+            shard_size = max(-(-(size - start) // self.__count), 1)
+            target = start + shard_size
+
+        shard_size = 0
+        if not skip:
+            start_shards(0)
+
+        # Read blocks
+        with open(self.__path, "rb") as file:
+            while True:
+                block = file.read(settings.DEFAULT_SHARD_BLOCK_SIZE)
+                if not block:
+                    break
+                for hasher in hashers.values():
+                    hasher.update(block)
+                index = 0
+                while True:
+                    # Jump to the target
+                    if start is not None:
+                        jump = target - position
+                        if jump >= len(block):
+                            break
+                        if jump > index:
+                            quoted = quoted != (
+                                block.count(quote_char, index, jump) % 2 == 1
+                            )
+                            index = jump
+
+                    # Find a record end
+                    newline = block.find(b"\n", index)
+                    if newline == -1:
+                        break
+                    quoted = quoted != (block.count(quote_char, index, newline) % 2 == 1)
+                    index = newline + 1
+                    if quoted:
+                        continue
+
+                    # Skip header
+                    if start is None:
+                        skip -= 1
+                        if not skip:
+                            start_shards(position + index)
+                        continue
+
+                    # Emit shard
+                    yield (start, position + index)
+                    start = position + index
+                    target = start + shard_size
+                quoted = quoted != (block.count(quote_char, index) % 2 == 1)
+                position += len(block)
+
+        # Emit last shard
+        if start is not None and start < size:
+            yield (start, size)
+        for algorithm, hasher in hashers.items():
+            setattr(self, algorithm, hasher.hexdigest())
+        self.bytes = position
+
+
+class ShardRow(dict):  # type: ignore
+    """Light-weight row used to replay merged values to checks"""
+
+    def __init__(self, cells: Dict[str, Any], *, row_number: Optional[int]):
+        super().__init__(cells)
+        self.row_number = row_number
+
+
+class ShardMerger:
+    """Merge phase of the sharded validation"""
+
+    def __init__(
+        self,
+        resource: TableResource,
+        *,
+        checks: List[Check],
+        merges: List[Dict[str, Any]],
+    ):
+        self.__resource = resource
+        self.__checks = checks
+        self.__merges = merges
+        self.__states: List[Any] = [None] * len(merges)
+        self.__pending: List[Dict[str, Any]] = []
+        self.__errors: List[Tuple[Tuple[float, int], Error]] = []
+        self.__shard_index = -1
+        self.__offsets: List[int] = []
+        self.cell_requests: Dict[int, List[int]] = {}
+
+    @property
+    def errors(self) -> List[Error]:
+        items = sorted(self.__errors, key=lambda item: item[0])
+        return [error for _, error in items]
+
+    def merge_shard(self, result: Dict[str, Any], *, offset: int):
+        self.__shard_index += 1
+        self.__offsets.append(offset)
+        dropped: List[Dict[str, Any]] = []
+
+        # Merge states
+        for index, merge in enumerate(self.__merges):
+            type = merge["type"]
+            state = result["states"][index]
+            if state is None:
+                continue
+            if type in KEY_MERGE_TYPES:
+                memory = self.__states[index] = self.__states[index] or {}
+                for key, (first, last) in state.items():
+                    match = memory.get(key)
+                    if match:
+                        self.add_pending(merge, row_number=first, match=match, cell=key)
+                    memory[key] = last + offset
+            elif type == "sequential-value":
+                memory = self.__states[index] = self.__states[index] or [None, False]
+                cursor, exited = memory
+                row_number, first_cell, last_cell = state
+                local_errors = [
+                    error
+                    for error in result["errors"]
+                    if error["type"] == type and error["fieldName"] == merge["fieldName"]
+                ]
+                if exited:
+                    dropped.extend(local_errors)
+                elif cursor is not None and (cursor or first_cell) != first_cell:
+                    dropped.extend(local_errors)
+                    self.add_pending(merge, row_number=row_number, cell=first_cell)
+                    memory[1] = True
+                elif local_errors:
+                    memory[1] = True
+                else:
+                    memory[0] = last_cell + 1
+            elif type == "deviated-value":
+                check = self.__checks[merge["checkIndex"]]
+                for row_number, cell in state:
+                    row = ShardRow(
+                        {merge["fieldName"]: cell}, row_number=row_number + offset
+                    )
+                    list(check.validate_row(row))  # type: ignore
+            elif type == "required-value":
+                check = self.__checks[merge["checkIndex"]]
+                for cell in state:
+                    row = ShardRow({merge["fieldName"]: cell}, row_number=None)
+                    list(check.validate_row(row))  # type: ignore
+
+        # Merge errors
+        # Row errors are ordered as baseline errors, merged integrity errors,
+        # check errors and merged check errors as it happens sequentially
+        baseline_types = [
+            Error.type for Error in platform.frictionless_checks.baseline.Errors
+        ]
+        for descriptor, match in zip(result["errors"], result["matches"]):
+            if any(descriptor is error for error in dropped):
+                continue
+            Error = system.select_error_class(descriptor["type"])
+            row_number = descriptor.get("rowNumber")
+            if row_number:
+                descriptor["rowNumber"] = row_number + offset
+                if match:
+                    descriptor["note"] = Error.match_note % (match + offset)  # type: ignore
+                phase = 0 if descriptor["type"] in baseline_types else 2
+                order = (descriptor["rowNumber"], phase)
+            else:
+                order = (offset + result["records"] + 0.5, 0)
+            self.__errors.append((order, Error.from_descriptor(descriptor)))
+
+    def add_pending(
+        self,
+        merge: Dict[str, Any],
+        *,
+        row_number: int,
+        cell: Any,
+        match: Optional[int] = None,
+    ):
+        pending = dict(merge, rowNumber=row_number, cell=cell, match=match)
+        pending["shardIndex"] = self.__shard_index
+        self.__pending.append(pending)
+        self.cell_requests.setdefault(self.__shard_index, []).append(row_number)
+
+    def merge_cells(self, shard_index: int, cells: Dict[int, List[Any]]):
+        offset = self.__offsets[shard_index]
+        field_names = self.__resource.schema.field_names
+        to_str = lambda v: str(v) if v is not None else ""  # type: ignore
+        for pending in self.__pending:
+            if pending["shardIndex"] != shard_index:
+                continue
+            type = pending["type"]
+            row_cells = list(map(to_str, cells.get(pending["rowNumber"], [])))
+            row_number = pending["rowNumber"] + offset
+            note = "the value is not sequential"
+            if type in KEY_MERGE_TYPES:
+                note = KEY_MERGE_ERRORS[type].match_note % pending["match"]
+            if type == "unique":
+                error = errors.UniqueError(
+                    note=note,
+                    cells=row_cells,
+                    row_number=row_number,
+                    cell=str(pending["cell"]),
+                    field_name=pending["fieldName"],
+                    field_number=field_names.index(pending["fieldName"]) + 1,
+                )
+            elif type == "primary-key":
+                error = errors.PrimaryKeyError(
+                    note=note, cells=row_cells, row_number=row_number
+                )
+            elif type == "duplicate-row":
+                error = errors.DuplicateRowError(
+                    note=note, cells=row_cells, row_number=row_number
+                )
+            else:
+                error = errors.SequentialValueError(
+                    note=note,
+                    cells=row_cells,
+                    row_number=row_number,
+                    cell=str(pending["cell"]),
+                    field_name=pending["fieldName"],
+                    field_number=field_names.index(pending["fieldName"]) + 1,
+                )
+            phase = 1 if type in INTEGRITY_MERGE_TYPES else 3
+            self.__errors.append(((row_number, phase), error))
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import asyncio
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from multiprocessing import Pool
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
@@ -8,6 +12,9 @@ from ..checklist import Checklist
 from ..exception import FrictionlessException
 from ..platform import platform
 from ..report import Report
+from ..system import system
+from ..table.keys import KeyIndex
+from .sharding import is_shardable, validate_shards
 
 if TYPE_CHECKING:
     from .. import types
@@ -45,14 +52,18 @@ class Validator:
             return Report.from_validation(time=timer.time, errors=exception.to_errors())
 
         # Validate sequential
+        # Referenced keys are indexed once and shared between resources
         if not parallel or with_fks:
-            for resource in resources:
-                report = resource.validate(
-                    checklist=checklist,
-                    limit_errors=limit_errors,
-                    limit_rows=limit_rows,
-                )
-                reports.append(report)
+            limit = system.limit_memory * 1024 * 1024
+            key_index = system.key_index or KeyIndex(limit=limit)
+            with system.use_context(key_index=key_index):
+                for resource in resources:
+                    report = resource.validate(
+                        checklist=checklist,
+                        limit_errors=limit_errors,
+                        limit_rows=limit_rows,
+                    )
+                    reports.append(report)
 
         # Validate parallel
         else:
@@ -77,6 +88,60 @@ class Validator:
             reports=reports,
         )
 
+    async def avalidate_package(
+        self,
+        package: Package,
+        *,
+        checklist: Optional[Checklist] = None,
+        name: Optional[str] = None,
+        concurrency: int = settings.DEFAULT_CONCURRENCY,
+        limit_rows: Optional[int] = None,
+        limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
+    ):
+        # Create state
+        timer = helpers.Timer()
+        resources = package.resources if name is None else [package.get_resource(name)]
+
+        # Prepare checklist
+        checklist = checklist or Checklist()
+
+        # Validate metadata
+        try:
+            package.to_descriptor(validate=True)
+        except FrictionlessException as exception:
+            return Report.from_validation(time=timer.time, errors=exception.to_errors())
+
+        # Validate concurrent
+        # Resources are validated in threads reusing pooled connections while
+        # remote data is read ahead of parsing (see system.http_prefetch)
+        loop = asyncio.get_running_loop()
+        limit = system.limit_memory * 1024 * 1024
+        context = system.copy_context()
+        context["key_index"] = system.key_index or KeyIndex(limit=limit)
+        context["http_prefetch"] = system.http_prefetch or settings.DEFAULT_HTTP_PREFETCH
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [
+                loop.run_in_executor(
+                    executor,
+                    partial(
+                        validate_concurrent,
+                        resource,
+                        context=context,
+                        checklist=copy_checklist(checklist),
+                        limit_errors=limit_errors,
+                        limit_rows=limit_rows,
+                    ),
+                )
+                for resource in resources
+            ]
+            reports: List[Report] = list(await asyncio.gather(*futures))
+
+        # Return report
+        return Report.from_validation_reports(
+            time=timer.time,
+            reports=reports,
+        )
+
     # Resource
 
     def validate_resource(
@@ -87,6 +152,8 @@ class Validator:
         limit_errors: int = settings.DEFAULT_LIMIT_ERRORS,
         limit_rows: Optional[int] = None,
         on_row: Optional[types.ICallbackFunction] = None,
+        batch_size: Optional[int] = None,
+        workers: Optional[int] = None,
     ):
         # Create state
         partial = False
@@ -140,6 +207,96 @@ class Validator:
                 if resource.hash is not None or resource.bytes is not None:
                     helpers.pass_through(resource.byte_stream)
 
+            # Validate table (shards)
+            # Cross-row checks are completed by the merge phase
+            elif (
+                workers
+                and workers > 1
+                and not on_row
+                and not limit_rows
+                and is_shardable(resource, checks=checks)
+            ):
+                labels = resource.labels
+                errors.extend(
+                    validate_shards(
+                        resource,
+                        checks=checks,
+                        checklist=checklist,
+                        workers=workers,
+                        limit_errors=limit_errors,
+                        batch_size=batch_size,
+                    )
+                )
+
+                # Limit errors
+                if limit_errors:
+                    if len(errors) >= limit_errors:
+                        errors = errors[:limit_errors]
+                        warning = f"reached error limit: {limit_errors}"
+                        warnings.append(warning)
+                        partial = True
+
+            # Validate table (batch)
+            elif batch_size:
+                row_count = 0
+                labels = resource.labels
+                # Valid rows are not created at all if no check needs them
+                baseline = platform.frictionless_checks.baseline
+                only_errors = not on_row and all(
+                    isinstance(check, baseline) for check in checks
+                )
+                batch_stream = resource.batch_stream(size=batch_size)
+                while not partial:
+                    # Emit batch
+                    try:
+                        batch = next(batch_stream)
+                    except FrictionlessException as exception:
+                        errors.append(exception.error)
+                        continue
+                    except StopIteration:
+                        break
+
+                    # Limit rows
+                    limit_reached = False
+                    last_row_number = batch.row_numbers[-1]
+                    if limit_rows:
+                        if row_count + len(batch) >= limit_rows:
+                            index = limit_rows - row_count - 1
+                            last_row_number = batch.row_numbers[index]
+                            limit_reached = True
+                    row_count += len(batch)
+
+                    # Validate rows
+                    rows = batch.error_rows if only_errors else batch.rows
+                    for row in rows:
+                        if row.row_number > last_row_number:
+                            break
+
+                        # Validate row
+                        for check in checks:
+                            for error in check.validate_row(row):
+                                if checklist.match(error):
+                                    errors.append(error)
+
+                        # Callback row
+                        if on_row:
+                            on_row(row)
+
+                        # Limit errors
+                        if limit_errors:
+                            if len(errors) >= limit_errors:
+                                errors = errors[:limit_errors]
+                                warning = f"reached error limit: {limit_errors}"
+                                warnings.append(warning)
+                                partial = True
+                                break
+
+                    # Limit rows
+                    if limit_reached and not partial:
+                        warning = f"reached row limit: {limit_rows}"
+                        warnings.append(warning)
+                        partial = True
+
             # Validate table
             else:
                 row_count = 0
@@ -199,6 +356,22 @@ class Validator:
 # Internal
 
 
+def validate_concurrent(
+    resource: Resource, *, context: Dict[str, Any], **options: Any
+) -> Report:
+    # Contexts entered by a thread (e.g. on inferring) don't affect other threads
+    with system.use_local_context(context):
+        return resource.validate(**options)
+
+
+def copy_checklist(checklist: Checklist) -> Checklist:
+    # Checks are connected to a resource and keep state while validating it
+    # (they are not copied via descriptors to support custom checks)
+    target = copy.copy(checklist)
+    target.checks = [copy.copy(check) for check in checklist.checks]
+    return target
+
+
 def validate_parallel(options: types.IDescriptor) -> types.IDescriptor:
     resource_options = options["resource"]
     validate_options = options["validate"]